@@ -4,24 +4,34 @@ __all__ = [
     "UndefinedType",
     "Unsupported",
     "ValidationError",
+    "aiter_serialize",
     "alias",
     "dependent_required",
     "deserialization_method",
     "deserialize",
+    "deserialize_columns",
+    "deserialize_json",
+    "deserialize_many",
     "deserializer",
     "discriminator",
     "identity",
+    "iter_deserialize",
+    "iter_serialize",
     "order",
+    "precompute_and_freeze",
     "properties",
     "schema",
     "serialization_default",
     "serialization_method",
     "serialize",
+    "serialize_json",
     "serialized",
     "serializer",
     "settings",
     "type_name",
+    "validation_method",
     "validator",
+    "warmup",
 ]
 
 import warnings
@@ -34,13 +44,21 @@ from . import (  # noqa: F401
     json_schema,
     metadata,
     objects,
+    persistence,
     tagged_unions,
     validation,
 )
 from .aliases import alias
 from .conversions import deserializer, serializer
 from .dependencies import dependent_required
-from .deserialization import deserialization_method, deserialize
+from .deserialization import (
+    deserialization_method,
+    deserialize,
+    deserialize_columns,
+    deserialize_many,
+    validation_method,
+)
+from .deserialization.streaming import deserialize_json, iter_deserialize
 from .discriminators import discriminator
 from .metadata import properties
 from .ordering import order
@@ -52,12 +70,14 @@ from .serialization import (
     serialize,
 )
 from .serialization.serialized_methods import serialized
+from .serialization.streaming import aiter_serialize, iter_serialize, serialize_json
 from .settings import settings
 from .type_names import type_name
 from .types import Undefined, UndefinedType
 from .utils import identity
 from .validation import ValidationError, validator
 from .visitor import Unsupported
+from .warmup import precompute_and_freeze, warmup
 
 try:
     import graphql as _gql
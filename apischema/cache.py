@@ -1,32 +1,385 @@
-__all__ = ["cache", "reset", "set_size"]
-import sys
-from functools import lru_cache
-from typing import Callable, Iterator, MutableMapping, TypeVar, cast
+__all__ = ["CacheStats", "cache", "invalidate", "reset", "set_size", "stats"]
+import threading
+import time
+from dataclasses import dataclass
+from functools import update_wrapper
+from itertools import count
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    cast,
+)
+from weakref import WeakSet
 
 from apischema.utils import type_dict_wrapper
 
-_cached: list = []
+_size: Optional[int] = 128
+_cached: "WeakSet[Cache]" = WeakSet()
 
 Func = TypeVar("Func", bound=Callable)
 
 
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    currsize: int
+    maxsize: Optional[int]
+    # time (in seconds) spent computing each cached entry
+    build_times: Dict[Hashable, float]
+
+
+KWARGS_MARK = object()
+
+
+class AllKeys:
+    """Dependency on all the keys of a registry, i.e. on its iteration"""
+
+
+class BuildState(threading.local):
+    def __init__(self):
+        # dependencies of the cached entries being built, innermost last
+        self.dependencies: List[Set[Hashable]] = []
+
+
+_state = BuildState()
+
+
+class Flight:
+    """Build of a cache entry in progress, awaited by the other threads requesting
+    the same entry"""
+
+    def __init__(self):
+        self.owner = threading.get_ident()
+        self.done = threading.Event()
+        self.entry: Optional["Entry"] = None
+
+
+_flights_lock = threading.Lock()
+# flight awaited by each waiting thread, in order to detect wait cycles
+_awaited: Dict[int, Flight] = {}
+
+
+def _wait_cycle(flight: Flight) -> bool:
+    """Whether waiting for the flight would (transitively) wait for the current
+    thread, e.g. reentrant build or mutually recursive types built concurrently"""
+    current, owner = threading.get_ident(), flight.owner
+    owners = set()
+    while owner not in owners:
+        if owner == current:
+            return True
+        owners.add(owner)
+        if owner not in _awaited:
+            return False
+        owner = _awaited[owner].owner
+    return False
+
+
+def add_dependencies(*keys: Hashable):
+    """Record that the cached entry being built (if any) depends on keys, e.g. types
+    visited or looked up in a registry"""
+    stack = _state.dependencies
+    if stack:
+        for key in keys:
+            try:
+                stack[-1].add(key)
+            except TypeError:  # unhashable key cannot be registered anyway
+                pass
+
+
+# number of entries being built by all the threads; hits only propagate their
+# dependencies to the entry being built by the current thread, so they can skip it
+# while there is none
+_building = 0
+
+
+class Entry:
+    __slots__ = ("result", "used", "build_time", "dependencies")
+
+    def __init__(self, result: Any, build_time: float, dependencies: FrozenSet):
+        self.result = result
+        # tick of the cache clock at the last use, for LRU eviction
+        self.used = 0
+        self.build_time = build_time
+        self.dependencies = dependencies
+
+
+class Cache:
+    """Least-recently-used cache (unbounded if maxsize is None) of a function
+    results, keeping statistics of its usage.
+
+    Hits of the function returned by wrapper() don't take any lock: they look up a
+    plain dict and stamp the entry with the next tick of the cache clock, which
+    both counts the hit and orders the entries for eviction. Only calls with keyword
+    arguments, misses, and calls made while an entry is being built, which must
+    propagate the dependencies of the cached entry, take the slower path of
+    Cache.__call__.
+
+    Building is single-flight: threads requesting an entry being built by another
+    thread wait for its result instead of building it again."""
+
+    def __init__(self, func: Callable, maxsize: Optional[int], volatile: bool = False):
+        update_wrapper(self, func)
+        self.maxsize = maxsize
+        self.volatile = volatile
+        self.misses = 0
+        self.evictions = 0
+        # ticked atomically by each hit, and with the lock held for the other uses
+        # counted by _ticks, see _hits_count
+        self._clock = count(1)
+        self._ticks = 0
+        # only modified with the lock held, and never rebound because wrapper() keeps
+        # a reference to it
+        self._entries: Dict[Hashable, Entry] = {}
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, Flight] = {}
+        # incremented when entries are removed, for builds started before not to be
+        # cached with outdated results
+        self._generation = 0
+
+    def wrapper(self) -> Callable:
+        """Function calling the cache, with the fast path of hits inlined"""
+        entries, tick, call = self._entries, self._clock.__next__, self.__call__
+
+        def wrapper(*args, **kwargs):
+            if kwargs or _building:
+                return call(*args, **kwargs)
+            entry = entries.get(args)
+            if entry is None:
+                return call(*args)
+            entry.used = tick()
+            return entry.result
+
+        update_wrapper(wrapper, self.__wrapped__)  # type: ignore
+        for name in CACHE_METHODS:
+            setattr(wrapper, name, getattr(self, name))
+        return wrapper
+
+    def __call__(self, *args, **kwargs):
+        key = (*args, KWARGS_MARK, *kwargs.items()) if kwargs else args
+        entry = self._entries.get(key)
+        if entry is None:
+            return self._miss(key, args, kwargs)
+        self._hit(entry)
+        return entry.result
+
+    def _hit(self, entry: Entry):
+        entry.used = next(self._clock)
+        if entry.dependencies and _state.dependencies:
+            _state.dependencies[-1].update(entry.dependencies)
+
+    def _tick(self) -> int:
+        # with the lock held
+        self._ticks += 1
+        return next(self._clock)
+
+    def _hits_count(self) -> int:
+        # ticks which are not hits are counted, including this one
+        return self._tick() - self._ticks
+
+    def _miss(self, key: Hashable, args: tuple, kwargs: dict) -> Any:
+        while True:
+            with _flights_lock:
+                # the entry may have been built in the meantime
+                entry = self._entries.get(key)
+                flight = self._flights.get(key) if entry is None else None
+                if entry is None and flight is None:
+                    flight = self._flights[key] = Flight()
+                    break
+                elif flight is not None and _wait_cycle(flight):
+                    # build it concurrently instead of deadlocking
+                    flight = None
+                    break
+                elif flight is not None:
+                    _awaited[threading.get_ident()] = flight
+            if flight is not None:
+                flight.done.wait()
+                with _flights_lock:
+                    del _awaited[threading.get_ident()]
+                # entry is None if the build has failed, so it's retried
+                entry = flight.entry
+            if entry is not None:
+                self._hit(entry)
+                return entry.result
+        try:
+            return self._build(key, args, kwargs, flight)
+        finally:
+            if flight is not None:
+                with _flights_lock:
+                    del self._flights[key]
+                flight.done.set()
+
+    def _build(
+        self, key: Hashable, args: tuple, kwargs: dict, flight: Optional[Flight]
+    ) -> Any:
+        global _building
+        with self._lock:
+            self.misses += 1
+            generation = self._generation
+        stack = _state.dependencies
+        stack.append(set())
+        with _flights_lock:
+            _building += 1
+        start = time.perf_counter()
+        try:
+            result = self.__wrapped__(*args, **kwargs)  # type: ignore
+        finally:
+            build_time = time.perf_counter() - start
+            with _flights_lock:
+                _building -= 1
+            dependencies = frozenset(stack.pop())
+        if stack:
+            stack[-1].update(dependencies)
+        entry = Entry(result, build_time, dependencies)
+        with self._lock:
+            if generation == self._generation:
+                self._add(key, entry)
+        if flight is not None:
+            flight.entry = entry
+        return result
+
+    def _add(self, key: Hashable, entry: Entry):
+        entry.used = self._tick()
+        self._entries[key] = entry
+        self._evict()
+
+    def _evict(self):
+        if self.maxsize is not None and len(self._entries) > self.maxsize:
+            lru = sorted(self._entries, key=lambda key: self._entries[key].used)
+            for key in lru[: len(self._entries) - self.maxsize]:
+                del self._entries[key]
+                self.evictions += 1
+
+    def set_size(self, size: Optional[int]):
+        with self._lock:
+            self.maxsize = size
+            self._evict()
+
+    def cache_clear(self):
+        """Clear the cached entries; statistics are kept"""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def entries(self) -> List[Tuple[Hashable, Any, FrozenSet]]:
+        """Snapshot of the cached entries with their dependencies, least recently
+        used first"""
+        with self._lock:
+            entries = sorted(self._entries.items(), key=lambda item: item[1].used)
+            return [(key, entry.result, entry.dependencies) for key, entry in entries]
+
+    def preload(self, key: Hashable, result: Any, dependencies: FrozenSet):
+        """Add an entry computed elsewhere, e.g. loaded from disk"""
+        with self._lock:
+            if key not in self._entries:
+                self._add(key, Entry(result, 0.0, dependencies))
+
+    def invalidate(self, keys: AbstractSet[Hashable]):
+        """Remove the entries depending on one of the keys; volatile caches, whose
+        results cannot be tracked, are entirely cleared"""
+        with self._lock:
+            self._generation += 1
+            if self.volatile:
+                self._entries.clear()
+                return
+            for key in [
+                key
+                for key, entry in self._entries.items()
+                if not entry.dependencies.isdisjoint(keys)
+            ]:
+                del self._entries[key]
+
+    def cache_info(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                self._hits_count(),
+                self.misses,
+                self.evictions,
+                len(self._entries),
+                self.maxsize,
+                {key: entry.build_time for key, entry in self._entries.items()},
+            )
+
+
+# methods of Cache made available as attributes of its wrapper
+CACHE_METHODS = (
+    "cache_clear",
+    "cache_info",
+    "entries",
+    "invalidate",
+    "preload",
+    "set_size",
+)
+
+
 def cache(func: Func) -> Func:
-    cached = cast(Func, lru_cache()(func))
-    _cached.append(cached)
-    return cached
+    cached = Cache(func, _size)
+    _cached.add(cached)
+    return cast(Func, cached.wrapper())
+
+
+def volatile_cache(func: Func) -> Func:
+    """Cache cleared at every invalidation, for results whose dependencies cannot be
+    tracked, e.g. mutable values filled afterwards"""
+    cached = Cache(func, _size, volatile=True)
+    _cached.add(cached)
+    return cast(Func, cached.wrapper())
 
 
 def reset():
-    for cached in _cached:
+    for cached in list(_cached):
         cached.cache_clear()
 
 
-def set_size(size: int):
-    for cached in _cached:
-        wrapped = cached.__wrapped__
-        setattr(
-            sys.modules[wrapped.__module__], wrapped.__name__, lru_cache(size)(wrapped)
-        )
+def invalidate(*keys: Hashable):
+    """Remove the cached entries whose computation depends on one of the keys"""
+    keys_set = frozenset(keys)
+    for cached in list(_cached):
+        cached.invalidate(keys_set)
+
+
+def set_size(size: Optional[int]):
+    global _size
+    _size = size
+    for cached in list(_cached):
+        cached.set_size(size)
+
+
+def stats() -> Dict[str, CacheStats]:
+    """Snapshot of the statistics of every cached function, indexed by its
+    qualified name; statistics of a function cached several times (e.g. an inner
+    function) are summed."""
+    result: Dict[str, CacheStats] = {}
+    for cached in list(_cached):
+        info = cached.cache_info()
+        name = f"{cached.__module__}.{cached.__qualname__}"  # type: ignore
+        if name in result:
+            prev = result[name]
+            build_times = dict(prev.build_times)
+            for key, build_time in info.build_times.items():
+                build_times[key] = build_times.get(key, 0.0) + build_time
+            info = CacheStats(
+                prev.hits + info.hits,
+                prev.misses + info.misses,
+                prev.evictions + info.evictions,
+                prev.currsize + info.currsize,
+                info.maxsize,
+                build_times,
+            )
+        result[name] = info
+    return result
 
 
 K = TypeVar("K")
@@ -34,21 +387,29 @@ V = TypeVar("V")
 
 
 class CacheAwareDict(MutableMapping[K, V]):
+    """Registry whose modifications invalidate the cached entries which have looked
+    up the modified key (or iterated over the registry)"""
+
     def __init__(self, wrapped: MutableMapping[K, V]):
         self.wrapped = type_dict_wrapper(wrapped)
+        self._all_keys = AllKeys()
 
     def __getitem__(self, key: K) -> V:
+        add_dependencies(key)
         return self.wrapped[key]
 
     def __setitem__(self, key: K, value: V):
         self.wrapped[key] = value
-        reset()
+        invalidate(key, self._all_keys)
 
     def __delitem__(self, key: K):
         del self.wrapped[key]
+        invalidate(key, self._all_keys)
 
     def __len__(self) -> int:
+        add_dependencies(self._all_keys)
         return len(self.wrapped)
 
     def __iter__(self) -> Iterator[K]:
+        add_dependencies(self._all_keys)
         return iter(self.wrapped)
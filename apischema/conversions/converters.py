@@ -83,7 +83,8 @@ def check_converter_type(tp: AnyType) -> AnyType:
 def _add_deserializer(conversion: ConvOrFunc, target: AnyType):
     target = check_converter_type(target)
     if conversion not in _deserializers[target]:
-        _deserializers[target].append(conversion)
+        # assignment (instead of append) invalidates the cached methods
+        _deserializers[target] = [*_deserializers[target], conversion]
 
 
 class DeserializerDescriptor(MethodWrapper[staticmethod]):
@@ -2,16 +2,22 @@ import collections.abc
 import dataclasses
 import inspect
 import re
+import sys
 from collections import defaultdict
 from contextlib import contextmanager
 from enum import Enum
 from functools import lru_cache, partial
+from itertools import combinations
 from typing import (
     TYPE_CHECKING,
+    AbstractSet,
     Any,
     Callable,
     Collection,
     Dict,
+    Hashable,
+    Iterable,
+    List,
     Mapping,
     Optional,
     Pattern,
@@ -35,13 +41,19 @@ from apischema.conversions.visitor import (
     sub_conversion,
 )
 from apischema.dependencies import get_dependent_required
+from apischema.deserialization.codegen import generated_method
 from apischema.deserialization.coercion import Coerce, Coercer
 from apischema.deserialization.flattened import get_deserialization_flattened_aliases
+from apischema.deserialization.lazy import lazy_deserialize
 from apischema.deserialization.methods import (
+    AdaptiveAlternative,
+    AdaptiveUnionMethod,
     AdditionalField,
     AnyMethod,
     BoolMethod,
     CoercerMethod,
+    Column,
+    ColumnsMethod,
     ConstrainedFloatMethod,
     ConstrainedIntMethod,
     ConstrainedStrMethod,
@@ -60,17 +72,23 @@ from apischema.deserialization.methods import (
     FlattenedField,
     FloatMethod,
     FrozenSetMethod,
+    GeneratedMethod,
+    InferredDiscriminatorMethod,
     IntMethod,
+    KeySetNode,
+    KeySetUnionMethod,
     ListCheckOnlyMethod,
     ListMethod,
     LiteralMethod,
     MappingCheckOnly,
     MappingMethod,
+    MockConstructor,
     NoConstructor,
     NoneMethod,
     ObjectMethod,
     OptionalMethod,
     PatternField,
+    PrimitiveListMethod,
     RawConstructor,
     RecMethod,
     SetMethod,
@@ -83,8 +101,13 @@ from apischema.deserialization.methods import (
     UnionMethod,
     ValidatorMethod,
     VariadicTupleMethod,
+    batch_deserialize,
+)
+from apischema.discriminators import (
+    Discriminator,
+    get_inherited_discriminator,
+    record_inferred_discriminator,
 )
-from apischema.discriminators import Discriminator, get_inherited_discriminator
 from apischema.json_schema.patterns import infer_pattern
 from apischema.metadata.implem import ValidatorsMetadata
 from apischema.metadata.keys import (
@@ -92,24 +115,27 @@ from apischema.metadata.keys import (
     SCHEMA_METADATA,
     VALIDATORS_METADATA,
 )
-from apischema.objects import ObjectField
+from apischema.objects import ObjectField, object_fields
 from apischema.objects.fields import FieldKind
 from apischema.objects.visitor import DeserializationObjectVisitor
-from apischema.recursion import RecursiveConversionsVisitor
+from apischema.recursion import RecursiveConversionsVisitor, add_rec_method
 from apischema.schemas import Schema, get_schema
 from apischema.types import PRIMITIVE_TYPES, AnyType, NoneType
 from apischema.typing import get_args, get_origin, is_type, is_typed_dict, is_union
 from apischema.utils import (
+    ADAPTIVE_UNION_PERIOD,
     CollectionOrPredicate,
     Lazy,
     as_predicate,
     get_origin_or_type,
+    intern,
     literal_values,
     opt_or,
+    subclasses,
     to_pascal_case,
     to_snake_case,
 )
-from apischema.validation import get_validators
+from apischema.validation import ValidationError, get_validators
 from apischema.validation.validators import Validator
 
 if TYPE_CHECKING:
@@ -133,11 +159,22 @@ CHECK_ONLY_METHODS = (
     ListCheckOnlyMethod,
     MappingCheckOnly,
 )
+# Types accepted by primitive methods, used to check a whole list at once
+PRIMITIVE_METHODS_TYPES: Dict[type, Set[type]] = {
+    BoolMethod: {bool},
+    IntMethod: {int, bool},
+    ConstrainedIntMethod: {int, bool},
+    FloatMethod: {float, int, bool},
+    ConstrainedFloatMethod: {float, int, bool},
+    StrMethod: {str},
+    ConstrainedStrMethod: {str},
+}
 
 
 def check_only(method: DeserializationMethod) -> bool:
     return (
         isinstance(method, CHECK_ONLY_METHODS)
+        or (isinstance(method, PrimitiveListMethod) and method.check_only)
         or (
             isinstance(method, OptionalMethod)
             and method.coercer is None
@@ -154,6 +191,204 @@ def check_only(method: DeserializationMethod) -> bool:
     )
 
 
+def has_default_init(cls: type) -> bool:
+    """Dataclass whose instances are completely initialized by its generated
+    __init__, i.e. which can be instantiated without calling it"""
+    return (
+        dataclasses.is_dataclass(cls)
+        and not hasattr(cls, "__post_init__")
+        and all(f.init for f in dataclasses.fields(cls))
+        and cls.__new__ is object.__new__
+        and (
+            list(inspect.signature(cls.__init__, follow_wrapped=False).parameters)  # type: ignore
+            == ["__dataclass_self__" if "self" in dataclasses.fields(cls) else "self"]
+            + [f.name for f in dataclasses.fields(cls)]
+        )
+    )
+
+
+def mockable(cls: type) -> bool:
+    """Objects which can be validated without being instantiated, using ValidatorMock
+    for their validators"""
+    if not has_default_init(cls):
+        return False
+    names = {f.name for f in dataclasses.fields(cls)}
+    return all(
+        dep in names or hasattr(cls, dep)
+        for validator in get_validators(cls)
+        for dep in validator.dependencies
+    )
+
+
+def literal_fields(method: DeserializationMethod) -> Dict[str, LiteralMethod]:
+    """Required literal fields of an object method, by alias; coerced data could
+    match another alternative literal, so there is none when coercion is used"""
+    if isinstance(method, CoercerMethod):
+        return {}
+    if isinstance(method, GeneratedMethod):
+        method = method.method
+    if not isinstance(method, (ObjectMethod, SimpleObjectMethod)):
+        return {}
+    return {
+        f.alias: f.method
+        for f in method.fields
+        if f.required
+        and isinstance(f.method, LiteralMethod)
+        and f.method.coercer is None
+    }
+
+
+def infer_discriminator(
+    alt_methods: Sequence[DeserializationMethod],
+) -> Optional[Tuple[str, Dict[Any, DeserializationMethod]]]:
+    """Find a literal field shared by all the alternatives of a union, and map its
+    values to the alternatives which can match them"""
+    alt_fields = list(map(literal_fields, alt_methods))
+    for alias in alt_fields[0]:
+        if not all(alias in fields for fields in alt_fields):
+            continue
+        candidates: Dict[Any, List[DeserializationMethod]] = defaultdict(list)
+        for alt_method, fields in zip(alt_methods, alt_fields):
+            for value in fields[alias].value_map:
+                candidates[value].append(alt_method)
+        if all(len(methods) == len(alt_methods) for methods in candidates.values()):
+            continue
+        return alias, {
+            value: methods[0] if len(methods) == 1 else UnionMethod(tuple(methods))
+            for value, methods in candidates.items()
+        }
+    return None
+
+
+@dataclasses.dataclass(frozen=True)
+class KeySet:
+    required: AbstractSet[str]
+    # None if other keys are accepted
+    aliases: Optional[AbstractSet[str]]
+
+
+def object_key_set(method: DeserializationMethod) -> Optional[KeySet]:
+    """Keys required/accepted by an object method"""
+    coerced = isinstance(method, CoercerMethod)
+    if isinstance(method, CoercerMethod):
+        method = method.method
+    if isinstance(method, GeneratedMethod):
+        method = method.method
+    if not isinstance(method, (ObjectMethod, SimpleObjectMethod)):
+        return None
+    if coerced:
+        # the coercer can rewrite the data keys, so they cannot eliminate it
+        return KeySet(set(), None)
+    required = {f.alias for f in method.fields if f.required}
+    aliases: Optional[AbstractSet[str]] = method.all_aliases
+    if isinstance(method, SimpleObjectMethod):
+        if method.typed_dict:
+            aliases = None
+    elif method.aggregate_fields or method.additional_properties:
+        aliases = None
+    elif method.discriminator is not None:
+        aliases = {*method.all_aliases, method.discriminator}
+    return KeySet(required, aliases)
+
+
+# maximal number of nodes of a key set tree, by alternative
+KEY_SET_TREE_NODES = 4
+
+
+def key_set_tree(
+    alt_methods: Sequence[DeserializationMethod],
+    key_sets: Sequence[KeySet],
+    aliases: AbstractSet[str],
+) -> Optional[KeySetNode]:
+    """Decision tree selecting the alternatives compatible with the presence/absence
+    of aliases, testing first the aliases eliminating the most alternatives.
+
+    Both branches of a test must eliminate alternatives; because overlapping
+    optional fields could still make the tree grow exponentially, None is returned
+    when it exceeds KEY_SET_TREE_NODES nodes by alternative."""
+    max_nodes, nodes = KEY_SET_TREE_NODES * len(alt_methods), 0
+
+    def tree(indices: Sequence[int], aliases: AbstractSet[str]) -> Optional[KeySetNode]:
+        nonlocal nodes
+        nodes += 1
+        if nodes > max_nodes:
+            return None
+        splits = []
+        if len(indices) > 1:
+            for alias in sorted(aliases):
+                present = [
+                    i
+                    for i in indices
+                    if key_sets[i].aliases is None or alias in key_sets[i].aliases  # type: ignore
+                ]
+                absent = [i for i in indices if alias not in key_sets[i].required]
+                if len(present) < len(indices) and len(absent) < len(indices):
+                    splits.append(
+                        (max(len(present), len(absent)), alias, present, absent)
+                    )
+        if not splits:
+            return KeySetNode(None, None, None, tuple(alt_methods[i] for i in indices))
+        _, alias, present, absent = min(splits, key=lambda split: split[:2])
+        others = aliases - {alias}
+        present_node = tree(present, others)
+        absent_node = tree(absent, others) if present_node is not None else None
+        if absent_node is None:
+            return None
+        return KeySetNode(alias, present_node, absent_node, ())
+
+    return tree(range(len(alt_methods)), aliases)
+
+
+def json_types(method: DeserializationMethod) -> Optional[AbstractSet[type]]:
+    """Types of the data which can be deserialized by the method, None if unknown"""
+    while isinstance(method, (GeneratedMethod, ValidatorMethod)):
+        method = method.method
+    if type(method) in PRIMITIVE_METHODS_TYPES:
+        return PRIMITIVE_METHODS_TYPES[type(method)]
+    elif isinstance(method, NoneMethod):
+        return {NoneType}
+    elif isinstance(
+        method,
+        (
+            FrozenSetMethod,
+            ListCheckOnlyMethod,
+            ListMethod,
+            PrimitiveListMethod,
+            SetMethod,
+            TupleMethod,
+            VariadicTupleMethod,
+        ),
+    ):
+        return {list}
+    elif isinstance(
+        method, (MappingCheckOnly, MappingMethod, ObjectMethod, SimpleObjectMethod)
+    ):
+        return {dict}
+    else:
+        return None
+
+
+def disjoint(method1: DeserializationMethod, method2: DeserializationMethod) -> bool:
+    """Whether no data can be deserialized by both methods"""
+    types1, types2 = json_types(method1), json_types(method2)
+    if types1 is None or types2 is None:
+        return False
+    if types1.isdisjoint(types2):
+        return True
+    key_set1, key_set2 = object_key_set(method1), object_key_set(method2)
+    return (
+        key_set1 is not None
+        and key_set2 is not None
+        and (
+            (key_set2.aliases is not None and not key_set1.required <= key_set2.aliases)
+            or (
+                key_set1.aliases is not None
+                and not key_set2.required <= key_set1.aliases
+            )
+        )
+    )
+
+
 @dataclasses.dataclass(frozen=True)
 class DeserializationMethodFactory:
     factory: Factory
@@ -186,7 +421,7 @@ def get_constraints(schema: Optional[Schema]) -> Optional[Constraints]:
     return schema.constraints if schema is not None else None
 
 
-constraint_classes = {cls.__name__: cls for cls in Constraint.__subclasses__()}
+constraint_classes = {cls.__name__: cls for cls in subclasses(Constraint)}
 
 
 def preformat_error(
@@ -237,6 +472,7 @@ class DeserializationMethodVisitor(
         fall_back_on_default: bool,
         no_copy: bool,
         pass_through: CollectionOrPredicate[type],
+        validation: bool,
     ):
         super().__init__(default_conversion)
         self.additional_properties = additional_properties
@@ -247,6 +483,7 @@ class DeserializationMethodVisitor(
         self.no_copy = no_copy
         self.pass_through = pass_through
         self.pass_through_type = as_predicate(pass_through)
+        self.validation = validation
 
     def _recursive_result(
         self, lazy: Lazy[DeserializationMethodFactory]
@@ -254,10 +491,16 @@ class DeserializationMethodVisitor(
         def factory(
             constraints: Optional[Constraints], validators: Sequence[Validator]
         ) -> DeserializationMethod:
-            return RecMethod(lambda: lazy().merge(constraints, validators).method)
+            return add_rec_method(
+                RecMethod(lambda: lazy().merge(constraints, validators).method)
+            )
 
         return DeserializationMethodFactory(factory)
 
+    def _recursion_key(self, tp: AnyType) -> Hashable:
+        # a recursive type can be mocked or not depending on where it is visited
+        return tp, self._conversion, self.validation
+
     def visit_not_recursive(self, tp: AnyType) -> DeserializationMethodFactory:
         return deserialization_method_factory(
             tp,
@@ -270,6 +513,7 @@ class DeserializationMethodVisitor(
             self.fall_back_on_default,
             self.no_copy,
             self.pass_through,
+            self.validation,
         )
 
     @contextmanager
@@ -281,6 +525,15 @@ class DeserializationMethodVisitor(
         finally:
             self._discriminator = discriminator_save
 
+    @contextmanager
+    def _validate_only(self, validation: bool):
+        validation_save = self.validation
+        self.validation = validation
+        try:
+            yield
+        finally:
+            self.validation = validation_save
+
     def discriminate(
         self, discriminator: Discriminator, types: Sequence[AnyType]
     ) -> DeserializationMethodFactory:
@@ -354,7 +607,11 @@ class DeserializationMethodVisitor(
     def collection(
         self, cls: Type[Collection], value_type: AnyType
     ) -> DeserializationMethodFactory:
-        value_factory = self.visit(value_type)
+        # set elements are hashed, so they cannot be mocked
+        with self._validate_only(
+            self.validation and not issubclass(cls, collections.abc.Set)
+        ):
+            value_factory = self.visit(value_type)
 
         def factory(constraints: Optional[Constraints], _) -> DeserializationMethod:
             value_method = value_factory.method
@@ -367,6 +624,15 @@ class DeserializationMethodVisitor(
                 method = ListCheckOnlyMethod(list_constraints, value_method)
             else:
                 method = ListMethod(list_constraints, value_method)
+            if type(value_method) in PRIMITIVE_METHODS_TYPES:
+                method = PrimitiveListMethod(
+                    list_constraints,
+                    PRIMITIVE_METHODS_TYPES[type(value_method)],
+                    getattr(value_method, "constraints", ()),
+                    isinstance(value_method, FloatMethod),
+                    isinstance(method, ListCheckOnlyMethod),
+                    method,
+                )
 
             if issubclass(cls, tuple):
                 return VariadicTupleMethod(method)
@@ -396,7 +662,10 @@ class DeserializationMethodVisitor(
     def mapping(
         self, cls: Type[Mapping], key_type: AnyType, value_type: AnyType
     ) -> DeserializationMethodFactory:
-        key_factory, value_factory = self.visit(key_type), self.visit(value_type)
+        # keys are hashed, so they cannot be mocked
+        with self._validate_only(False):
+            key_factory = self.visit(key_type)
+        value_factory = self.visit(value_type)
 
         def factory(constraints: Optional[Constraints], _) -> DeserializationMethod:
             key_method, value_method = key_factory.method, value_factory.method
@@ -412,7 +681,11 @@ class DeserializationMethodVisitor(
         self, tp: Type, fields: Sequence[ObjectField]
     ) -> DeserializationMethodFactory:
         cls = get_origin_or_type(tp)
-        with self._discriminate(None):
+        # When only validating, objects are not instantiated, unless they are not
+        # mockable; their fields are then instantiated too, as they are passed to
+        # the constructor
+        mock = self.validation and mockable(cls)
+        with self._discriminate(None), self._validate_only(mock):
             field_factories = [
                 self.visit_with_conv(f.type, f.deserialization).merge(
                     get_constraints(f.schema), f.validators
@@ -425,7 +698,11 @@ class DeserializationMethodVisitor(
         ) -> DeserializationMethod:
             from apischema import settings
 
-            alias_by_name = {field.name: self.aliaser(field.alias) for field in fields}
+            # interned keys are shared by all the methods and compared by identity
+            # first in dict lookups (and are the keys of deserialized TypedDict)
+            alias_by_name = {
+                field.name: intern(self.aliaser(field.alias)) for field in fields
+            }
             requiring: Dict[str, Set[str]] = defaultdict(set)
             for f, reqs in get_dependent_required(cls).items():
                 for req in reqs:
@@ -471,8 +748,8 @@ class DeserializationMethodVisitor(
                 else:
                     normal_fields.append(
                         Field(
-                            field.name,
-                            self.aliaser(field.alias),
+                            sys.intern(field.name),
+                            alias_by_name[field.name],
                             field_method,
                             field.required,
                             requiring[field.name],
@@ -484,28 +761,16 @@ class DeserializationMethodVisitor(
             constructor: Constructor
             if is_typed_dict(cls):
                 constructor = NoConstructor(cls)
+            elif mock:
+                constructor = MockConstructor(cls)
             elif (
                 settings.deserialization.override_dataclass_constructors
-                and dataclasses.is_dataclass(cls)
                 and "__slots__" not in cls.__dict__
-                and not hasattr(cls, "__post_init__")
-                and all(f.init for f in dataclasses.fields(cls))
-                and cls.__new__ is object.__new__
+                and has_default_init(cls)
                 and (
                     cls.__setattr__ is object.__setattr__
                     or getattr(cls, dataclasses._PARAMS).frozen  # type: ignore
                 )
-                and (
-                    list(
-                        inspect.signature(cls.__init__, follow_wrapped=False).parameters
-                    )
-                    == [
-                        "__dataclass_self__"
-                        if "self" in dataclasses.fields(cls)
-                        else "self"
-                    ]
-                    + [f.name for f in dataclasses.fields(cls)]
-                )
             ):
                 constructor = FieldsConstructor(
                     cls,
@@ -544,7 +809,7 @@ class DeserializationMethodVisitor(
                     for f in normal_fields
                 )
             ):
-                return SimpleObjectMethod(
+                method: DeserializationMethod = SimpleObjectMethod(
                     constructor,
                     tuple(normal_fields),
                     all_alliases,
@@ -552,28 +817,32 @@ class DeserializationMethodVisitor(
                     settings.errors.missing_property,
                     settings.errors.unexpected_property,
                 )
-            return ObjectMethod(
-                constructor,
-                object_constraints,
-                tuple(normal_fields),
-                tuple(flattened_fields),
-                tuple(pattern_fields),
-                additional_field,
-                all_alliases,
-                self.additional_properties,
-                is_typed_dict(cls),
-                tuple(validators),
-                tuple(
-                    (f.name, f.default_factory)
-                    for f in fields
-                    if f.kind == FieldKind.WRITE_ONLY
-                ),
-                {field.name for field in fields if field.post_init},
-                self.aliaser,
-                settings.errors.missing_property,
-                settings.errors.unexpected_property,
-                self._discriminator,
-            )
+            else:
+                method = ObjectMethod(
+                    constructor,
+                    object_constraints,
+                    tuple(normal_fields),
+                    tuple(flattened_fields),
+                    tuple(pattern_fields),
+                    additional_field,
+                    all_alliases,
+                    self.additional_properties,
+                    is_typed_dict(cls),
+                    tuple(validators),
+                    tuple(
+                        (f.name, f.default_factory)
+                        for f in fields
+                        if f.kind == FieldKind.WRITE_ONLY
+                    ),
+                    {field.name for field in fields if field.post_init},
+                    self.aliaser,
+                    settings.errors.missing_property,
+                    settings.errors.unexpected_property,
+                    self._discriminator,
+                )
+            if settings.deserialization.codegen:
+                method = generated_method(method)
+            return method
 
         return self._factory(factory, dict, validation=False)
 
@@ -632,6 +901,8 @@ class DeserializationMethodVisitor(
             return alt_factories[0]
 
         def factory(constraints: Optional[Constraints], _) -> DeserializationMethod:
+            from apischema import settings
+
             alt_methods = tuple(
                 fact.merge(constraints).method for fact in alt_factories
             )
@@ -649,8 +920,41 @@ class DeserializationMethodVisitor(
                 return OptionalMethod(value_method, self.coercer)
             elif len(method_by_cls) == len(alt_factories):
                 return UnionByTypeMethod(method_by_cls)
-            else:
-                return UnionMethod(alt_methods)
+            inferred = (
+                infer_discriminator(alt_methods)
+                if settings.deserialization.infer_discriminator
+                else None
+            )
+            if inferred is not None:
+                alias, mapping = inferred
+                record_inferred_discriminator(types, alias)
+                return InferredDiscriminatorMethod(
+                    alias, mapping, UnionMethod(alt_methods)
+                )
+            key_sets = list(map(object_key_set, alt_methods))
+            if settings.deserialization.key_set_dispatch and all(key_sets):
+                tree = key_set_tree(
+                    alt_methods,
+                    key_sets,  # type: ignore
+                    {
+                        alias
+                        for ks in key_sets
+                        for alias in (*ks.required, *(ks.aliases or ()))  # type: ignore
+                    },
+                )
+                if tree is not None and tree.alias is not None:
+                    return KeySetUnionMethod(tree, UnionMethod(alt_methods))
+            # reordering the alternatives cannot change the result if they are disjoint
+            if settings.deserialization.adaptive_unions and all(
+                disjoint(meth1, meth2) for meth1, meth2 in combinations(alt_methods, 2)
+            ):
+                return AdaptiveUnionMethod(
+                    tuple(
+                        map(AdaptiveAlternative, range(len(alt_methods)), alt_methods)
+                    ),
+                    ADAPTIVE_UNION_PERIOD,
+                )
+            return UnionMethod(alt_methods)
 
         return self._factory(factory)
 
@@ -662,10 +966,12 @@ class DeserializationMethodVisitor(
         next_conversion: Optional[AnyConversion],
     ) -> DeserializationMethodFactory:
         assert conversion
-        conv_factories = [
-            self.visit_with_conv(conv.source, sub_conversion(conv, next_conversion))
-            for conv in conversion
-        ]
+        # converters need actual objects
+        with self._validate_only(False):
+            conv_factories = [
+                self.visit_with_conv(conv.source, sub_conversion(conv, next_conversion))
+                for conv in conversion
+            ]
 
         def factory(constraints: Optional[Constraints], _) -> DeserializationMethod:
             conv_alternatives = tuple(
@@ -736,6 +1042,7 @@ def deserialization_method_factory(
     fall_back_on_default: bool,
     no_copy: bool,
     pass_through: CollectionOrPredicate[type],
+    validation: bool,
 ) -> DeserializationMethodFactory:
     return DeserializationMethodVisitor(
         additional_properties,
@@ -746,9 +1053,117 @@ def deserialization_method_factory(
         fall_back_on_default,
         no_copy,
         pass_through,
+        validation,
     ).visit_with_conv(tp, conversion)
 
 
+def _deserialization_method_factory(
+    type: AnyType,
+    additional_properties: Optional[bool],
+    aliaser: Optional[Aliaser],
+    coerce: Optional[Coerce],
+    conversion: Optional[AnyConversion],
+    default_conversion: Optional[DefaultConversion],
+    fall_back_on_default: Optional[bool],
+    no_copy: Optional[bool],
+    pass_through: Optional[CollectionOrPredicate[type]],
+    schema: Optional[Schema],
+    validators: Collection[Callable],
+    validation: bool = False,
+) -> DeserializationMethodFactory:
+    from apischema import settings
+
+    coercer: Optional[Coercer] = None
+    if callable(coerce):
+        coercer = coerce
+    elif opt_or(coerce, settings.deserialization.coerce):
+        coercer = settings.deserialization.coercer
+    pass_through = opt_or(pass_through, settings.deserialization.pass_through)
+    if isinstance(pass_through, Collection) and not isinstance(pass_through, tuple):
+        pass_through = tuple(pass_through)
+    return deserialization_method_factory(
+        type,
+        opt_or(additional_properties, settings.additional_properties),
+        opt_or(aliaser, settings.aliaser),
+        coercer,
+        conversion,
+        opt_or(default_conversion, settings.deserialization.default_conversion),
+        None,
+        opt_or(fall_back_on_default, settings.deserialization.fall_back_on_default),
+        opt_or(no_copy, settings.deserialization.no_copy),
+        pass_through,  # type: ignore
+        validation,
+    ).merge(get_constraints(schema), tuple(map(Validator, validators)))
+
+
+@cache
+def columns_method(factory: DeserializationMethodFactory) -> Optional[ColumnsMethod]:
+    from apischema import settings
+
+    method: Union[DeserializationMethod, ObjectMethod, SimpleObjectMethod]
+    method = factory.method
+    if isinstance(method, CoercerMethod):
+        method = method.method
+    if isinstance(method, GeneratedMethod):
+        method = method.method
+    if isinstance(method, ObjectMethod):
+        if (
+            method.constraints
+            or method.aggregate_fields
+            or method.validators
+            or any(f.required_by for f in method.fields)
+        ):
+            return None
+        additional_properties = method.additional_properties
+        discriminator = method.discriminator
+    elif isinstance(method, SimpleObjectMethod):
+        additional_properties, discriminator = False, None
+    else:
+        return None
+    cls = method.constructor.cls
+    fields = object_fields(cls, deserialization=True)
+    # Columns bypass the constructor, so its side effects would be lost
+    if (
+        method.typed_dict
+        or hasattr(cls, "__post_init__")
+        or any(f.kind == FieldKind.WRITE_ONLY for f in fields.values())
+    ):
+        return None
+    defaults = {name: field.default_factory for name, field in fields.items()}
+    columns = []
+    for field in method.fields:
+        default_factory = None if field.required else defaults[field.name]
+        field_method = field.method
+        if isinstance(field_method, CoercerMethod):
+            field_method = field_method.method
+        typecode: Optional[str] = None
+        value_type: Optional[type] = None
+        if isinstance(field_method, IntMethod):
+            typecode, value_type = "q", int
+        elif isinstance(field_method, FloatMethod):
+            typecode, value_type = "d", float
+        columns.append(
+            Column(
+                field.name,
+                field.alias,
+                field.method,
+                field.required,
+                field.fall_back_on_default,
+                default_factory,
+                typecode,
+                value_type,
+            )
+        )
+    return ColumnsMethod(
+        tuple(columns),
+        method.all_aliases,
+        additional_properties,
+        discriminator,
+        settings.errors.missing_property,
+        settings.errors.unexpected_property,
+    )
+
+
 @overload
 def deserialization_method(
     type: Type[T],
@@ -799,32 +1214,60 @@ def deserialization_method(
     schema: Optional[Schema] = None,
     validators: Collection[Callable] = ()
 ) -> Callable[[Any], Any]:
-    from apischema import settings
+    return _deserialization_method_factory(
+        type,
+        additional_properties,
+        aliaser,
+        coerce,
+        conversion,
+        default_conversion,
+        fall_back_on_default,
+        no_copy,
+        pass_through,
+        schema,
+        validators,
+    ).method.deserialize
 
-    coercer: Optional[Coercer] = None
-    if callable(coerce):
-        coercer = coerce
-    elif opt_or(coerce, settings.deserialization.coerce):
-        coercer = settings.deserialization.coercer
-    pass_through = opt_or(pass_through, settings.deserialization.pass_through)
-    if isinstance(pass_through, Collection) and not isinstance(pass_through, tuple):
-        pass_through = tuple(pass_through)
-    return (
-        deserialization_method_factory(
-            type,
-            opt_or(additional_properties, settings.additional_properties),
-            opt_or(aliaser, settings.aliaser),
-            coercer,
-            conversion,
-            opt_or(default_conversion, settings.deserialization.default_conversion),
-            None,
-            opt_or(fall_back_on_default, settings.deserialization.fall_back_on_default),
-            opt_or(no_copy, settings.deserialization.no_copy),
-            pass_through,  # type: ignore
-        )
-        .merge(get_constraints(schema), tuple(map(Validator, validators)))
-        .method.deserialize
-    )
+
+def validation_method(
+    type: AnyType,
+    *,
+    additional_properties: Optional[bool] = None,
+    aliaser: Optional[Aliaser] = None,
+    coerce: Optional[Coerce] = None,
+    conversion: Optional[AnyConversion] = None,
+    default_conversion: Optional[DefaultConversion] = None,
+    fall_back_on_default: Optional[bool] = None,
+    pass_through: Optional[CollectionOrPredicate[type]] = None,
+    schema: Optional[Schema] = None,
+    validators: Collection[Callable] = ()
+) -> Callable[[Any], None]:
+    """Return a function raising ValidationError if data cannot be deserialized.
+
+    Data is checked like by deserialization (types, constraints, validators), but
+    without being copied nor instantiating objects when possible: validators are
+    run on ValidatorMock; only objects with __post_init__ (or a custom __init__),
+    or validators with other dependencies than fields, and conversions sources,
+    are actually instantiated."""
+    deserialize = _deserialization_method_factory(
+        type,
+        additional_properties,
+        aliaser,
+        coerce,
+        conversion,
+        default_conversion,
+        fall_back_on_default,
+        True,
+        pass_through,
+        schema,
+        validators,
+        validation=True,
+    ).method.deserialize
+
+    def validate(data: Any) -> None:
+        deserialize(data)
+
+    return validate
 
 
 @overload
@@ -841,7 +1284,8 @@ def deserialize(
     no_copy: Optional[bool] = None,
     pass_through: Optional[CollectionOrPredicate[type]] = None,
     schema: Optional[Schema] = None,
-    validators: Collection[Callable] = ()
+    validators: Collection[Callable] = (),
+    lazy: bool = False
 ) -> T:
     ...
 
@@ -860,7 +1304,8 @@ def deserialize(
     no_copy: Optional[bool] = None,
     pass_through: Optional[CollectionOrPredicate[type]] = None,
     schema: Optional[Schema] = None,
-    validators: Collection[Callable] = ()
+    validators: Collection[Callable] = (),
+    lazy: bool = False
 ) -> Any:
     ...
 
@@ -878,18 +1323,129 @@ def deserialize(
     no_copy: Optional[bool] = None,
     pass_through: Optional[CollectionOrPredicate[type]] = None,
     schema: Optional[Schema] = None,
-    validators: Collection[Callable] = ()
+    validators: Collection[Callable] = (),
+    lazy: bool = False
 ) -> Any:
-    return deserialization_method(
+    method = _deserialization_method_factory(
         type,
-        additional_properties=additional_properties,
-        aliaser=aliaser,
-        coerce=coerce,
-        conversion=conversion,
-        default_conversion=default_conversion,
-        fall_back_on_default=fall_back_on_default,
-        no_copy=no_copy,
-        pass_through=pass_through,
-        schema=schema,
-        validators=validators,
-    )(data)
+        additional_properties,
+        aliaser,
+        coerce,
+        conversion,
+        default_conversion,
+        fall_back_on_default,
+        no_copy,
+        pass_through,
+        schema,
+        validators,
+    ).method
+    # lazy objects deserialize their fields at first access
+    return lazy_deserialize(method, data) if lazy else method.deserialize(data)
+
+
+@overload
+def deserialize_many(
+    type: Type[T],
+    data: Iterable[Any],
+    *,
+    additional_properties: Optional[bool] = None,
+    aliaser: Optional[Aliaser] = None,
+    coerce: Optional[Coerce] = None,
+    conversion: Optional[AnyConversion] = None,
+    default_conversion: Optional[DefaultConversion] = None,
+    fall_back_on_default: Optional[bool] = None,
+    no_copy: Optional[bool] = None,
+    pass_through: Optional[CollectionOrPredicate[type]] = None,
+    schema: Optional[Schema] = None,
+    validators: Collection[Callable] = ()
+) -> Tuple[List[Optional[T]], Dict[int, ValidationError]]:
+    ...
+
+
+@overload
+def deserialize_many(
+    type: AnyType,
+    data: Iterable[Any],
+    *,
+    additional_properties: Optional[bool] = None,
+    aliaser: Optional[Aliaser] = None,
+    coerce: Optional[Coerce] = None,
+    conversion: Optional[AnyConversion] = None,
+    default_conversion: Optional[DefaultConversion] = None,
+    fall_back_on_default: Optional[bool] = None,
+    no_copy: Optional[bool] = None,
+    pass_through: Optional[CollectionOrPredicate[type]] = None,
+    schema: Optional[Schema] = None,
+    validators: Collection[Callable] = ()
+) -> Tuple[List[Any], Dict[int, ValidationError]]:
+    ...
+
+
+def deserialize_many(
+    type: AnyType,
+    data: Iterable[Any],
+    *,
+    additional_properties: Optional[bool] = None,
+    aliaser: Optional[Aliaser] = None,
+    coerce: Optional[Coerce] = None,
+    conversion: Optional[AnyConversion] = None,
+    default_conversion: Optional[DefaultConversion] = None,
+    fall_back_on_default: Optional[bool] = None,
+    no_copy: Optional[bool] = None,
+    pass_through: Optional[CollectionOrPredicate[type]] = None,
+    schema: Optional[Schema] = None,
+    validators: Collection[Callable] = ()
+) -> Tuple[List[Any], Dict[int, ValidationError]]:
+    """Deserialize each element of data, collecting errors by index instead of
+    aborting; invalid elements are replaced by None in the returned list."""
+    method = _deserialization_method_factory(
+        type,
+        additional_properties,
+        aliaser,
+        coerce,
+        conversion,
+        default_conversion,
+        fall_back_on_default,
+        no_copy,
+        pass_through,
+        schema,
+        validators,
+    ).method
+    errors: Dict[int, ValidationError] = {}
+    values = batch_deserialize(method, list(data), errors)
+    return values, errors
+
+
+def deserialize_columns(
+    type: AnyType,
+    data: Iterable[Any],
+    *,
+    additional_properties: Optional[bool] = None,
+    aliaser: Optional[Aliaser] = None,
+    coerce: Optional[Coerce] = None,
+    conversion: Optional[AnyConversion] = None,
+    default_conversion: Optional[DefaultConversion] = None,
+    fall_back_on_default: Optional[bool] = None,
+    no_copy: Optional[bool] = None,
+    pass_through: Optional[CollectionOrPredicate[type]] = None
+) -> Dict[str, Sequence[Any]]:
+    """Deserialize a list of objects into a mapping of field name to column of values;
+    integer and float fields are stored in array.array buffers."""
+    method = columns_method(
+        _deserialization_method_factory(
+            type,
+            additional_properties,
+            aliaser,
+            coerce,
+            conversion,
+            default_conversion,
+            fall_back_on_default,
+            no_copy,
+            pass_through,
+            None,
+            (),
+        )
+    )
+    if method is None:
+        raise TypeError("%s cannot be deserialized into columns" % (type,))
+    return method.deserialize(data if isinstance(data, list) else list(data))
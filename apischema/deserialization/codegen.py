@@ -0,0 +1,190 @@
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from apischema.deserialization.methods import (
+    BoolMethod,
+    DeserializationMethod,
+    Field,
+    FloatMethod,
+    GeneratedMethod,
+    IntMethod,
+    NoneMethod,
+    ObjectMethod,
+    SimpleObjectMethod,
+    StrMethod,
+    set_child_error,
+    validate_constraints,
+)
+from apischema.json_schema.types import bad_type
+from apischema.types import NoneType
+from apischema.validation.errors import ValidationError
+
+INLINED_TYPE_CHECKS = {
+    BoolMethod: bool,
+    IntMethod: int,
+    NoneMethod: NoneType,
+    StrMethod: str,
+}
+
+
+def indent(lines: List[str]) -> List[str]:
+    return ["    " + line for line in lines]
+
+
+def field_lines(
+    index: int, field: Field, namespace: Dict[str, Any], store: bool
+) -> List[str]:
+    """Lines deserializing the raw field value contained in `value` variable"""
+    target = f"values[{field.name!r}] = " if store else ""
+
+    def set_error(error: str) -> str:
+        if field.required or not field.fall_back_on_default:
+            return f"field_errors = set_child_error(field_errors, {field.alias!r}, {error})"
+        else:
+            return "pass"
+
+    method_type = type(field.method)
+    if method_type in INLINED_TYPE_CHECKS:
+        namespace[f"cls{index}"] = INLINED_TYPE_CHECKS[method_type]
+        lines = [
+            "if value is not None:"
+            if method_type is NoneMethod
+            else f"if not isinstance(value, cls{index}):",
+            "    " + set_error(f"bad_type(value, cls{index})"),
+        ]
+        if store:
+            lines += ["else:", f"    {target}value"]
+        return lines
+    elif method_type is FloatMethod:
+        return [
+            "if isinstance(value, float):",
+            f"    {target}value",
+            "elif isinstance(value, int):",
+            f"    {target}float(value)",
+            "else:",
+            "    " + set_error("bad_type(value, float)"),
+        ]
+    else:
+        namespace[f"deserialize{index}"] = field.method.deserialize
+        return [
+            "try:",
+            f"    {target}deserialize{index}(value)",
+            "except ValidationError as err:",
+            "    " + set_error("err"),
+        ]
+
+
+def object_lines(
+    method: Union[ObjectMethod, SimpleObjectMethod], namespace: Dict[str, Any]
+) -> List[str]:
+    simple = isinstance(method, SimpleObjectMethod)
+    lines = [
+        "if not isinstance(data, dict):",
+        "    raise bad_type(data, dict)",
+        "fields_count = 0",
+        "field_errors = None",
+    ]
+    if not simple:
+        lines.append("values = {}")
+    if isinstance(method, ObjectMethod) and method.constraints:
+        namespace["constraints"] = method.constraints
+        lines += [
+            "errors = None",
+            "try:",
+            "    validate_constraints(data, constraints, None)",
+            "except ValidationError as err:",
+            "    errors = list(err.messages)",
+        ]
+    for i, field in enumerate(method.fields):
+        lines += [
+            f"if {field.alias!r} in data:",
+            f"    value = data[{field.alias!r}]",
+            "    fields_count += 1",
+            *indent(field_lines(i, field, namespace, not simple)),
+        ]
+        if field.required:
+            lines += [
+                "else:",
+                f"    field_errors = set_child_error(field_errors, {field.alias!r},"
+                " ValidationError(missing))",
+            ]
+        elif field.required_by:
+            namespace[f"required_by{i}"] = field.required_by
+            lines += [
+                f"elif not required_by{i}.isdisjoint(data):",
+                f"    requiring = sorted(required_by{i} & data.keys())",
+                "    msg = missing + f' (required by {requiring})'",
+                f"    field_errors = set_child_error(field_errors, {field.alias!r},"
+                " ValidationError([msg]))",
+            ]
+    namespace["all_aliases"] = method.all_aliases
+    if simple:
+        if not method.typed_dict:
+            lines += [
+                "if len(data) != fields_count:",
+                "    for key in data.keys() - all_aliases:",
+                "        field_errors = set_child_error(field_errors, key,"
+                " ValidationError(unexpected))",
+            ]
+    else:
+        assert isinstance(method, ObjectMethod)
+        if not method.additional_properties:
+            namespace["discriminator"] = method.discriminator
+            lines += [
+                "if len(data) != fields_count:",
+                "    for key in data.keys() - all_aliases:",
+                "        if key != discriminator:",
+                "            field_errors = set_child_error(field_errors, key,"
+                " ValidationError(unexpected))",
+            ]
+        elif method.typed_dict:
+            lines += [
+                "if len(data) != fields_count:",
+                "    for key in data.keys() - all_aliases:",
+                "        values[key] = data[key]",
+            ]
+    if isinstance(method, ObjectMethod) and method.constraints:
+        lines += [
+            "if field_errors or errors:",
+            "    raise ValidationError(errors or [], field_errors or {})",
+        ]
+    else:
+        lines += ["if field_errors:", "    raise ValidationError([], field_errors)"]
+    lines.append("return construct(data)" if simple else "return construct(values)")
+    return lines
+
+
+def generate_deserialization(
+    method: DeserializationMethod,
+) -> Optional[Callable[[Any], Any]]:
+    """Generate the source of a function equivalent to the object method, with
+    field methods inlined when possible, and compile it"""
+    if (
+        not isinstance(method, (ObjectMethod, SimpleObjectMethod))
+        or (
+            isinstance(method, ObjectMethod)
+            and (method.aggregate_fields or method.validators)
+        )
+        # repr of str subclasses (e.g. str Enum) aliases is not a literal
+        or any(type(field.alias) is not str for field in method.fields)
+    ):
+        return None
+    namespace: Dict[str, Any] = {
+        "ValidationError": ValidationError,
+        "bad_type": bad_type,
+        "construct": method.constructor.construct,
+        "missing": method.missing,
+        "set_child_error": set_child_error,
+        "unexpected": method.unexpected,
+        "validate_constraints": validate_constraints,
+    }
+    lines = object_lines(method, namespace)
+    source = "\n".join(["def deserialize(data):", *indent(lines)])
+    cls = method.constructor.cls
+    filename = f"<deserialization of {getattr(cls, '__qualname__', cls)}>"
+    exec(compile(source, filename, "exec"), namespace)
+    return namespace["deserialize"]
+
+
+def generated_method(method: DeserializationMethod) -> DeserializationMethod:
+    generated = generate_deserialization(method)
+    return method if generated is None else GeneratedMethod(method, generated)
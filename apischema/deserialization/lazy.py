@@ -0,0 +1,184 @@
+import dataclasses
+from dataclasses import MISSING, fields
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union
+
+from apischema.deserialization.methods import (
+    DeserializationMethod,
+    Field,
+    GeneratedMethod,
+    ObjectMethod,
+    OptionalMethod,
+    SimpleObjectMethod,
+)
+from apischema.json_schema.types import bad_type
+from apischema.types import NoneType
+from apischema.utils import PREFIX
+from apischema.validation.errors import ErrorKey, ValidationError, merge_errors
+
+LAZY_STATE = f"{PREFIX}lazy"
+
+Path = Tuple[ErrorKey, ...]
+
+
+class LazyState:
+    def __init__(self, data: dict, fields: Dict[str, Field], path: Path):
+        self.data = data
+        # fields not deserialized yet, by name
+        self.fields = fields
+        self.path = path
+
+
+def with_path(error: ValidationError, path: Path) -> ValidationError:
+    for key in reversed(path):
+        error = ValidationError([], {key: error})
+    return error
+
+
+def default_value(field: dataclasses.Field) -> Any:
+    if field.default_factory is not MISSING:
+        return field.default_factory()
+    return field.default
+
+
+def resolve(obj: Any, name: str) -> Any:
+    state: Optional[LazyState] = obj.__dict__.get(LAZY_STATE)
+    if state is None or name not in state.fields:
+        raise AttributeError(name)
+    field = state.fields[name]
+    path = (*state.path, field.alias)
+    try:
+        value = lazy_deserialize(field.method, state.data[field.alias], path)
+    except ValidationError as err:
+        if field.required or not field.fall_back_on_default:
+            raise with_path(err, path)
+        value = default_value(obj.__dataclass_fields__[name])
+    object.__setattr__(obj, name, value)
+    state.fields.pop(name, None)
+    if not state.fields:
+        obj.__dict__.pop(LAZY_STATE, None)
+    return value
+
+
+class LazyField:
+    """Descriptor of a field deserialized at first access; it shadows the field
+    default (a class attribute), while the value, once deserialized, is stored in
+    the instance __dict__, which has precedence over a non-data descriptor."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, obj: Any, owner: Optional[type] = None) -> Any:
+        return self if obj is None else resolve(obj, self.name)
+
+
+def rebuild(cls: type, values: Dict[str, Any]) -> Any:
+    obj: Any = object.__new__(cls)
+    for name, value in values.items():
+        object.__setattr__(obj, name, value)
+    return obj
+
+
+# not reset with the methods cache, in order to keep a single subclass by class
+@lru_cache(maxsize=None)
+def lazy_class(cls: type) -> Optional[type]:
+    """Subclass of the dataclass whose instances deserialize their fields at first
+    access; it pretends to be the dataclass itself (__class__, equality, pickling).
+
+    Classes whose construction cannot be bypassed (custom __init__, __post_init__,
+    InitVar, etc.) or which react to subclassing are not supported."""
+    from apischema.deserialization import has_default_init
+
+    if not has_default_init(cls) or any(
+        "__init_subclass__" in base.__dict__
+        for base in cls.__mro__[:-1]  # object
+        if base.__module__ != "typing"
+    ):
+        return None
+
+    def __reduce_ex__(self, protocol):
+        return rebuild, (cls, {f.name: getattr(self, f.name) for f in fields(cls)})
+
+    namespace: Dict[str, Any] = {f.name: LazyField(f.name) for f in fields(cls)}
+    namespace.update(
+        __module__=cls.__module__,
+        __qualname__=cls.__qualname__,
+        __class__=property(lambda _: cls),
+        __reduce_ex__=__reduce_ex__,
+    )
+    return type(cls.__name__, (cls,), namespace)
+
+
+def object_method(
+    method: DeserializationMethod,
+) -> Optional[Union[ObjectMethod, SimpleObjectMethod]]:
+    if isinstance(method, GeneratedMethod):
+        method = method.method
+    obj_method: Union[ObjectMethod, SimpleObjectMethod]
+    if isinstance(method, ObjectMethod):
+        if (
+            method.constraints
+            or method.aggregate_fields
+            or method.validators
+            or method.init_defaults
+            or any(f.required_by for f in method.fields)
+        ):
+            return None
+        obj_method = method
+    elif isinstance(method, SimpleObjectMethod):
+        obj_method = method
+    else:
+        return None
+    if obj_method.typed_dict or lazy_class(obj_method.constructor.cls) is None:
+        return None
+    return obj_method
+
+
+def lazy_object(
+    method: Union[ObjectMethod, SimpleObjectMethod], data: Any, path: Path
+) -> Any:
+    if not isinstance(data, dict):
+        raise bad_type(data, dict)
+    errors: Dict[ErrorKey, ValidationError] = {}
+    lazy_fields = {}
+    for field in method.fields:
+        if field.alias in data:
+            lazy_fields[field.name] = field
+        elif field.required:
+            errors[field.alias] = ValidationError(method.missing)
+    if isinstance(method, SimpleObjectMethod) or not method.additional_properties:
+        discriminator = getattr(method, "discriminator", None)
+        for key in data.keys() - method.all_aliases:
+            if key != discriminator:
+                errors[key] = ValidationError(method.unexpected)
+    if errors:
+        raise ValidationError([], errors)
+    cls = method.constructor.cls
+    lazy_cls = lazy_class(cls)
+    assert lazy_cls is not None
+    obj: Any = object.__new__(lazy_cls)
+    for cls_field in fields(cls):
+        if cls_field.name not in lazy_fields:
+            object.__setattr__(obj, cls_field.name, default_value(cls_field))
+    if lazy_fields:
+        obj.__dict__[LAZY_STATE] = LazyState(data, lazy_fields, path)
+    return obj
+
+
+def lazy_deserialize(method: DeserializationMethod, data: Any, path: Path = ()) -> Any:
+    """Deserialize data, returning objects (also when nested in other objects, or
+    optional) whose fields are deserialized only when they are accessed; errors
+    raised then are located from the root of the data."""
+    if isinstance(method, OptionalMethod) and method.coercer is None:
+        if data is None:
+            return None
+        obj_method = object_method(method.value_method)
+        if obj_method is not None:
+            try:
+                return lazy_object(obj_method, data, path)
+            except ValidationError as err:
+                raise merge_errors(err, bad_type(data, NoneType))
+    obj_method = object_method(method)
+    if obj_method is not None:
+        return lazy_object(obj_method, data, path)
+    return method.deserialize(data)
@@ -1,4 +1,7 @@
+import threading
+from array import array
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import (
     AbstractSet,
     Any,
@@ -18,7 +21,7 @@ from apischema.conversions.utils import Converter
 from apischema.deserialization.coercion import Coercer
 from apischema.json_schema.types import bad_type
 from apischema.types import AnyType, NoneType
-from apischema.utils import Lazy
+from apischema.utils import Lazy, with_slots
 from apischema.validation.errors import (
     ErrorKey,
     ErrorMsg,
@@ -29,6 +32,7 @@ from apischema.validation.mock import ValidatorMock
 from apischema.validation.validators import Validator, validate
 
 
+@with_slots
 @dataclass
 class Constraint:
     error: Union[str, Callable[[Any], str]]
@@ -36,47 +40,71 @@ class Constraint:
     def validate(self, data: Any) -> bool:
         raise NotImplementedError
 
+    def validate_many(self, data: list) -> bool:
+        raise NotImplementedError
+
 
+@with_slots
 @dataclass
 class MinimumConstraint(Constraint):
-    minimum: int
+    minimum: float  # not int, which would be typed as C long by Cython
 
-    def validate(self, data: int) -> bool:
+    def validate(self, data: float) -> bool:
         return data >= self.minimum
 
+    def validate_many(self, data: list) -> bool:
+        return not data or min(data) >= self.minimum
+
 
+@with_slots
 @dataclass
 class MaximumConstraint(Constraint):
-    maximum: int
+    maximum: float
 
-    def validate(self, data: int) -> bool:
+    def validate(self, data: float) -> bool:
         return data <= self.maximum
 
+    def validate_many(self, data: list) -> bool:
+        return not data or max(data) <= self.maximum
 
+
+@with_slots
 @dataclass
 class ExclusiveMinimumConstraint(Constraint):
-    exc_min: int
+    exc_min: float
 
-    def validate(self, data: int) -> bool:
+    def validate(self, data: float) -> bool:
         return data > self.exc_min
 
+    def validate_many(self, data: list) -> bool:
+        return not data or min(data) > self.exc_min
+
 
+@with_slots
 @dataclass
 class ExclusiveMaximumConstraint(Constraint):
-    exc_max: int
+    exc_max: float
 
-    def validate(self, data: int) -> bool:
+    def validate(self, data: float) -> bool:
         return data < self.exc_max
 
+    def validate_many(self, data: list) -> bool:
+        return not data or max(data) < self.exc_max
+
 
+@with_slots
 @dataclass
 class MultipleOfConstraint(Constraint):
-    mult_of: int
+    mult_of: float
 
-    def validate(self, data: int) -> bool:
+    def validate(self, data: float) -> bool:
         return not (data % self.mult_of)
 
+    def validate_many(self, data: list) -> bool:
+        return not any([elt % self.mult_of for elt in data])
 
+
+@with_slots
 @dataclass
 class MinLengthConstraint(Constraint):
     min_len: int
@@ -84,7 +112,11 @@ class MinLengthConstraint(Constraint):
     def validate(self, data: str) -> bool:
         return len(data) >= self.min_len
 
+    def validate_many(self, data: list) -> bool:
+        return not data or min(map(len, data)) >= self.min_len
+
 
+@with_slots
 @dataclass
 class MaxLengthConstraint(Constraint):
     max_len: int
@@ -92,7 +124,11 @@ class MaxLengthConstraint(Constraint):
     def validate(self, data: str) -> bool:
         return len(data) <= self.max_len
 
+    def validate_many(self, data: list) -> bool:
+        return not data or max(map(len, data)) <= self.max_len
+
 
+@with_slots
 @dataclass
 class PatternConstraint(Constraint):
     pattern: Pattern
@@ -100,7 +136,11 @@ class PatternConstraint(Constraint):
     def validate(self, data: str) -> bool:
         return self.pattern.match(data) is not None
 
+    def validate_many(self, data: list) -> bool:
+        return all(map(self.pattern.match, data))
 
+
+@with_slots
 @dataclass
 class MinItemsConstraint(Constraint):
     min_items: int
@@ -109,6 +149,7 @@ class MinItemsConstraint(Constraint):
         return len(data) >= self.min_items
 
 
+@with_slots
 @dataclass
 class MaxItemsConstraint(Constraint):
     max_items: int
@@ -127,6 +168,7 @@ def to_hashable(data: Any) -> Any:
         return data
 
 
+@with_slots
 @dataclass
 class UniqueItemsConstraint(Constraint):
     unique: bool
@@ -138,6 +180,7 @@ class UniqueItemsConstraint(Constraint):
         return len(set(map(to_hashable, data))) == len(data)
 
 
+@with_slots
 @dataclass
 class MinPropertiesConstraint(Constraint):
     min_properties: int
@@ -146,6 +189,7 @@ class MinPropertiesConstraint(Constraint):
         return len(data) >= self.min_properties
 
 
+@with_slots
 @dataclass
 class MaxPropertiesConstraint(Constraint):
     max_properties: int
@@ -187,25 +231,38 @@ def set_child_error(
         return errors
 
 
+@with_slots
 class DeserializationMethod:
     def deserialize(self, data: Any) -> Any:
         raise NotImplementedError
 
 
+@with_slots
 @dataclass
 class RecMethod(DeserializationMethod):
     lazy: Lazy[DeserializationMethod]
     method: Optional[DeserializationMethod] = field(init=False)
+    lock: Any = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         self.method = None
+        self.lock = threading.RLock()
 
     def deserialize(self, data: Any) -> Any:
         if self.method is None:
-            self.method = self.lazy()
+            return resolve_rec_method(self).deserialize(data)
         return self.method.deserialize(data)
 
 
+def resolve_rec_method(method: RecMethod) -> DeserializationMethod:
+    # lazy is called only once, even by concurrent first uses
+    with method.lock:
+        if method.method is None:
+            method.method = method.lazy()
+        return method.method
+
+
+@with_slots
 @dataclass
 class ValidatorMethod(DeserializationMethod):
     method: DeserializationMethod
@@ -218,6 +275,7 @@ class ValidatorMethod(DeserializationMethod):
         )
 
 
+@with_slots
 @dataclass
 class CoercerMethod(DeserializationMethod):
     coercer: Coercer
@@ -228,6 +286,7 @@ class CoercerMethod(DeserializationMethod):
         return self.method.deserialize(self.coercer(self.cls, data))
 
 
+@with_slots
 @dataclass
 class TypeCheckMethod(DeserializationMethod):
     expected: AnyType  # `type` would require exact match (i.e. no EnumMeta)
@@ -239,6 +298,7 @@ class TypeCheckMethod(DeserializationMethod):
         return self.fallback.deserialize(data)
 
 
+@with_slots
 @dataclass
 class AnyMethod(DeserializationMethod):
     constraints: Dict[type, Tuple[Constraint, ...]]
@@ -249,6 +309,7 @@ class AnyMethod(DeserializationMethod):
         return data
 
 
+@with_slots
 @dataclass
 class ListCheckOnlyMethod(DeserializationMethod):
     constraints: Tuple[Constraint, ...]
@@ -267,6 +328,7 @@ class ListCheckOnlyMethod(DeserializationMethod):
         return data
 
 
+@with_slots
 @dataclass
 class ListMethod(DeserializationMethod):
     constraints: Tuple[Constraint, ...]
@@ -286,6 +348,38 @@ class ListMethod(DeserializationMethod):
         return values
 
 
+@with_slots
+@dataclass
+class PrimitiveListMethod(DeserializationMethod):
+    constraints: Tuple[Constraint, ...]
+    value_types: AbstractSet[type]
+    value_constraints: Tuple[Constraint, ...]
+    to_float: bool
+    check_only: bool
+    fallback: DeserializationMethod
+
+    def deserialize(self, data: Any) -> Any:
+        if not isinstance(data, list):
+            raise bad_type(data, list)
+        # Check the whole list at once, and only fall back on element-wise
+        # deserialization to report errors
+        if not set(map(type, data)) <= self.value_types:
+            return self.fallback.deserialize(data)
+        values: list = list(map(float, data)) if self.to_float else data
+        if self.value_constraints:
+            if self.to_float:
+                total = sum(values)
+                if total != total:  # NaN (or inf - inf) must be checked one by one
+                    return self.fallback.deserialize(data)
+            for i in range(len(self.value_constraints)):
+                constraint: Constraint = self.value_constraints[i]
+                if not constraint.validate_many(values):
+                    return self.fallback.deserialize(data)
+        validate_constraints(data, self.constraints, None)
+        return values if self.to_float or self.check_only else list(values)
+
+
+@with_slots
 @dataclass
 class SetMethod(DeserializationMethod):
     constraints: Tuple[Constraint, ...]
@@ -305,6 +399,7 @@ class SetMethod(DeserializationMethod):
         return values
 
 
+@with_slots
 @dataclass
 class FrozenSetMethod(DeserializationMethod):
     method: DeserializationMethod
@@ -313,6 +408,7 @@ class FrozenSetMethod(DeserializationMethod):
         return frozenset(self.method.deserialize(data))
 
 
+@with_slots
 @dataclass
 class VariadicTupleMethod(DeserializationMethod):
     method: DeserializationMethod
@@ -321,6 +417,7 @@ class VariadicTupleMethod(DeserializationMethod):
         return tuple(self.method.deserialize(data))
 
 
+@with_slots
 @dataclass
 class LiteralMethod(DeserializationMethod):
     value_map: dict
@@ -343,6 +440,7 @@ class LiteralMethod(DeserializationMethod):
             raise bad_type(data, *self.types)
 
 
+@with_slots
 @dataclass
 class MappingCheckOnly(DeserializationMethod):
     constraints: Tuple[Constraint, ...]
@@ -363,6 +461,7 @@ class MappingCheckOnly(DeserializationMethod):
         return data
 
 
+@with_slots
 @dataclass
 class MappingMethod(DeserializationMethod):
     constraints: Tuple[Constraint, ...]
@@ -385,6 +484,7 @@ class MappingMethod(DeserializationMethod):
         return items
 
 
+@with_slots
 @dataclass
 class Field:
     name: str
@@ -395,6 +495,7 @@ class Field:
     fall_back_on_default: bool
 
 
+@with_slots
 @dataclass
 class FlattenedField:
     name: str
@@ -403,6 +504,7 @@ class FlattenedField:
     fall_back_on_default: bool
 
 
+@with_slots
 @dataclass
 class PatternField:
     name: str
@@ -411,6 +513,7 @@ class PatternField:
     fall_back_on_default: bool
 
 
+@with_slots
 @dataclass
 class AdditionalField:
     name: str
@@ -418,6 +521,7 @@ class AdditionalField:
     fall_back_on_default: bool
 
 
+@with_slots
 @dataclass
 class Constructor:
     cls: Any  # cython doesn't handle type subclasses properly
@@ -426,28 +530,39 @@ class Constructor:
         raise NotImplementedError
 
 
+@with_slots
 class NoConstructor(Constructor):
     def construct(self, fields: Dict[str, Any]) -> Any:
         return fields
 
 
+@with_slots
 class RawConstructor(Constructor):
     def construct(self, fields: Dict[str, Any]) -> Any:
         return self.cls(**fields)
 
 
+@with_slots
+class MockConstructor(Constructor):
+    def construct(self, fields: Dict[str, Any]) -> Any:
+        return ValidatorMock(self.cls, fields)
+
+
+@with_slots
 @dataclass
 class DefaultField:
     name: str
     default_value: Any  # https://github.com/cython/cython/issues/4383
 
 
+@with_slots
 @dataclass
 class FactoryField:
     name: str
     factory: Callable
 
 
+@with_slots
 @dataclass
 class FieldsConstructor(Constructor):
     nb_fields: int
@@ -470,6 +585,7 @@ class FieldsConstructor(Constructor):
         return obj
 
 
+@with_slots
 @dataclass
 class SimpleObjectMethod(DeserializationMethod):
     constructor: Constructor
@@ -478,25 +594,60 @@ class SimpleObjectMethod(DeserializationMethod):
     typed_dict: bool
     missing: str
     unexpected: str
+    field_by_alias: dict = field(init=False)
+    required_count: int = field(init=False)
+
+    def __post_init__(self):
+        self.field_by_alias = {}
+        self.required_count = 0
+        for i in range(len(self.fields)):
+            self.field_by_alias[self.fields[i].alias] = self.fields[i]
+            if self.fields[i].required:
+                self.required_count += 1
 
     def deserialize(self, data: Any) -> Any:
         if not isinstance(data, dict):
             raise bad_type(data, dict)
         fields_count = 0
         field_errors = None
-        for i in range(len(self.fields)):
-            field: Field = self.fields[i]
-            if field.alias in data:
-                fields_count += 1
-                try:
-                    field.method.deserialize(data[field.alias])
-                except ValidationError as err:
-                    if field.required or not field.fall_back_on_default:
-                        field_errors = set_child_error(field_errors, field.alias, err)
-            elif field.required:
-                field_errors = set_child_error(
-                    field_errors, field.alias, ValidationError(self.missing)
-                )
+        if len(data) < len(self.fields):
+            # Sparse data: iterate its keys instead of all the fields
+            required_count = 0
+            for alias, item in data.items():
+                alias_field: Optional[Field] = self.field_by_alias.get(alias)
+                if alias_field is not None:
+                    fields_count += 1
+                    if alias_field.required:
+                        required_count += 1
+                    try:
+                        alias_field.method.deserialize(item)
+                    except ValidationError as err:
+                        field_errors = set_child_error(field_errors, alias, err)
+            if required_count < self.required_count:
+                for i in range(len(self.fields)):
+                    required_field: Field = self.fields[i]
+                    if required_field.required and required_field.alias not in data:
+                        field_errors = set_child_error(
+                            field_errors,
+                            required_field.alias,
+                            ValidationError(self.missing),
+                        )
+        else:
+            for i in range(len(self.fields)):
+                field: Field = self.fields[i]
+                if field.alias in data:
+                    fields_count += 1
+                    try:
+                        field.method.deserialize(data[field.alias])
+                    except ValidationError as err:
+                        if field.required or not field.fall_back_on_default:
+                            field_errors = set_child_error(
+                                field_errors, field.alias, err
+                            )
+                elif field.required:
+                    field_errors = set_child_error(
+                        field_errors, field.alias, ValidationError(self.missing)
+                    )
         if len(data) != fields_count and not self.typed_dict:
             for key in data.keys() - self.all_aliases:
                 field_errors = set_child_error(
@@ -528,6 +679,7 @@ def update_children_errors(
         return errors
 
 
+@with_slots
 @dataclass
 class ObjectMethod(DeserializationMethod):
     constructor: Constructor
@@ -547,6 +699,9 @@ class ObjectMethod(DeserializationMethod):
     unexpected: str
     discriminator: Optional[str]
     aggregate_fields: bool = field(init=False)
+    # empty if sparse data cannot be deserialized by iterating its keys
+    field_by_alias: dict = field(init=False)
+    required_count: int = field(init=False)
 
     def __post_init__(self):
         self.aggregate_fields = bool(
@@ -554,6 +709,16 @@ class ObjectMethod(DeserializationMethod):
             or self.pattern_fields
             or self.additional_field is not None
         )
+        self.field_by_alias = {}
+        self.required_count = 0
+        for i in range(len(self.fields)):
+            # deserialized TypedDict keys must keep the fields order
+            if self.typed_dict or self.fields[i].required_by:
+                self.field_by_alias = {}
+                break
+            self.field_by_alias[self.fields[i].alias] = self.fields[i]
+            if self.fields[i].required:
+                self.required_count += 1
 
     def deserialize(self, data: Any) -> Any:
         if not isinstance(data, dict):
@@ -566,36 +731,64 @@ class ObjectMethod(DeserializationMethod):
         except ValidationError as err:
             errors = list(err.messages)
         field_errors = None
-        for i in range(len(self.fields)):
-            field: Field = self.fields[i]
-            if field.required:
-                try:
-                    value: object = data[field.alias]
-                except KeyError:
-                    field_errors = set_child_error(
-                        field_errors, field.alias, ValidationError(self.missing)
-                    )
-                else:
+        if self.field_by_alias and len(data) < len(self.fields):
+            # Sparse data: iterate its keys instead of all the fields
+            required_count = 0
+            for alias, item in data.items():
+                alias_field: Optional[Field] = self.field_by_alias.get(alias)
+                if alias_field is not None:
                     fields_count += 1
+                    if alias_field.required:
+                        required_count += 1
                     try:
-                        values[field.name] = field.method.deserialize(value)
+                        values[alias_field.name] = alias_field.method.deserialize(item)
                     except ValidationError as err:
-                        field_errors = set_child_error(field_errors, field.alias, err)
-            elif field.alias in data:
-                fields_count += 1
-                try:
-                    values[field.name] = field.method.deserialize(data[field.alias])
-                except ValidationError as err:
-                    if not field.fall_back_on_default:
-                        field_errors = set_child_error(field_errors, field.alias, err)
-            elif field.required_by is not None and not field.required_by.isdisjoint(
-                data
-            ):
-                requiring: list = sorted(field.required_by & data.keys())
-                msg: str = self.missing + f" (required by {requiring})"
-                field_errors = set_child_error(
-                    field_errors, field.alias, ValidationError([msg])
-                )
+                        if alias_field.required or not alias_field.fall_back_on_default:
+                            field_errors = set_child_error(field_errors, alias, err)
+            if required_count < self.required_count:
+                for i in range(len(self.fields)):
+                    required_field: Field = self.fields[i]
+                    if required_field.required and required_field.alias not in data:
+                        field_errors = set_child_error(
+                            field_errors,
+                            required_field.alias,
+                            ValidationError(self.missing),
+                        )
+        else:
+            for i in range(len(self.fields)):
+                field: Field = self.fields[i]
+                if field.required:
+                    try:
+                        value: object = data[field.alias]
+                    except KeyError:
+                        field_errors = set_child_error(
+                            field_errors, field.alias, ValidationError(self.missing)
+                        )
+                    else:
+                        fields_count += 1
+                        try:
+                            values[field.name] = field.method.deserialize(value)
+                        except ValidationError as err:
+                            field_errors = set_child_error(
+                                field_errors, field.alias, err
+                            )
+                elif field.alias in data:
+                    fields_count += 1
+                    try:
+                        values[field.name] = field.method.deserialize(data[field.alias])
+                    except ValidationError as err:
+                        if not field.fall_back_on_default:
+                            field_errors = set_child_error(
+                                field_errors, field.alias, err
+                            )
+                elif field.required_by is not None and not field.required_by.isdisjoint(
+                    data
+                ):
+                    requiring: list = sorted(field.required_by & data.keys())
+                    msg: str = self.missing + f" (required by {requiring})"
+                    field_errors = set_child_error(
+                        field_errors, field.alias, ValidationError([msg])
+                    )
         if self.aggregate_fields:
             remain = data.keys() - self.all_aliases
             for i in range(len(self.flattened_fields)):
@@ -706,6 +899,203 @@ class ObjectMethod(DeserializationMethod):
         return self.constructor.construct(values)
 
 
+def invalid_rows(fields: tuple, unexpected_allowed: bool, data: list) -> list:
+    # Rows which are not a dict, miss a required field or have an unexpected key
+    invalid: list = [False] * len(data)
+    for i in range(len(data)):
+        row = data[i]
+        if not isinstance(row, dict):
+            invalid[i] = True
+            continue
+        fields_count = 0
+        for j in range(len(fields)):
+            field: Field = fields[j]
+            if field.alias in row:
+                fields_count += 1
+            elif field.required or field.required_by:
+                invalid[i] = True
+        if len(row) != fields_count and not unexpected_allowed:
+            invalid[i] = True
+    return invalid
+
+
+def check_object_columns(method: SimpleObjectMethod, data: list, values: list) -> list:
+    invalid = invalid_rows(method.fields, method.typed_dict, data)
+    for j in range(len(method.fields)):
+        field: Field = method.fields[j]
+        alias: str = field.alias
+        field_method: DeserializationMethod = field.method
+        for i in range(len(data)):
+            if not invalid[i] and alias in data[i]:
+                try:
+                    field_method.deserialize(data[i][alias])
+                except ValidationError:
+                    invalid[i] = True
+    for i in range(len(data)):
+        if not invalid[i]:
+            values[i] = method.constructor.construct(data[i])
+    return invalid
+
+
+def deserialize_object_columns(method: ObjectMethod, data: list, values: list) -> list:
+    invalid = invalid_rows(
+        method.fields, method.additional_properties and not method.typed_dict, data
+    )
+    for i in range(len(data)):
+        values[i] = {}
+    for j in range(len(method.fields)):
+        field: Field = method.fields[j]
+        alias: str = field.alias
+        name: str = field.name
+        field_method: DeserializationMethod = field.method
+        for i in range(len(data)):
+            if not invalid[i] and alias in data[i]:
+                try:
+                    values[i][name] = field_method.deserialize(data[i][alias])
+                except ValidationError:
+                    if field.required or not field.fall_back_on_default:
+                        invalid[i] = True
+    for i in range(len(data)):
+        if not invalid[i]:
+            values[i] = method.constructor.construct(values[i])
+    return invalid
+
+
+def batch_deserialize(method: DeserializationMethod, data: list, errors: dict) -> list:
+    # Object fields are deserialized column by column, each field method being run
+    # on the whole batch; rows failing any check are then deserialized one by one
+    # in order to build their error, outside of the hot loops
+    values: list = [None] * len(data)
+    if isinstance(method, SimpleObjectMethod):
+        invalid = check_object_columns(method, data, values)
+    elif (
+        isinstance(method, ObjectMethod)
+        and not method.constraints
+        and not method.aggregate_fields
+        and not method.validators
+    ):
+        invalid = deserialize_object_columns(method, data, values)
+    else:
+        invalid = [True] * len(data)
+    for i in range(len(data)):
+        if invalid[i]:
+            try:
+                values[i] = method.deserialize(data[i])
+            except ValidationError as err:
+                values[i] = None
+                errors[i] = err
+    return values
+
+
+@with_slots
+@dataclass
+class Column:
+    name: str
+    alias: str
+    method: DeserializationMethod
+    required: bool
+    fall_back_on_default: bool
+    default_factory: Optional[Callable[[], Any]]
+    typecode: Optional[str]
+    value_type: Optional[type]
+
+
+def set_column_error(
+    errors: Optional[Dict[int, dict]], index: int, alias: str, error: ValidationError
+) -> Dict[int, dict]:
+    if errors is None:
+        errors = {}
+    if index in errors:
+        errors[index][alias] = error
+    else:
+        errors[index] = {alias: error}
+    return errors
+
+
+@with_slots
+@dataclass
+class ColumnsMethod(DeserializationMethod):
+    columns: Tuple[Column, ...]
+    all_aliases: AbstractSet[str]
+    additional_properties: bool
+    discriminator: Optional[str]
+    missing: str
+    unexpected: str
+
+    def deserialize(self, data: Any) -> Any:
+        if not isinstance(data, list):
+            raise bad_type(data, list)
+        row_errors: dict = {}
+        field_errors = None
+        for i in range(len(data)):
+            row = data[i]
+            if not isinstance(row, dict):
+                row_errors[i] = bad_type(row, dict)
+            elif not self.additional_properties and not row.keys() <= self.all_aliases:
+                for key in row.keys() - self.all_aliases:
+                    if key != self.discriminator:
+                        field_errors = set_column_error(
+                            field_errors, i, key, ValidationError(self.unexpected)
+                        )
+        # Columns are filled one after the other, so each loop only uses one method
+        values_by_column: list = [None] * len(self.columns)
+        for j in range(len(self.columns)):
+            column: Column = self.columns[j]
+            values: list = [None] * len(data)
+            for i in range(len(data)):
+                if i in row_errors:
+                    continue
+                row_data: dict = data[i]
+                if column.alias in row_data:
+                    try:
+                        values[i] = column.method.deserialize(row_data[column.alias])
+                    except ValidationError as err:
+                        if column.required or not column.fall_back_on_default:
+                            field_errors = set_column_error(
+                                field_errors, i, column.alias, err
+                            )
+                        else:
+                            assert column.default_factory is not None
+                            values[i] = column.default_factory()
+                elif column.required:
+                    field_errors = set_column_error(
+                        field_errors, i, column.alias, ValidationError(self.missing)
+                    )
+                else:
+                    assert column.default_factory is not None
+                    values[i] = column.default_factory()
+            values_by_column[j] = values
+        if row_errors or field_errors:
+            if field_errors:
+                for i, errors in field_errors.items():
+                    row_errors[i] = ValidationError([], errors)
+            raise ValidationError([], {i: row_errors[i] for i in sorted(row_errors)})
+        result: dict = {}
+        for j in range(len(self.columns)):
+            column = self.columns[j]
+            result[column.name] = values_by_column[j]
+            # bool or other subclasses values would be converted by the array
+            if column.typecode is not None and all(
+                type(value) is column.value_type for value in values_by_column[j]
+            ):
+                try:
+                    result[column.name] = array(column.typecode, values_by_column[j])
+                except OverflowError:
+                    pass
+        return result
+
+
+@with_slots
+@dataclass
+class GeneratedMethod(DeserializationMethod):
+    method: DeserializationMethod
+    generated: Callable[[Any], Any]
+
+    def deserialize(self, data: Any) -> Any:
+        return self.generated(data)
+
+
+@with_slots
 class NoneMethod(DeserializationMethod):
     def deserialize(self, data: Any) -> Any:
         if data is not None:
@@ -713,6 +1103,7 @@ class NoneMethod(DeserializationMethod):
         return data
 
 
+@with_slots
 class IntMethod(DeserializationMethod):
     def deserialize(self, data: Any) -> Any:
         if not isinstance(data, int):
@@ -720,6 +1111,7 @@ class IntMethod(DeserializationMethod):
         return data
 
 
+@with_slots
 class FloatMethod(DeserializationMethod):
     def deserialize(self, data: Any) -> Any:
         if isinstance(data, float):
@@ -730,6 +1122,7 @@ class FloatMethod(DeserializationMethod):
             raise bad_type(data, float)
 
 
+@with_slots
 class StrMethod(DeserializationMethod):
     def deserialize(self, data: Any) -> Any:
         if not isinstance(data, str):
@@ -737,6 +1130,7 @@ class StrMethod(DeserializationMethod):
         return data
 
 
+@with_slots
 class BoolMethod(DeserializationMethod):
     def deserialize(self, data: Any) -> Any:
         if not isinstance(data, bool):
@@ -744,6 +1138,7 @@ class BoolMethod(DeserializationMethod):
         return data
 
 
+@with_slots
 @dataclass
 class ConstrainedIntMethod(IntMethod):
     constraints: Tuple[Constraint, ...]
@@ -752,6 +1147,7 @@ class ConstrainedIntMethod(IntMethod):
         return validate_constraints(super().deserialize(data), self.constraints, None)
 
 
+@with_slots
 @dataclass
 class ConstrainedFloatMethod(FloatMethod):
     constraints: Tuple[Constraint, ...]
@@ -760,6 +1156,7 @@ class ConstrainedFloatMethod(FloatMethod):
         return validate_constraints(super().deserialize(data), self.constraints, None)
 
 
+@with_slots
 @dataclass
 class ConstrainedStrMethod(StrMethod):
     constraints: Tuple[Constraint, ...]
@@ -768,6 +1165,7 @@ class ConstrainedStrMethod(StrMethod):
         return validate_constraints(super().deserialize(data), self.constraints, None)
 
 
+@with_slots
 @dataclass
 class SubprimitiveMethod(DeserializationMethod):
     cls: type
@@ -777,6 +1175,7 @@ class SubprimitiveMethod(DeserializationMethod):
         return self.cls(self.method.deserialize(data))
 
 
+@with_slots
 @dataclass
 class TupleMethod(DeserializationMethod):
     constraints: Tuple[Constraint, ...]
@@ -807,6 +1206,7 @@ class TupleMethod(DeserializationMethod):
         return tuple(elts)
 
 
+@with_slots
 @dataclass
 class OptionalMethod(DeserializationMethod):
     value_method: DeserializationMethod
@@ -824,6 +1224,7 @@ class OptionalMethod(DeserializationMethod):
                 raise merge_errors(err, bad_type(data, NoneType))
 
 
+@with_slots
 @dataclass
 class UnionByTypeMethod(DeserializationMethod):
     method_by_cls: Dict[type, DeserializationMethod]
@@ -839,22 +1240,153 @@ class UnionByTypeMethod(DeserializationMethod):
             raise merge_errors(err, bad_type(data, *other_classes))
 
 
+def add_error(errors: Optional[list], error: ValidationError) -> list:
+    # errors of failed alternatives are only merged if all the alternatives fail
+    if errors is None:
+        return [error]
+    else:
+        errors.append(error)
+        return errors
+
+
+def merge_all_errors(errors: Optional[list]) -> ValidationError:
+    assert errors
+    error: ValidationError = errors[0]
+    for i in range(1, len(errors)):
+        error = merge_errors(error, errors[i])
+    return error
+
+
+@with_slots
 @dataclass
 class UnionMethod(DeserializationMethod):
     alt_methods: Tuple[DeserializationMethod, ...]
 
     def deserialize(self, data: Any) -> Any:
-        error = None
+        errors = None
         for i in range(len(self.alt_methods)):
             alt_method: DeserializationMethod = self.alt_methods[i]
             try:
                 return alt_method.deserialize(data)
             except ValidationError as err:
-                error = merge_errors(error, err)
-        assert error is not None
-        raise error
+                errors = add_error(errors, err)
+        raise merge_all_errors(errors)
+
+
+@with_slots
+@dataclass
+class AdaptiveAlternative:
+    index: int  # in the union declaration
+    method: DeserializationMethod
+    hits: int = field(init=False)
+
+    def __post_init__(self):
+        self.hits = 0
+
+
+def reorder_alternatives(alternatives: tuple) -> tuple:
+    # halving the counts gives more weight to the recent hits
+    reordered = tuple(sorted(alternatives, key=attrgetter("hits"), reverse=True))
+    for i in range(len(reordered)):
+        alternative: AdaptiveAlternative = reordered[i]
+        alternative.hits //= 2
+    return reordered
+
+
+@with_slots
+@dataclass
+class AdaptiveUnionMethod(DeserializationMethod):
+    # disjoint alternatives, reordered by decreasing hits every period calls
+    alternatives: Tuple[AdaptiveAlternative, ...]
+    period: int
+    calls: int = field(init=False)
+
+    def __post_init__(self):
+        self.calls = 0
+
+    def deserialize(self, data: Any) -> Any:
+        # the tuple can be replaced concurrently
+        alternatives: tuple = self.alternatives
+        errors = None
+        for i in range(len(alternatives)):
+            alternative: AdaptiveAlternative = alternatives[i]
+            try:
+                result = alternative.method.deserialize(data)
+            except ValidationError as err:
+                errors = add_error(errors, err)
+            else:
+                alternative.hits += 1
+                self.calls += 1
+                if self.calls >= self.period:
+                    self.calls = 0
+                    self.alternatives = reorder_alternatives(alternatives)
+                return result
+        assert errors is not None
+        # errors are merged in declaration order
+        ordered: list = [None] * len(alternatives)
+        for i in range(len(alternatives)):
+            failed: AdaptiveAlternative = alternatives[i]
+            ordered[failed.index] = errors[i]
+        raise merge_all_errors(ordered)
+
+
+@with_slots
+@dataclass
+class InferredDiscriminatorMethod(DeserializationMethod):
+    alias: str
+    mapping: Dict[Any, DeserializationMethod]
+    union_method: DeserializationMethod
 
+    def deserialize(self, data: Any) -> Any:
+        if isinstance(data, dict) and self.alias in data:
+            try:
+                method: DeserializationMethod = self.mapping[data[self.alias]]
+            except (TypeError, KeyError):
+                pass
+            else:
+                try:
+                    return method.deserialize(data)
+                except ValidationError:
+                    pass
+        # other alternatives cannot match, so the whole union gives the same
+        # result, but with the errors of all the alternatives
+        return self.union_method.deserialize(data)
 
+
+@with_slots
+@dataclass
+class KeySetNode:
+    # alias whose presence in data selects the next node, None for leaves
+    alias: Optional[str]
+    present: Optional["KeySetNode"]
+    absent: Optional["KeySetNode"]
+    # alternatives compatible with the keys tested from the root
+    alt_methods: Tuple[DeserializationMethod, ...]
+
+
+@with_slots
+@dataclass
+class KeySetUnionMethod(DeserializationMethod):
+    tree: KeySetNode
+    union_method: DeserializationMethod
+
+    def deserialize(self, data: Any) -> Any:
+        if isinstance(data, dict):
+            node: KeySetNode = self.tree
+            while node.alias is not None:
+                node = node.present if node.alias in data else node.absent  # type: ignore
+            for i in range(len(node.alt_methods)):
+                alt_method: DeserializationMethod = node.alt_methods[i]
+                try:
+                    return alt_method.deserialize(data)
+                except ValidationError:
+                    pass
+        # other alternatives cannot match, so the whole union gives the same
+        # result, but with the errors of all the alternatives
+        return self.union_method.deserialize(data)
+
+
+@with_slots
 @dataclass
 class ConversionMethod(DeserializationMethod):
     converter: Converter
@@ -864,6 +1396,7 @@ class ConversionMethod(DeserializationMethod):
         return self.converter(self.method.deserialize(data))
 
 
+@with_slots
 @dataclass
 class ConversionWithValueErrorMethod(ConversionMethod):
     def deserialize(self, data: Any) -> Any:
@@ -874,6 +1407,7 @@ class ConversionWithValueErrorMethod(ConversionMethod):
             raise ValidationError(str(err))
 
 
+@with_slots
 @dataclass
 class ConversionAlternative:
     converter: Converter
@@ -881,31 +1415,32 @@ class ConversionAlternative:
     value_error: bool
 
 
+@with_slots
 @dataclass
 class ConversionUnionMethod(DeserializationMethod):
     alternatives: Tuple[ConversionAlternative, ...]
 
     def deserialize(self, data: Any) -> Any:
-        error: Optional[ValidationError] = None
+        errors = None
         for i in range(len(self.alternatives)):
             alternative: ConversionAlternative = self.alternatives[i]
             try:
                 value = alternative.method.deserialize(data)
             except ValidationError as err:
-                error = merge_errors(error, err)
+                errors = add_error(errors, err)
                 continue
             try:
                 return alternative.converter(value)
             except ValidationError as err:
-                error = merge_errors(error, err)
+                errors = add_error(errors, err)
             except ValueError as err:
                 if not alternative.value_error:
                     raise
-                error = merge_errors(error, ValidationError(str(err)))
-        assert error is not None
-        raise error
+                errors = add_error(errors, ValidationError(str(err)))
+        raise merge_all_errors(errors)
 
 
+@with_slots
 @dataclass
 class DiscriminatorMethod(DeserializationMethod):
     alias: str
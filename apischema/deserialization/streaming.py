@@ -0,0 +1,298 @@
+import codecs
+import json
+import re
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterator,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from apischema.aliases import Aliaser
+from apischema.conversions.conversions import AnyConversion, DefaultConversion
+from apischema.deserialization import _deserialization_method_factory
+from apischema.deserialization.coercion import Coerce
+from apischema.deserialization.methods import ListMethod
+from apischema.schemas import Schema
+from apischema.types import AnyType
+from apischema.utils import CollectionOrPredicate
+from apischema.validation.errors import ErrorKey, ValidationError
+
+T = TypeVar("T")
+
+JSON = Union[str, bytes, bytearray]
+# same as json.decoder
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+WHITESPACE_CHARS = " \t\n\r"
+# what can remain of a truncated number, or literal, at the end of the buffer
+NUMBER_TAIL = re.compile(r"[0-9.eE+-]*")
+LITERALS = ("true", "false", "null", "NaN", "Infinity", "-Infinity")
+decoder = json.JSONDecoder()
+CHUNK_SIZE = 1 << 16
+
+
+def decode(data: JSON) -> str:
+    if isinstance(data, str):
+        return data
+    return data.decode(json.detect_encoding(data), "surrogatepass")
+
+
+class JSONReader:
+    """Buffered reader decoding JSON values one by one from a (text or binary)
+    file-like object, or from a string if there is no file."""
+
+    def __init__(self, fp: Optional[IO], buffer: str = ""):
+        self.fp = fp
+        self.buffer = buffer
+        self.pos = 0
+        self.eof = fp is None
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+
+    def _read(self) -> bool:
+        if self.eof:
+            return False
+        assert self.fp is not None
+        # Read at least the size of the remaining buffer, in order to avoid quadratic
+        # complexity when a value spreads over several chunks
+        raw = self.fp.read(max(CHUNK_SIZE, len(self.buffer) - self.pos))
+        self.eof = not raw
+        chunk = raw if isinstance(raw, str) else self._decoder.decode(raw, self.eof)
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def error(self, msg: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(msg, self.buffer, self.pos)
+
+    def next_char(self) -> str:
+        """Skip whitespaces and return the next character (empty at the end)"""
+        while True:
+            self.pos = WHITESPACE.match(self.buffer, self.pos).end()  # type: ignore
+            if self.pos < len(self.buffer) or not self._read():
+                return self.buffer[self.pos : self.pos + 1]
+
+    def truncated(self, err: json.JSONDecodeError) -> bool:
+        """Whether the decoding error can be due to the end of the buffer, i.e.
+        whether reading more data could fix it"""
+        if err.msg.startswith("Unterminated string"):
+            return True
+        rest = self.buffer[err.pos :]
+        if err.msg.startswith("Invalid \\uXXXX escape"):
+            return len(rest) < len("\\uXXXX\\uXXXX")
+        return NUMBER_TAIL.fullmatch(rest) is not None or any(
+            lit.startswith(rest) for lit in LITERALS
+        )
+
+    def value(self) -> Any:
+        # empty string (end of buffer) is also contained
+        if self.buffer[self.pos : self.pos + 1] in WHITESPACE_CHARS:
+            self.next_char()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as err:
+                # malformed data is not read further
+                if not self.truncated(err) or not self._read():
+                    raise
+                continue
+            # a number at the end of the buffer could be truncated
+            if NUMBER_TAIL.fullmatch(self.buffer, end) is None or not self._read():
+                self.pos = end
+                return value
+
+    def array_elements(self) -> Iterator[Any]:
+        if self.next_char() != "[":
+            raise self.error("Expecting '['")
+        self.pos += 1
+        if self.next_char() != "]":
+            while True:
+                yield self.value()
+                delimiter = self.buffer[self.pos : self.pos + 1]
+                if delimiter in WHITESPACE_CHARS:
+                    delimiter = self.next_char()
+                if delimiter == "]":
+                    break
+                elif delimiter != ",":
+                    raise self.error("Expecting ',' delimiter")
+                self.pos += 1
+        self.pos += 1
+        if self.next_char():
+            raise self.error("Extra data")
+
+
+@overload
+def deserialize_json(
+    type: Type[T],
+    data: JSON,
+    *,
+    additional_properties: Optional[bool] = None,
+    aliaser: Optional[Aliaser] = None,
+    coerce: Optional[Coerce] = None,
+    conversion: Optional[AnyConversion] = None,
+    default_conversion: Optional[DefaultConversion] = None,
+    fall_back_on_default: Optional[bool] = None,
+    no_copy: Optional[bool] = None,
+    pass_through: Optional[CollectionOrPredicate[type]] = None,
+    schema: Optional[Schema] = None,
+    validators: Collection[Callable] = ()
+) -> T:
+    ...
+
+
+@overload
+def deserialize_json(
+    type: AnyType,
+    data: JSON,
+    *,
+    additional_properties: Optional[bool] = None,
+    aliaser: Optional[Aliaser] = None,
+    coerce: Optional[Coerce] = None,
+    conversion: Optional[AnyConversion] = None,
+    default_conversion: Optional[DefaultConversion] = None,
+    fall_back_on_default: Optional[bool] = None,
+    no_copy: Optional[bool] = None,
+    pass_through: Optional[CollectionOrPredicate[type]] = None,
+    schema: Optional[Schema] = None,
+    validators: Collection[Callable] = ()
+) -> Any:
+    ...
+
+
+def deserialize_json(
+    type: AnyType,
+    data: JSON,
+    *,
+    additional_properties: Optional[bool] = None,
+    aliaser: Optional[Aliaser] = None,
+    coerce: Optional[Coerce] = None,
+    conversion: Optional[AnyConversion] = None,
+    default_conversion: Optional[DefaultConversion] = None,
+    fall_back_on_default: Optional[bool] = None,
+    no_copy: Optional[bool] = None,
+    pass_through: Optional[CollectionOrPredicate[type]] = None,
+    schema: Optional[Schema] = None,
+    validators: Collection[Callable] = ()
+) -> Any:
+    """Deserialize JSON text; elements of a top-level array are deserialized as soon
+    as they are decoded, so the whole decoded array is never kept in memory."""
+    method = _deserialization_method_factory(
+        type,
+        additional_properties,
+        aliaser,
+        coerce,
+        conversion,
+        default_conversion,
+        fall_back_on_default,
+        no_copy,
+        pass_through,
+        schema,
+        validators,
+    ).method
+    reader = JSONReader(None, decode(data))
+    if (
+        not isinstance(method, ListMethod)
+        or method.constraints
+        or reader.next_char() != "["
+    ):
+        return method.deserialize(json.loads(reader.buffer))
+    values = []
+    elt_errors: Dict[ErrorKey, ValidationError] = {}
+    for i, elt in enumerate(reader.array_elements()):
+        try:
+            values.append(method.value_method.deserialize(elt))
+        except ValidationError as err:
+            elt_errors[i] = err
+    if elt_errors:
+        raise ValidationError([], elt_errors)
+    return values
+
+
+@overload
+def iter_deserialize(
+    type: Type[T],
+    fp: IO,
+    *,
+    lines: bool = False,
+    additional_properties: Optional[bool] = None,
+    aliaser: Optional[Aliaser] = None,
+    coerce: Optional[Coerce] = None,
+    conversion: Optional[AnyConversion] = None,
+    default_conversion: Optional[DefaultConversion] = None,
+    fall_back_on_default: Optional[bool] = None,
+    no_copy: Optional[bool] = None,
+    pass_through: Optional[CollectionOrPredicate[type]] = None,
+    schema: Optional[Schema] = None,
+    validators: Collection[Callable] = ()
+) -> Iterator[T]:
+    ...
+
+
+@overload
+def iter_deserialize(
+    type: AnyType,
+    fp: IO,
+    *,
+    lines: bool = False,
+    additional_properties: Optional[bool] = None,
+    aliaser: Optional[Aliaser] = None,
+    coerce: Optional[Coerce] = None,
+    conversion: Optional[AnyConversion] = None,
+    default_conversion: Optional[DefaultConversion] = None,
+    fall_back_on_default: Optional[bool] = None,
+    no_copy: Optional[bool] = None,
+    pass_through: Optional[CollectionOrPredicate[type]] = None,
+    schema: Optional[Schema] = None,
+    validators: Collection[Callable] = ()
+) -> Iterator[Any]:
+    ...
+
+
+def iter_deserialize(
+    type: AnyType,
+    fp: IO,
+    *,
+    lines: bool = False,
+    additional_properties: Optional[bool] = None,
+    aliaser: Optional[Aliaser] = None,
+    coerce: Optional[Coerce] = None,
+    conversion: Optional[AnyConversion] = None,
+    default_conversion: Optional[DefaultConversion] = None,
+    fall_back_on_default: Optional[bool] = None,
+    no_copy: Optional[bool] = None,
+    pass_through: Optional[CollectionOrPredicate[type]] = None,
+    schema: Optional[Schema] = None,
+    validators: Collection[Callable] = ()
+) -> Iterator[Any]:
+    """Read a JSON array (or JSON lines if lines is true) from fp and yield its
+    elements deserialized with type, one by one."""
+    method = _deserialization_method_factory(
+        type,
+        additional_properties,
+        aliaser,
+        coerce,
+        conversion,
+        default_conversion,
+        fall_back_on_default,
+        no_copy,
+        pass_through,
+        schema,
+        validators,
+    ).method
+    elts: Iterator[Any]
+    if lines:
+        elts = (json.loads(line) for line in fp if line.strip())
+    else:
+        elts = JSONReader(fp).array_elements()
+    for i, elt in enumerate(elts):
+        try:
+            value = method.deserialize(elt)
+        except ValidationError as err:
+            raise ValidationError([], {i: err}) from None
+        yield value
@@ -11,9 +11,10 @@ from typing import (
     Sequence,
     TypeVar,
     Union,
+    cast,
 )
 
-from apischema.cache import CacheAwareDict
+from apischema.cache import Cache, CacheAwareDict, cache
 from apischema.conversions import Conversion, deserializer, serializer
 from apischema.metadata.keys import DISCRIMINATOR_METADATA
 from apischema.objects import object_fields
@@ -148,3 +149,27 @@ def get_inherited_discriminator(types: Iterable[AnyType]) -> Optional[Discrimina
     for cls in reduce(operator.and_, discriminators):
         return _discriminators[cls]
     return None
+
+
+@cache
+def _inferred_discriminator(union: AnyType) -> Optional[str]:
+    # entries are added by the deserialization methods, and removed with them when
+    # the caches are reset/invalidated
+    return None
+
+
+def record_inferred_discriminator(types: Sequence[AnyType], alias: str):
+    cast(Cache, _inferred_discriminator).preload(
+        (Union[tuple(types)],), alias, frozenset(types)
+    )
+
+
+def inferred_discriminators() -> Mapping[AnyType, str]:
+    """Unions whose deserialization has been optimized by dispatching on the value
+    of a literal field shared by all their alternatives (see
+    settings.deserialization.infer_discriminator), with the alias of this field."""
+    return {
+        key[0]: alias  # type: ignore
+        for key, alias, _ in cast(Cache, _inferred_discriminator).entries()
+        if alias is not None
+    }
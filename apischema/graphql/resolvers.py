@@ -1,7 +1,6 @@
 from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
-from functools import lru_cache
 from inspect import Parameter, signature
 from typing import (
     Any,
@@ -98,7 +97,7 @@ def partial_serialization_method_factory(
     conversion: Optional[AnyConversion],
     default_conversion: DefaultConversion,
 ) -> Callable[[AnyType], SerializationMethod]:
-    @lru_cache()
+    @cache
     def factory(tp: AnyType) -> SerializationMethod:
         return PartialSerializationMethodVisitor(
             aliaser, default_conversion, PassThroughOptions()
@@ -0,0 +1,283 @@
+__all__ = ["fingerprint", "load", "save"]
+import hashlib
+import importlib
+import io
+import os
+import pickle
+import stat
+import sys
+import warnings
+from pathlib import Path
+from types import CodeType, ModuleType
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+from apischema.cache import AllKeys, Cache
+from apischema.deserialization import (
+    DeserializationMethodFactory,
+    deserialization_method_factory,
+)
+from apischema.deserialization.methods import DeserializationMethod
+from apischema.serialization import serialization_method_factory
+from apischema.settings import settings
+from apischema.typing import is_new_type
+from apischema.validation.validators import Validator
+
+SIMPLE_TYPES = (bool, int, float, str, type(None))
+
+
+def settings_values(cls: type = settings, path: str = "settings") -> Iterator[Tuple]:
+    for name, value in sorted(vars(cls).items()):
+        if name.startswith("_"):
+            continue
+        if isinstance(value, type) and value.__qualname__.startswith("settings."):
+            yield from settings_values(value, f"{path}.{name}")
+        else:
+            yield f"{path}.{name}", value
+
+
+def qualified_name(value: Any) -> str:
+    if isinstance(value, SIMPLE_TYPES) or not hasattr(value, "__qualname__"):
+        return repr(value)
+    return f"{getattr(value, '__module__', None)}.{value.__qualname__}"
+
+
+def describe(value: Any) -> str:
+    """Description of a settings value; functions are described by their code, as
+    different lambdas share the same qualified name"""
+    if isinstance(value, tuple):
+        return f"({', '.join(map(describe, value))})"
+    if isinstance(value, frozenset):  # str hashes, thus iteration order, are random
+        return f"{{{', '.join(sorted(map(describe, value)))}}}"
+    if isinstance(value, CodeType):
+        return describe((value.co_code, value.co_consts, value.co_names))
+    code = getattr(value, "__code__", None)
+    if not isinstance(code, CodeType):
+        return qualified_name(value)
+    # functions of the closure/defaults are only named, as they could be recursive
+    closure = [qualified_name(cell.cell_contents) for cell in value.__closure__ or ()]
+    defaults = list(map(qualified_name, value.__defaults__ or ()))
+    return f"{qualified_name(value)}{describe(code)}{closure}{defaults}"
+
+
+def fingerprint(*modules: Union[ModuleType, str, Path]) -> str:
+    """Fingerprint of apischema and the given modules (or source files) sources, the
+    Python version and the settings; persisted methods are only loaded with the same
+    fingerprint"""
+    hasher = hashlib.sha256(sys.version.encode())
+    sources = sorted(Path(__file__).parent.rglob("*.py"))
+    for module in modules:
+        if isinstance(module, ModuleType):
+            if module.__file__ is not None:
+                sources.append(Path(module.__file__))
+        else:
+            sources.append(Path(module))
+    for source in sources:
+        hasher.update(source.read_bytes())
+    for path, value in settings_values():
+        hasher.update(f"{path}={describe(value)}".encode())
+    return hasher.hexdigest()
+
+
+class PrecomputedFactory:
+    """Factory returning the loaded method, unless constraints/validators have been
+    merged; the actual factory is then recomputed"""
+
+    def __init__(
+        self,
+        key: tuple,
+        method: DeserializationMethod,
+        constraints: Any,
+        validators: Tuple[Validator, ...],
+    ):
+        self.key = key
+        self.method = method
+        self.constraints = constraints
+        self.validators = validators
+
+    def __call__(
+        self, constraints: Any, validators: Sequence[Validator]
+    ) -> DeserializationMethod:
+        if constraints == self.constraints and tuple(validators) == self.validators:
+            return self.method
+        factory = deserialization_method_factory.__wrapped__(*self.key)  # type: ignore
+        return factory.factory(constraints, validators)
+
+
+def settings_ids() -> Dict[int, Tuple[Hashable, Any]]:
+    # Settings values (e.g. lambda aliaser) are persisted by reference
+    return {
+        id(value): (path, value)
+        for path, value in settings_values()
+        if not isinstance(value, SIMPLE_TYPES)
+    }
+
+
+def module_reference(obj: Any) -> Optional[Tuple[str, str]]:
+    # Before Python 3.10, NewType returns a local function of typing module, which
+    # cannot be pickled; it's persisted by reference to the module defining it
+    name = getattr(obj, "__name__", None)
+    modules = list(sys.modules.items())
+    if getattr(obj, "__module__", None) in sys.modules:
+        modules.insert(0, (obj.__module__, sys.modules[obj.__module__]))
+    for module_name, module in modules:
+        if isinstance(name, str) and getattr(module, name, None) is obj:
+            return module_name, name
+    return None
+
+
+class Pickler(pickle.Pickler):
+    def __init__(self, file, persistent: Dict[int, Tuple[Hashable, Any]]):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.persistent = persistent
+
+    def persistent_id(self, obj: Any) -> Optional[Hashable]:
+        if id(obj) in self.persistent:
+            pid, persisted = self.persistent[id(obj)]
+            if obj is persisted:
+                return pid
+        if is_new_type(obj):
+            reference = module_reference(obj)
+            if reference is not None:
+                self.persistent[id(obj)] = (reference, obj)
+            return reference
+        return None
+
+
+class Unpickler(pickle.Unpickler):
+    def __init__(self, file, persistent: Dict[Hashable, Any]):
+        super().__init__(file)
+        self.persistent = persistent
+
+    def persistent_load(self, pid: Hashable) -> Any:
+        if isinstance(pid, tuple):
+            module_name, name = pid
+            return getattr(importlib.import_module(module_name), name)
+        return self.persistent[pid]
+
+
+def dumps(obj: Any, persistent: Dict[int, Tuple[Hashable, Any]]) -> Optional[bytes]:
+    file = io.BytesIO()
+    try:
+        Pickler(file, persistent).dump(obj)
+    except Exception:
+        return None
+    return file.getvalue()
+
+
+def loads(data: bytes, persistent: Dict[Hashable, Any]) -> Any:
+    return Unpickler(io.BytesIO(data), persistent).load()
+
+
+def save(path: str, fingerprint: str) -> int:
+    """Save the (de)serialization methods currently cached into path, and return
+    their number; methods which cannot be pickled (e.g. using lambdas or recursive)
+    are skipped."""
+    persistent = settings_ids()
+    ser_factories: List[bytes] = []
+    deserialization, serialization = [], []
+    for key, factory, deps in cast(Cache, deserialization_method_factory).entries():
+        if any(isinstance(dep, AllKeys) for dep in deps):
+            continue
+        assert isinstance(factory, DeserializationMethodFactory)
+        data = dumps(
+            (key, factory.cls, factory.constraints, factory.validators, deps),
+            persistent,
+        )
+        method_data = dumps(factory.method, persistent)
+        if data is not None and method_data is not None:
+            deserialization.append((data, method_data))
+    for key, inner, _ in cast(Cache, serialization_method_factory).entries():
+        data = dumps(key, persistent)
+        if data is None:
+            continue
+        # serialization methods can reference the factory (e.g. AnyMethod)
+        persistent[id(inner)] = (len(ser_factories), inner)
+        ser_factories.append(data)
+        for (tp,), method, deps in inner.entries():
+            if not any(isinstance(dep, AllKeys) for dep in deps):
+                entry = dumps((len(ser_factories) - 1, tp, deps), persistent)
+                method_data = dumps(method, persistent)
+                if entry is not None and method_data is not None:
+                    serialization.append((entry, method_data))
+    content = {
+        "fingerprint": fingerprint,
+        "deserialization": deserialization,
+        "serialization_factories": ser_factories,
+        "serialization": serialization,
+    }
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    # only writable by its owner, see trusted
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as file:
+        pickle.dump(content, file, pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return len(deserialization) + len(serialization)
+
+
+def trusted(fd: int) -> bool:
+    """Whether the file is owned by the current user (or root) and not writable by
+    other users; unpickling it can execute arbitrary code."""
+    if not hasattr(os, "getuid"):  # pragma: no cover windows
+        return True
+    file_stat = os.fstat(fd)
+    return file_stat.st_uid in (os.getuid(), 0) and not (
+        file_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    )
+
+
+def load(path: str, fingerprint: str) -> int:
+    """Load the methods saved into path, if its fingerprint matches, and return their
+    number; entries which cannot be unpickled are skipped.
+
+    The file is unpickled, so it must be trusted: files writable by other users are
+    not loaded."""
+    try:
+        with open(path, "rb") as file:
+            if not trusted(file.fileno()):
+                warnings.warn(f"{path} is writable by other users, it is not loaded")
+                return 0
+            content = pickle.load(file)
+    except Exception:
+        return 0
+    if not isinstance(content, dict) or content.get("fingerprint") != fingerprint:
+        return 0
+    persistent: Dict[Hashable, Any] = dict(settings_ids().values())
+    count = 0
+    for data, method in content["deserialization"]:
+        try:
+            key, cls, constraints, validators, deps = loads(data, persistent)
+            precomputed = PrecomputedFactory(
+                key, loads(method, persistent), constraints, validators
+            )
+        except Exception:
+            continue
+        factory = DeserializationMethodFactory(
+            precomputed, cls, constraints, validators
+        )
+        cast(Cache, deserialization_method_factory).preload(key, factory, deps)
+        count += 1
+    for i, data in enumerate(content["serialization_factories"]):
+        try:
+            persistent[i] = serialization_method_factory(*loads(data, persistent))
+        except Exception:
+            pass
+    for entry, method in content["serialization"]:
+        try:
+            index, tp, deps = loads(entry, persistent)
+            inner: Cache = persistent[index]
+            inner.preload((tp,), loads(method, persistent), deps)
+        except Exception:
+            continue
+        count += 1
+    return count
@@ -1,8 +1,12 @@
+import threading
+from contextlib import contextmanager
 from enum import Enum
 from typing import (
     Any,
     Collection,
     Dict,
+    Hashable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -10,9 +14,10 @@ from typing import (
     Set,
     Tuple,
     Type,
+    TypeVar,
 )
 
-from apischema.cache import cache
+from apischema.cache import cache, volatile_cache
 from apischema.conversions import AnyConversion
 from apischema.conversions.conversions import DefaultConversion
 from apischema.conversions.visitor import (
@@ -34,6 +39,7 @@ from apischema.utils import Lazy
 from apischema.visitor import Result
 
 RecursionKey = Tuple[AnyType, Optional[AnyConversion]]
+T = TypeVar("T")
 
 
 class RecursiveChecker(ConversionsVisitor[Conv, Any], ObjectVisitor[Any]):
@@ -116,7 +122,7 @@ class SerializationRecursiveChecker(
     pass
 
 
-@cache  # use @cache for reset
+@volatile_cache  # use @volatile_cache for reset/invalidation
 def recursion_cache(checker_cls: Type[RecursiveChecker]) -> Dict[RecursionKey, bool]:
     return {}
 
@@ -134,12 +140,39 @@ def is_recursive(
     return cache[rec_key]
 
 
+class CollectedRecMethods(threading.local):
+    methods: Optional[List[Any]] = None
+
+
+_collected = CollectedRecMethods()
+
+
+@contextmanager
+def collect_rec_methods() -> Iterator[List[Any]]:
+    """Collect the recursive methods (whose lazy is resolved at first use) created
+    in the context, in order to resolve them eagerly"""
+    previous, _collected.methods = _collected.methods, []
+    try:
+        yield _collected.methods
+    finally:
+        _collected.methods = previous
+
+
+def add_rec_method(method: T) -> T:
+    if _collected.methods is not None:
+        _collected.methods.append(method)
+    return method
+
+
 class RecursiveConversionsVisitor(ConversionsVisitor[Conv, Result]):
     def __init__(self, default_conversion: DefaultConversion):
         super().__init__(default_conversion)
-        self._cache: Dict[Tuple[AnyType, Optional[AnyConversion]], Result] = {}
+        self._cache: Dict[Hashable, Result] = {}
         self._first_visit = True
 
+    def _recursion_key(self, tp: AnyType) -> Hashable:
+        return tp, self._conversion
+
     def _recursive_result(self, lazy: Lazy[Result]) -> Result:
         raise NotImplementedError
 
@@ -155,7 +188,7 @@ class RecursiveConversionsVisitor(ConversionsVisitor[Conv, Result]):
             if isinstance(self, DeserializationVisitor)
             else SerializationRecursiveChecker,
         ):
-            cache_key = tp, self._conversion
+            cache_key = self._recursion_key(tp)
             if cache_key in self._cache:
                 return self._cache[cache_key]
             result = None
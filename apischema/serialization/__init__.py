@@ -2,7 +2,6 @@ import collections.abc
 from contextlib import suppress
 from dataclasses import dataclass, is_dataclass
 from enum import Enum
-from functools import lru_cache
 from typing import (
     Any,
     Callable,
@@ -30,7 +29,8 @@ from apischema.metadata.keys import DISCRIMINATOR_METADATA
 from apischema.objects import AliasedStr, ObjectField, object_fields
 from apischema.objects.visitor import SerializationObjectVisitor
 from apischema.ordering import Ordering, sort_by_order
-from apischema.recursion import RecursiveConversionsVisitor
+from apischema.recursion import RecursiveConversionsVisitor, add_rec_method
+from apischema.serialization.codegen import generated_method
 from apischema.serialization.methods import (
     AnyFallback,
     AnyMethod,
@@ -68,6 +68,7 @@ from apischema.serialization.methods import (
     TupleMethod,
     TypeCheckIdentityMethod,
     TypeCheckMethod,
+    TypeDispatchUnionMethod,
     UnionAlternative,
     UnionMethod,
     ValueMethod,
@@ -92,6 +93,7 @@ from apischema.utils import (
     get_origin_or_type,
     get_origin_or_type2,
     identity,
+    intern,
     is_union_of,
     opt_or,
 )
@@ -115,6 +117,21 @@ SerializationMethodFactory = Callable[[AnyType], SerializationMethod]
 T = TypeVar("T")
 
 
+def type_dispatchable(cls: type) -> bool:
+    """Whether isinstance result only depends on the type of the object; it's not
+    the case of ABCMeta, whose classes can register virtual subclasses afterwards"""
+    return type(cls).__instancecheck__ is type.__instancecheck__
+
+
+def union_method(
+    alternatives: Sequence[UnionAlternative], fallback: Fallback
+) -> SerializationMethod:
+    if all(type_dispatchable(alt.cls) for alt in alternatives):
+        return TypeDispatchUnionMethod(tuple(alternatives), fallback)
+    else:
+        return UnionMethod(tuple(alternatives), fallback)
+
+
 def expected_class(tp: AnyType) -> type:
     origin = get_origin_or_type2(tp)
     if origin is NoneType:
@@ -169,7 +186,7 @@ def check_only(method: SerializationMethod) -> bool:
         or (isinstance(method, TypeCheckMethod) and check_only(method.method))
         or (isinstance(method, OptionalMethod) and check_only(method.value_method))
         or (
-            isinstance(method, UnionMethod)
+            isinstance(method, (TypeDispatchUnionMethod, UnionMethod))
             and all(check_only(alt.method) for alt in method.alternatives)
         )
     )
@@ -228,7 +245,7 @@ class SerializationMethodVisitor(
         return self._factory(tp) if self.use_cache else super().visit_not_recursive(tp)
 
     def _recursive_result(self, lazy: Lazy[SerializationMethod]) -> SerializationMethod:
-        return RecMethod(lazy)
+        return add_rec_method(RecMethod(lazy))
 
     def discriminate(self, discriminator: Discriminator, types: Sequence[Type]):
         fallback = self._any_fallback(Union[types])
@@ -249,13 +266,13 @@ class SerializationMethodVisitor(
                     fallback,
                 )
         else:
-            return UnionMethod(
-                tuple(
+            return union_method(
+                [
                     DiscriminatedAlternative(
                         expected_class(tp), self.visit(tp), discriminator.alias, key
                     )
                     for key, tp in discriminator.get_mapping(types).items()
-                ),
+                ],
                 fallback,
             )
 
@@ -361,7 +378,9 @@ class SerializationMethodVisitor(
         exclude_unset = self.exclude_unset and support_fields_set(cls)
         typed_dict = is_typed_dict(cls)
         for field in fields:
-            field_alias = self.aliaser(field.alias) if not field.is_aggregate else None
+            field_alias = (
+                intern(self.aliaser(field.alias)) if not field.is_aggregate else None
+            )
             field_method = self.visit_with_conv(field.type, field.serialization)
             field_default = ... if field.required else field.get_default()
             base_field: BaseField
@@ -401,7 +420,7 @@ class SerializationMethodVisitor(
                     serialized.ordering,
                     SerializedField(
                         serialized.func.__name__,
-                        self.aliaser(serialized.alias),
+                        intern(self.aliaser(serialized.alias)),
                         serialized.func,
                         is_union_of(ret_type, UndefinedType),
                         is_union_of(ret_type, NoneType) and self.exclude_none,
@@ -433,6 +452,10 @@ class SerializationMethodVisitor(
             method = IDENTITY_METHOD
         else:
             method = SimpleObjectMethod(tuple(f.name for f in base_fields))
+        from apischema import settings
+
+        if settings.serialization.codegen:
+            method = generated_method(method, cls)
         return self._wrap(cls, method)
 
     def primitive(self, cls: Type) -> SerializationMethod:
@@ -481,8 +504,9 @@ class SerializationMethodVisitor(
                 next(meth for meth, alt in alternatives if alt.cls is not NoneType)
             )
         else:
-            fallback = self._any_fallback(Union[types])
-            return UnionMethod(tuple(alt for _, alt in alternatives), fallback)
+            return union_method(
+                [alt for _, alt in alternatives], self._any_fallback(Union[types])
+            )
 
     def unsupported(self, tp: AnyType) -> SerializationMethod:
         try:
@@ -541,7 +565,7 @@ def serialization_method_factory(
     no_copy: bool,
     pass_through: PassThroughOptions,
 ) -> SerializationMethodFactory:
-    @lru_cache()
+    @cache
     def factory(tp: AnyType) -> SerializationMethod:
         return SerializationMethodVisitor(
             additional_properties,
@@ -559,6 +583,37 @@ def serialization_method_factory(
     return factory
 
 
+def _serialization_method(
+    type: AnyType,
+    additional_properties: Optional[bool],
+    aliaser: Optional[Aliaser],
+    check_type: Optional[bool],
+    conversion: Optional[AnyConversion],
+    default_conversion: Optional[DefaultConversion],
+    exclude_defaults: Optional[bool],
+    exclude_none: Optional[bool],
+    exclude_unset: Optional[bool],
+    fall_back_on_any: Optional[bool],
+    no_copy: Optional[bool],
+    pass_through: Optional[PassThroughOptions],
+) -> SerializationMethod:
+    from apischema import settings
+
+    return serialization_method_factory(
+        opt_or(additional_properties, settings.additional_properties),
+        opt_or(aliaser, settings.aliaser),
+        opt_or(check_type, settings.serialization.check_type),
+        conversion,
+        opt_or(default_conversion, settings.serialization.default_conversion),
+        opt_or(exclude_defaults, settings.serialization.exclude_defaults),
+        opt_or(exclude_none, settings.serialization.exclude_none),
+        opt_or(exclude_unset, settings.serialization.exclude_unset),
+        opt_or(fall_back_on_any, settings.serialization.fall_back_on_any),
+        opt_or(no_copy, settings.serialization.no_copy),
+        opt_or(pass_through, settings.serialization.pass_through),
+    )(type)
+
+
 def serialization_method(
     type: AnyType,
     *,
@@ -574,21 +629,20 @@ def serialization_method(
     no_copy: Optional[bool] = None,
     pass_through: Optional[PassThroughOptions] = None,
 ) -> Callable[[Any], Any]:
-    from apischema import settings
-
-    method = serialization_method_factory(
-        opt_or(additional_properties, settings.additional_properties),
-        opt_or(aliaser, settings.aliaser),
-        opt_or(check_type, settings.serialization.check_type),
+    method = _serialization_method(
+        type,
+        additional_properties,
+        aliaser,
+        check_type,
         conversion,
-        opt_or(default_conversion, settings.serialization.default_conversion),
-        opt_or(exclude_defaults, settings.serialization.exclude_defaults),
-        opt_or(exclude_none, settings.serialization.exclude_none),
-        opt_or(exclude_unset, settings.serialization.exclude_unset),
-        opt_or(fall_back_on_any, settings.serialization.fall_back_on_any),
-        opt_or(no_copy, settings.serialization.no_copy),
-        opt_or(pass_through, settings.serialization.pass_through),
-    )(type)
+        default_conversion,
+        exclude_defaults,
+        exclude_none,
+        exclude_unset,
+        fall_back_on_any,
+        no_copy,
+        pass_through,
+    )
     return optimized_identity if method is IDENTITY_METHOD else method.serialize  # type: ignore
 
 
@@ -0,0 +1,158 @@
+import keyword
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from apischema.fields import FIELDS_SET_ATTR
+from apischema.serialization.methods import (
+    BaseField,
+    ComplexField,
+    GeneratedMethod,
+    IdentityField,
+    IdentityMethod,
+    ObjectMethod,
+    SerializationMethod,
+    SerializedField,
+    SimpleField,
+    SimpleObjectMethod,
+)
+from apischema.types import Undefined
+
+
+def indent(lines: List[str]) -> List[str]:
+    return ["    " + line for line in lines]
+
+
+def get_attribute(name: str) -> str:
+    if name.isidentifier() and not keyword.iskeyword(name):
+        return f"obj.{name}"
+    else:
+        return f"getattr(obj, {name!r})"
+
+
+def serialize_expression(
+    index: int,
+    method: SerializationMethod,
+    value: str,
+    alias: Optional[str],
+    namespace: Dict[str, Any],
+) -> str:
+    if isinstance(method, IdentityMethod):
+        return value
+    namespace[f"serialize{index}"] = method.serialize
+    return f"serialize{index}({value}, {alias!r})"
+
+
+def field_lines(index: int, field: BaseField, namespace: Dict[str, Any]) -> List[str]:
+    """Lines updating `result` dictionary with the serialized field"""
+    if isinstance(field, IdentityField):
+        return [f"result[{field.alias!r}] = {get_attribute(field.name)}"]
+    elif isinstance(field, SimpleField):
+        value = serialize_expression(
+            index, field.method, get_attribute(field.name), field.alias, namespace
+        )
+        return [f"result[{field.alias!r}] = {value}"]
+    elif isinstance(field, (ComplexField, SerializedField)):
+        return conditional_field_lines(index, field, namespace)
+    else:
+        raise NotImplementedError
+
+
+def conditional_field_lines(
+    index: int, field: Union[ComplexField, SerializedField], namespace: Dict[str, Any]
+) -> List[str]:
+    conditions, skip_conditions = [], []
+    if isinstance(field, SerializedField):
+        namespace[f"func{index}"] = field.func
+        value = f"func{index}(obj)"
+    elif field.typed_dict:
+        if not field.required:
+            conditions.append(f"{field.name!r} in obj")
+        value = f"obj[{field.name!r}]"
+    else:
+        if field.exclude_unset:
+            conditions.append(f"{field.name!r} in fields_set")
+        value = get_attribute(field.name)
+    if isinstance(field, ComplexField) and field.skip_if is not None:
+        namespace[f"skip_if{index}"] = field.skip_if
+        skip_conditions.append(f"skip_if{index}(value)")
+    if field.undefined:
+        skip_conditions.append("value is Undefined")
+    if field.skip_none:
+        skip_conditions.append("value is None")
+    if isinstance(field, ComplexField) and field.skip_default:
+        namespace[f"default{index}"] = field.default_value
+        skip_conditions.append(f"value == default{index}")
+    serialized = serialize_expression(
+        index,
+        field.method,
+        "value" if skip_conditions else value,
+        field.alias,
+        namespace,
+    )
+    if field.alias is not None:
+        lines = [f"result[{field.alias!r}] = {serialized}"]
+    else:
+        lines = [f"result.update({serialized})"]
+    if skip_conditions:
+        lines = [
+            f"value = {value}",
+            f"if not ({' or '.join(skip_conditions)}):",
+            *indent(lines),
+        ]
+    if conditions:
+        lines = [f"if {' and '.join(conditions)}:", *indent(lines)]
+    return lines
+
+
+def object_lines(method: ObjectMethod, namespace: Dict[str, Any]) -> List[str]:
+    lines = []
+    if any(isinstance(f, ComplexField) and f.exclude_unset for f in method.fields):
+        lines.append("fields_set = getattr(obj, FIELDS_SET_ATTR)")
+    # Fields which are always serialized are put in the dictionary literal, until
+    # the first conditional field, in order to keep the fields order
+    entries = []
+    for i, field in enumerate(method.fields):
+        if isinstance(field, IdentityField):
+            entries.append(f"{field.alias!r}: {get_attribute(field.name)}")
+        elif isinstance(field, SimpleField):
+            value = serialize_expression(
+                i, field.method, get_attribute(field.name), field.alias, namespace
+            )
+            entries.append(f"{field.alias!r}: {value}")
+        else:
+            break
+    lines.append(f"result = {{{', '.join(entries)}}}")
+    for i, field in enumerate(method.fields[len(entries) :], len(entries)):
+        lines += field_lines(i, field, namespace)
+    lines.append("return result")
+    return lines
+
+
+def generate_serialization(
+    method: SerializationMethod, cls: type
+) -> Optional[Callable[[Any], Any]]:
+    """Generate the source of a function equivalent to the object method, with
+    fields skipping conditions inlined, and compile it"""
+    namespace: Dict[str, Any] = {
+        "FIELDS_SET_ATTR": FIELDS_SET_ATTR,
+        "Undefined": Undefined,
+    }
+    if isinstance(method, SimpleObjectMethod):
+        entries = [f"{name!r}: {get_attribute(name)}" for name in method.fields]
+        lines = [f"return {{{', '.join(entries)}}}"]
+    # ObjectAdditionalMethod keeps the generic implementation; repr of str
+    # subclasses (e.g. str Enum) aliases is not a literal
+    elif type(method) == ObjectMethod and all(
+        field.alias is None or type(field.alias) is str for field in method.fields
+    ):
+        lines = object_lines(method, namespace)
+    else:
+        return None
+    source = "\n".join(["def serialize(obj):", *indent(lines)])
+    filename = f"<serialization of {getattr(cls, '__qualname__', cls)}>"
+    exec(compile(source, filename, "exec"), namespace)
+    return namespace["serialize"]
+
+
+def generated_method(method: SerializationMethod, cls: type) -> SerializationMethod:
+    generated = generate_serialization(method, cls)
+    return method if generated is None else GeneratedMethod(method, generated)
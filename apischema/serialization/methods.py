@@ -1,3 +1,4 @@
+import threading
 from dataclasses import dataclass, field
 from typing import AbstractSet, Any, Callable, Dict, Optional, Tuple, Union
 
@@ -5,68 +6,89 @@ from apischema.conversions.utils import Converter
 from apischema.fields import FIELDS_SET_ATTR
 from apischema.serialization.errors import TypeCheckError
 from apischema.types import AnyType, Undefined
-from apischema.utils import Lazy
+from apischema.utils import TYPE_DISPATCH_MEMO_SIZE, Lazy, with_slots
 
 
+@with_slots
 class SerializationMethod:
     def serialize(self, obj: Any, path: Union[int, str, None] = None) -> Any:
         raise NotImplementedError
 
 
+@with_slots
 class IdentityMethod(SerializationMethod):
     def serialize(self, obj: Any, path: Union[int, str, None] = None) -> Any:
         return obj
 
 
+@with_slots
 class ListMethod(SerializationMethod):
     def serialize(self, obj: Any, path: Union[int, str, None] = None) -> Any:
         return list(obj)
 
 
+@with_slots
 class DictMethod(SerializationMethod):
     def serialize(self, obj: Any, path: Union[int, str, None] = None) -> Any:
         return dict(obj)
 
 
+@with_slots
 class StrMethod(SerializationMethod):
     def serialize(self, obj: Any, path: Union[int, str, None] = None) -> Any:
         return str(obj)
 
 
+@with_slots
 class IntMethod(SerializationMethod):
     def serialize(self, obj: Any, path: Union[int, str, None] = None) -> Any:
         return int(obj)
 
 
+@with_slots
 class BoolMethod(SerializationMethod):
     def serialize(self, obj: Any, path: Union[int, str, None] = None) -> Any:
         return bool(obj)
 
 
+@with_slots
 class FloatMethod(SerializationMethod):
     def serialize(self, obj: Any, path: Union[int, str, None] = None) -> Any:
         return float(obj)
 
 
+@with_slots
 class NoneMethod(SerializationMethod):
     def serialize(self, obj: Any, path: Union[int, str, None] = None) -> Any:
         return None
 
 
+@with_slots
 @dataclass
 class RecMethod(SerializationMethod):
     lazy: Lazy[SerializationMethod]
     method: Optional[SerializationMethod] = field(init=False)
+    lock: Any = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         self.method = None
+        self.lock = threading.RLock()
 
     def serialize(self, obj: Any, path: Union[int, str, None] = None) -> Any:
         if self.method is None:
-            self.method = self.lazy()
+            return resolve_rec_method(self).serialize(obj)
         return self.method.serialize(obj)
 
 
+def resolve_rec_method(method: RecMethod) -> SerializationMethod:
+    # lazy is called only once, even by concurrent first uses
+    with method.lock:
+        if method.method is None:
+            method.method = method.lazy()
+        return method.method
+
+
+@with_slots
 @dataclass
 class AnyMethod(SerializationMethod):
     factory: Callable[[AnyType], SerializationMethod]
@@ -76,11 +98,13 @@ class AnyMethod(SerializationMethod):
         return method.serialize(obj, path)
 
 
+@with_slots
 class Fallback:
     def fall_back(self, obj: Any, path: Union[int, str, None]) -> Any:
         raise NotImplementedError
 
 
+@with_slots
 @dataclass
 class NoFallback(Fallback):
     tp: AnyType
@@ -92,6 +116,7 @@ class NoFallback(Fallback):
         )
 
 
+@with_slots
 @dataclass
 class AnyFallback(Fallback):
     any_method: SerializationMethod
@@ -100,6 +125,7 @@ class AnyFallback(Fallback):
         return self.any_method.serialize(obj, key)
 
 
+@with_slots
 @dataclass
 class TypeCheckIdentityMethod(SerializationMethod):
     expected: AnyType  # `type` would require exact match (i.e. no EnumMeta)
@@ -113,6 +139,7 @@ class TypeCheckIdentityMethod(SerializationMethod):
         )
 
 
+@with_slots
 @dataclass
 class TypeCheckMethod(SerializationMethod):
     method: SerializationMethod
@@ -131,6 +158,7 @@ class TypeCheckMethod(SerializationMethod):
             return self.fallback.fall_back(obj, path)
 
 
+@with_slots
 @dataclass
 class CollectionCheckOnlyMethod(SerializationMethod):
     value_method: SerializationMethod
@@ -141,6 +169,7 @@ class CollectionCheckOnlyMethod(SerializationMethod):
         return obj
 
 
+@with_slots
 @dataclass
 class CollectionMethod(SerializationMethod):
     value_method: SerializationMethod
@@ -149,11 +178,13 @@ class CollectionMethod(SerializationMethod):
         return [self.value_method.serialize(elt, i) for i, elt in enumerate(obj)]
 
 
+@with_slots
 class ValueMethod(SerializationMethod):
     def serialize(self, obj: Any, path: Union[int, str, None] = None) -> Any:
         return obj.value
 
 
+@with_slots
 @dataclass
 class EnumMethod(SerializationMethod):
     any_method: AnyMethod
@@ -162,6 +193,7 @@ class EnumMethod(SerializationMethod):
         return self.any_method.serialize(obj.value)
 
 
+@with_slots
 @dataclass
 class MappingCheckOnlyMethod(SerializationMethod):
     key_method: SerializationMethod
@@ -174,6 +206,7 @@ class MappingCheckOnlyMethod(SerializationMethod):
         return obj
 
 
+@with_slots
 @dataclass
 class MappingMethod(SerializationMethod):
     key_method: SerializationMethod
@@ -186,6 +219,7 @@ class MappingMethod(SerializationMethod):
         }
 
 
+@with_slots
 @dataclass
 class BaseField:
     name: str
@@ -195,12 +229,14 @@ class BaseField:
         raise NotImplementedError
 
 
+@with_slots
 @dataclass
 class IdentityField(BaseField):
     def update_result(self, obj: Any, result: dict):
         result[self.alias] = getattr(obj, self.name)
 
 
+@with_slots
 @dataclass
 class SimpleField(BaseField):
     method: SerializationMethod
@@ -209,6 +245,7 @@ class SimpleField(BaseField):
         result[self.alias] = self.method.serialize(getattr(obj, self.name), self.alias)
 
 
+@with_slots
 @dataclass
 class ComplexField(BaseField):
     method: SerializationMethod
@@ -248,6 +285,7 @@ class ComplexField(BaseField):
                     result.update(self.method.serialize(value, self.alias))
 
 
+@with_slots
 @dataclass
 class SerializedField(BaseField):
     func: Callable[[Any], Any]
@@ -263,6 +301,7 @@ class SerializedField(BaseField):
             result[self.alias] = self.method.serialize(value, self.alias)
 
 
+@with_slots
 @dataclass
 class SimpleObjectMethod(SerializationMethod):
     fields: Tuple[str, ...]
@@ -271,18 +310,30 @@ class SimpleObjectMethod(SerializationMethod):
         return {name: getattr(obj, name) for name in self.fields}
 
 
+@with_slots
 @dataclass
 class ObjectMethod(SerializationMethod):
     fields: Tuple[BaseField, ...]
+    prototype: dict = field(init=False)
+
+    def __post_init__(self):
+        # Keys of the leading fields always serialized, in order; copying this
+        # presized dict is cheaper than growing a new one key by key
+        self.prototype = {}
+        for i in range(len(self.fields)):
+            if not isinstance(self.fields[i], (IdentityField, SimpleField)):
+                break
+            self.prototype[self.fields[i].alias] = None
 
     def serialize(self, obj: Any, path: Union[int, str, None] = None) -> Any:
-        result: dict = {}
+        result: dict = self.prototype.copy()
         for i in range(len(self.fields)):
             field: BaseField = self.fields[i]
             field.update_result(obj, result)
         return result
 
 
+@with_slots
 @dataclass
 class ObjectAdditionalMethod(ObjectMethod):
     field_names: AbstractSet[str]
@@ -296,6 +347,17 @@ class ObjectAdditionalMethod(ObjectMethod):
         return result
 
 
+@with_slots
+@dataclass
+class GeneratedMethod(SerializationMethod):
+    method: SerializationMethod
+    generated: Callable[[Any], Any]
+
+    def serialize(self, obj: Any, path: Union[int, str, None] = None) -> Any:
+        return self.generated(obj)
+
+
+@with_slots
 @dataclass
 class TupleCheckOnlyMethod(SerializationMethod):
     elt_methods: Tuple[SerializationMethod, ...]
@@ -307,6 +369,7 @@ class TupleCheckOnlyMethod(SerializationMethod):
         return obj
 
 
+@with_slots
 @dataclass
 class TupleMethod(SerializationMethod):
     elt_methods: Tuple[SerializationMethod, ...]
@@ -319,6 +382,7 @@ class TupleMethod(SerializationMethod):
         return elts
 
 
+@with_slots
 @dataclass
 class CheckedTupleMethod(SerializationMethod):
     nb_elts: int
@@ -334,6 +398,7 @@ class CheckedTupleMethod(SerializationMethod):
 # are IdentityMethod, which gives IdentityMethod.
 
 
+@with_slots
 @dataclass
 class OptionalMethod(SerializationMethod):
     value_method: SerializationMethod
@@ -342,6 +407,7 @@ class OptionalMethod(SerializationMethod):
         return self.value_method.serialize(obj, path) if obj is not None else None
 
 
+@with_slots
 @dataclass
 class UnionAlternative(SerializationMethod):
     cls: AnyType  # `type` would require exact match (i.e. no EnumMeta)
@@ -351,6 +417,7 @@ class UnionAlternative(SerializationMethod):
         return self.method.serialize(obj, path)
 
 
+@with_slots
 @dataclass
 class DiscriminatedAlternative(UnionAlternative):
     alias: str
@@ -363,6 +430,7 @@ class DiscriminatedAlternative(UnionAlternative):
         return res
 
 
+@with_slots
 @dataclass
 class UnionMethod(SerializationMethod):
     alternatives: Tuple[UnionAlternative, ...]
@@ -379,6 +447,48 @@ class UnionMethod(SerializationMethod):
         return self.fallback.fall_back(obj, path)
 
 
+def matching_alternatives(alternatives: tuple, obj: Any) -> tuple:
+    matching = []
+    for i in range(len(alternatives)):
+        alternative: UnionAlternative = alternatives[i]
+        if isinstance(obj, alternative.cls):
+            matching.append(alternative)
+    return tuple(matching)
+
+
+@with_slots
+@dataclass
+class TypeDispatchUnionMethod(SerializationMethod):
+    alternatives: Tuple[UnionAlternative, ...]
+    fallback: Fallback
+    # alternatives matching the instances of a type, computed at its first instance
+    # (bounded by TYPE_DISPATCH_MEMO_SIZE)
+    alternatives_by_type: dict = field(init=False)
+
+    def __post_init__(self):
+        self.alternatives_by_type = {}
+
+    def serialize(self, obj: Any, path: Union[int, str, None] = None) -> Any:
+        cls = type(obj)
+        # isinstance also checks __class__, which proxies can override per instance
+        cacheable = obj.__class__ is cls
+        alternatives = self.alternatives_by_type.get(cls) if cacheable else None
+        if alternatives is None:
+            alternatives = matching_alternatives(self.alternatives, obj)
+            if cacheable:
+                if len(self.alternatives_by_type) >= TYPE_DISPATCH_MEMO_SIZE:
+                    self.alternatives_by_type.clear()
+                self.alternatives_by_type[cls] = alternatives
+        for i in range(len(alternatives)):
+            alternative: UnionAlternative = alternatives[i]
+            try:
+                return alternative.serialize(obj, path)
+            except Exception:
+                pass
+        return self.fallback.fall_back(obj, path)
+
+
+@with_slots
 @dataclass
 class WrapperMethod(SerializationMethod):
     wrapped: Callable[[Any], Any]
@@ -387,6 +497,7 @@ class WrapperMethod(SerializationMethod):
         return self.wrapped(obj)
 
 
+@with_slots
 @dataclass
 class ConversionMethod(SerializationMethod):
     converter: Converter
@@ -396,6 +507,7 @@ class ConversionMethod(SerializationMethod):
         return self.method.serialize(self.converter(obj))
 
 
+@with_slots
 @dataclass
 class DiscriminateTypedDict(SerializationMethod):
     field_name: str
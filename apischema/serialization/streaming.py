@@ -0,0 +1,254 @@
+import json
+import math
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime, time
+from enum import Enum
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+)
+from uuid import UUID
+
+from apischema.aliases import Aliaser
+from apischema.conversions.conversions import AnyConversion, DefaultConversion
+from apischema.serialization import PassThroughOptions, _serialization_method
+from apischema.serialization.methods import CollectionMethod
+from apischema.types import AnyType
+
+JSON_KEY_TYPES = (str, int, float, bool, type(None))
+
+
+def orjson_native(obj: Any) -> Any:
+    """Convert the (passed through) types encoded natively by orjson, in order to
+    get the same result with json"""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    elif isinstance(obj, UUID):
+        return str(obj)
+    elif isinstance(obj, Enum):
+        return obj.value
+    elif is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def with_json_keys(obj: Any) -> Any:
+    """Convert recursively the dict keys rejected by json, like orjson does with
+    OPT_NON_STR_KEYS"""
+    if isinstance(obj, dict):
+        return {
+            key
+            if isinstance(key, JSON_KEY_TYPES)
+            else orjson_native(key): (with_json_keys(value))
+            for key, value in obj.items()
+        }
+    elif isinstance(obj, (list, tuple)):
+        return list(map(with_json_keys, obj))
+    elif isinstance(obj, JSON_KEY_TYPES):
+        return obj
+    try:
+        return with_json_keys(orjson_native(obj))
+    except TypeError:
+        return obj
+
+
+def json_dumps(obj: Any) -> bytes:
+    try:
+        result = json.dumps(
+            obj, separators=(",", ":"), ensure_ascii=False, default=orjson_native
+        )
+    except TypeError:
+        # json only accepts str/int/float/bool/None keys
+        result = json.dumps(
+            with_json_keys(obj),
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=orjson_native,
+        )
+    return result.encode()
+
+
+def non_finite(obj: Any) -> bool:
+    """Whether obj contains NaN or infinite floats"""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    elif isinstance(obj, dict):
+        return any(map(non_finite, obj)) or any(map(non_finite, obj.values()))
+    elif isinstance(obj, (list, tuple)):
+        return any(map(non_finite, obj))
+    else:
+        return False
+
+
+dumps: Callable[[Any], bytes]
+try:
+    import orjson
+except ImportError:
+    dumps = json_dumps
+else:
+
+    def dumps(obj: Any) -> bytes:
+        # orjson fails on non-str keys (unless OPT_NON_STR_KEYS is passed, which
+        # slows down str keys) and on integers exceeding 64 bits, and writes
+        # NaN/infinity as null; json is used in these last cases, and converts the
+        # types encoded natively by orjson, so the result doesn't depend on orjson
+        # being installed
+        try:
+            result = orjson.dumps(obj)
+        except TypeError:
+            try:
+                result = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                return json_dumps(obj)
+        return json_dumps(obj) if b"null" in result and non_finite(obj) else result
+
+
+def serialize_json(
+    type: AnyType,
+    obj: Any,
+    *,
+    additional_properties: Optional[bool] = None,
+    aliaser: Optional[Aliaser] = None,
+    check_type: Optional[bool] = None,
+    conversion: Optional[AnyConversion] = None,
+    default_conversion: Optional[DefaultConversion] = None,
+    exclude_defaults: Optional[bool] = None,
+    exclude_none: Optional[bool] = None,
+    exclude_unset: Optional[bool] = None,
+    fall_back_on_any: Optional[bool] = None,
+    no_copy: Optional[bool] = None,
+    pass_through: Optional[PassThroughOptions] = None,
+) -> bytes:
+    """Serialize obj to compact JSON bytes; elements of a collection are serialized
+    and encoded one after the other, so the whole serialized collection is never
+    kept in memory."""
+    method = _serialization_method(
+        type,
+        additional_properties,
+        aliaser,
+        check_type,
+        conversion,
+        default_conversion,
+        exclude_defaults,
+        exclude_none,
+        exclude_unset,
+        fall_back_on_any,
+        no_copy,
+        pass_through,
+    )
+    if not isinstance(method, CollectionMethod):
+        return dumps(method.serialize(obj))
+    value_method = method.value_method
+    return b"[%s]" % b",".join(
+        dumps(value_method.serialize(elt, i)) for i, elt in enumerate(obj)
+    )
+
+
+def encode_chunks(values: Iterable[Any], lines: bool) -> Iterator[bytes]:
+    if lines:
+        for value in values:
+            yield dumps(value) + b"\n"
+    else:
+        prefix = b"["
+        for value in values:
+            yield prefix + dumps(value)
+            prefix = b","
+        yield b"]" if prefix == b"," else b"[]"
+
+
+async def aencode_chunks(
+    values: AsyncIterable[Any], lines: bool
+) -> AsyncIterator[bytes]:
+    if lines:
+        async for value in values:
+            yield dumps(value) + b"\n"
+    else:
+        prefix = b"["
+        async for value in values:
+            yield prefix + dumps(value)
+            prefix = b","
+        yield b"]" if prefix == b"," else b"[]"
+
+
+def iter_serialize(
+    type: AnyType,
+    objs: Iterable[Any],
+    *,
+    encode: bool = False,
+    lines: bool = False,
+    additional_properties: Optional[bool] = None,
+    aliaser: Optional[Aliaser] = None,
+    check_type: Optional[bool] = None,
+    conversion: Optional[AnyConversion] = None,
+    default_conversion: Optional[DefaultConversion] = None,
+    exclude_defaults: Optional[bool] = None,
+    exclude_none: Optional[bool] = None,
+    exclude_unset: Optional[bool] = None,
+    fall_back_on_any: Optional[bool] = None,
+    no_copy: Optional[bool] = None,
+    pass_through: Optional[PassThroughOptions] = None,
+) -> Iterator[Any]:
+    """Serialize objs elements with type one by one; if encode is true, yield
+    instead the chunks of the JSON array (or JSON lines if lines is true)."""
+    method = _serialization_method(
+        type,
+        additional_properties,
+        aliaser,
+        check_type,
+        conversion,
+        default_conversion,
+        exclude_defaults,
+        exclude_none,
+        exclude_unset,
+        fall_back_on_any,
+        no_copy,
+        pass_through,
+    )
+    values = map(method.serialize, objs)
+    return encode_chunks(values, lines) if encode else values
+
+
+def aiter_serialize(
+    type: AnyType,
+    objs: AsyncIterable[Any],
+    *,
+    encode: bool = False,
+    lines: bool = False,
+    additional_properties: Optional[bool] = None,
+    aliaser: Optional[Aliaser] = None,
+    check_type: Optional[bool] = None,
+    conversion: Optional[AnyConversion] = None,
+    default_conversion: Optional[DefaultConversion] = None,
+    exclude_defaults: Optional[bool] = None,
+    exclude_none: Optional[bool] = None,
+    exclude_unset: Optional[bool] = None,
+    fall_back_on_any: Optional[bool] = None,
+    no_copy: Optional[bool] = None,
+    pass_through: Optional[PassThroughOptions] = None,
+) -> AsyncIterator[Any]:
+    """Asynchronous version of iter_serialize"""
+    method = _serialization_method(
+        type,
+        additional_properties,
+        aliaser,
+        check_type,
+        conversion,
+        default_conversion,
+        exclude_defaults,
+        exclude_none,
+        exclude_unset,
+        fall_back_on_any,
+        no_copy,
+        pass_through,
+    )
+
+    async def values() -> AsyncIterator[Any]:
+        async for obj in objs:
+            yield method.serialize(obj)
+
+    return aencode_chunks(values(), lines) if encode else values()
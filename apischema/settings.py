@@ -87,16 +87,21 @@ class settings(metaclass=MetaSettings):
         missing_property: str = "missing property"
 
     class deserialization(metaclass=ResetCache):
+        adaptive_unions: bool = False
+        codegen: bool = False
         coerce: bool = False
         coercer: Coercer = coerce_
         default_conversion: DefaultConversion = default_deserialization
         fall_back_on_default: bool = False
+        infer_discriminator: bool = True
+        key_set_dispatch: bool = True
         no_copy: bool = True
         override_dataclass_constructors = False
         pass_through: CollectionOrPredicate[type] = ()
 
     class serialization(metaclass=ResetCache):
         check_type: bool = False
+        codegen: bool = False
         fall_back_on_any: bool = False
         default_conversion: DefaultConversion = default_serialization
         exclude_defaults: bool = False
@@ -3,7 +3,7 @@ import inspect
 import re
 import sys
 from contextlib import contextmanager, suppress
-from dataclasses import dataclass, is_dataclass
+from dataclasses import dataclass, fields, is_dataclass
 from enum import Enum
 from functools import wraps
 from types import MappingProxyType
@@ -31,6 +31,7 @@ from typing import (
     Union,
     cast,
 )
+from weakref import WeakSet
 
 from apischema.types import COLLECTION_TYPES, MAPPING_TYPES, PRIMITIVE_TYPES, AnyType
 from apischema.typing import (
@@ -52,6 +53,12 @@ except ImportError:
 
 PREFIX = "_apischema_"
 
+# Number of calls between two reorderings of adaptive unions alternatives
+ADAPTIVE_UNION_PERIOD = 1000
+# Maximal number of types memoized by a union dispatching on the object type; the
+# memo is cleared when full, so dynamically created classes cannot leak
+TYPE_DISPATCH_MEMO_SIZE = 64
+
 T = TypeVar("T")
 U = TypeVar("U")
 
@@ -82,6 +89,12 @@ def is_hashable(obj: Any) -> bool:
     return isinstance(obj, collections.abc.Hashable)
 
 
+def intern(s: str) -> str:
+    """Intern the string, unless it's a str subclass (e.g. str Enum member), which
+    sys.intern doesn't support"""
+    return sys.intern(s) if type(s) is str else s
+
+
 def opt_or(opt: Optional[T], default: U) -> Union[T, U]:
     return opt if opt is not None else default
 
@@ -318,6 +331,52 @@ def context_setter(obj: Any):
         obj.__dict__.update(dict_copy)
 
 
+Cls = TypeVar("Cls", bound=type)
+
+# classes recreated by with_slots, which remain in their bases __subclasses__()
+# until they are garbage collected
+_replaced_classes: "WeakSet[type]" = WeakSet()
+
+
+def with_slots(cls: Cls) -> Cls:
+    """Recreate the class with __slots__ for the fields it declares, in order to
+    save the instances __dict__ and speed up attribute access.
+
+    Base classes must also be decorated for their subclasses instances to be
+    dict-less. Cython compiled classes don't need it."""
+    if sys.version_info < (3, 7):  # pragma: no cover
+        # zero-argument super() cells cannot be rebound
+        return cls
+    annotations = cls.__dict__.get("__annotations__", {})
+    slots = tuple(
+        field.name
+        for field in (fields(cls) if is_dataclass(cls) else ())
+        if field.name in annotations
+    )
+    namespace = {
+        name: attr
+        for name, attr in cls.__dict__.items()
+        if name not in (*slots, "__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = slots
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+    # zero-argument super() (and frozen dataclass __setattr__) reference the class
+    # through a closure cell
+    for attr in namespace.values():
+        for cell in getattr(attr, "__closure__", None) or ():
+            with suppress(ValueError):  # empty cell
+                if cell.cell_contents is cls:
+                    cell.cell_contents = slotted
+    _replaced_classes.add(cls)
+    return slotted
+
+
+def subclasses(cls: Type[T]) -> List[Type[T]]:
+    """cls.__subclasses__() without the classes recreated by with_slots"""
+    return [sub for sub in cls.__subclasses__() if sub not in _replaced_classes]
+
+
 def wrap_generic_init_subclass(init_subclass: Func) -> Func:
     if sys.version_info >= (3, 7):
         return init_subclass
@@ -19,6 +19,7 @@ from typing import (
     Union,
 )
 
+from apischema.cache import add_dependencies
 from apischema.types import (
     COLLECTION_TYPES,
     MAPPING_TYPES,
@@ -152,6 +153,8 @@ class Visitor(Generic[Result]):
 
     def visit(self, tp: AnyType) -> Result:
         origin, args = get_origin_or_type(tp), get_args(tp)
+        # cached results depend on the visited type and its bases
+        add_dependencies(tp, *getattr(origin, "__mro__", (origin,)))
         if args:
             if is_annotated(tp):
                 return self.annotated(args[0], args[1:])
@@ -0,0 +1,82 @@
+__all__ = ["precompute_and_freeze", "warmup"]
+import gc
+import inspect
+import time
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from apischema.deserialization import deserialization_method
+from apischema.deserialization.methods import RecMethod as DeserializationRecMethod
+from apischema.deserialization.methods import (
+    resolve_rec_method as resolve_deserialization,
+)
+from apischema.json_schema import deserialization_schema, serialization_schema
+from apischema.recursion import collect_rec_methods
+from apischema.serialization import serialization_method
+from apischema.serialization.methods import resolve_rec_method as resolve_serialization
+from apischema.types import AnyType
+
+
+def warmup(
+    types: Iterable[AnyType],
+    *,
+    deserialization: bool = True,
+    serialization: bool = True,
+    json_schema: bool = False,
+    **options: Any,
+) -> Dict[AnyType, float]:
+    """Compute the (de)serialization methods (and JSON schemas if json_schema is
+    true) of the given types, including the lazy parts of recursive methods, so
+    they are cached before the first (de)serialization.
+
+    Options are passed to every function accepting them, e.g. aliaser or
+    exclude_unset. Return the time spent (in seconds) for each type."""
+    functions: List[Callable] = []
+    if deserialization:
+        functions.append(deserialization_method)
+        if json_schema:
+            functions.append(deserialization_schema)
+    if serialization:
+        functions.append(serialization_method)
+        if json_schema:
+            functions.append(serialization_schema)
+    calls: List[Tuple[Callable, Dict[str, Any]]] = []
+    unused = set(options)
+    for func in functions:
+        parameters = inspect.signature(func).parameters
+        calls.append((func, {k: v for k, v in options.items() if k in parameters}))
+        unused.difference_update(parameters)
+    if unused:
+        raise TypeError(f"Unexpected warmup options {sorted(unused)}")
+    times = {}
+    with collect_rec_methods() as rec_methods:
+        for tp in types:
+            start = time.perf_counter()
+            for func, kwargs in calls:
+                func(tp, **kwargs)
+            # resolving a lazy can create new recursive methods
+            while rec_methods:
+                rec_method = rec_methods.pop()
+                if isinstance(rec_method, DeserializationRecMethod):
+                    resolve_deserialization(rec_method)
+                else:
+                    resolve_serialization(rec_method)
+            times[tp] = time.perf_counter() - start
+    return times
+
+
+def precompute_and_freeze(
+    types: Iterable[AnyType], **kwargs: Any
+) -> Dict[AnyType, float]:
+    """Warm up the types, then move every object tracked by the garbage collector,
+    including the cached methods, into a permanent generation ignored by future
+    collections (see gc.freeze), so collections in forked workers don't touch them.
+
+    To be called in the parent process just before forking workers (e.g. with
+    gunicorn --preload). Following CPython guidance, garbage collection should
+    also be disabled early in the parent (gc.disable) and re-enabled in the
+    workers (gc.enable), so that no collection leaves free slots in the pages of
+    the frozen objects for later allocations."""
+    times = warmup(types, **kwargs)
+    if hasattr(gc, "freeze"):  # pragma: no cover py37+
+        gc.freeze()
+    return times
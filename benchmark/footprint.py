@@ -0,0 +1,106 @@
+"""Memory footprint of the method trees built for a lot of models, and attribute
+access time of their nodes, compared to equivalent nodes with an instance __dict__.
+
+Meaningful for the pure-Python implementation (e.g. PyPy), as Cython compiled nodes
+have neither __dict__ nor __slots__."""
+import sys
+import timeit
+import tracemalloc
+from dataclasses import field, fields, make_dataclass
+from datetime import datetime
+from typing import Any, Iterator, List, Optional
+
+from common import Payment
+
+import apischema
+from apischema.deserialization.methods import Field, IntMethod
+
+MODELS = 1000
+ACCESSES = 100
+METHODS_MODULES = {
+    "apischema.deserialization.methods",
+    "apischema.serialization.methods",
+}
+
+
+def receipt_model(index: int) -> type:
+    item_fields: List[Any] = [
+        ("name", str),
+        ("price", float, field(metadata=apischema.schema(min=0))),
+        ("quantity", int, field(default=1, metadata=apischema.schema(min=1))),
+    ]
+    item = make_dataclass(f"Item{index}", item_fields)
+    client = make_dataclass(
+        f"Client{index}", [("id", int), ("first_name", str), ("last_name", str)]
+    )
+    return make_dataclass(
+        f"Receipt{index}",
+        [
+            ("store", str),
+            ("address", str),
+            ("date", datetime),
+            ("items", list[item]),  # type: ignore
+            ("payment", Payment),
+            ("client", Optional[client], None),  # type: ignore
+        ],
+    )
+
+
+def nodes(obj: Any, visited: set[int]) -> Iterator[Any]:
+    if id(obj) in visited:
+        return
+    visited.add(id(obj))
+    if isinstance(obj, (tuple, list, set, frozenset)):
+        for elt in obj:
+            yield from nodes(elt, visited)
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            yield from nodes(value, visited)
+    elif type(obj).__module__ in METHODS_MODULES:
+        yield obj
+        for cls in type(obj).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                yield from nodes(getattr(obj, name), visited)
+
+
+def size_with_dict(node: Any) -> int:
+    cls = type(node)
+    copy: Any = object.__new__(type(cls.__name__, (), {}))
+    for base in cls.__mro__:
+        for name in base.__dict__.get("__slots__", ()):
+            setattr(copy, name, getattr(node, name))
+    return sys.getsizeof(copy) + sys.getsizeof(copy.__dict__)
+
+
+def main():
+    models = [receipt_model(i) for i in range(MODELS)]
+    tracemalloc.start()
+    methods = [
+        (
+            apischema.deserialization_method(model).__self__,
+            apischema.serialization_method(model).__self__,
+        )
+        for model in models
+    ]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"methods of {MODELS} models: {allocated / 2**20:.1f} MiB allocated")
+    all_nodes = list(nodes(methods, set()))
+    slotted = sum(map(sys.getsizeof, all_nodes))
+    with_dict = sum(map(size_with_dict, all_nodes))
+    print(f"{len(all_nodes)} nodes: {slotted / 2**20:.1f} MiB", end=" ")
+    print(f"instead of {with_dict / 2**20:.1f} MiB with __dict__")
+
+    field_with_dict = make_dataclass("Field", [(f.name, f.type) for f in fields(Field)])
+    args = ("name", "alias", IntMethod(), True, set(), False)
+    for kind, node in [("slots", Field(*args)), ("__dict__", field_with_dict(*args))]:
+        # repeated in the statement to amortize timeit loop
+        stmt = "; ".join(["node.method"] * ACCESSES)
+        timer = timeit.Timer(stmt, "node = n", globals={"n": node})
+        number, _ = timer.autorange()
+        access = min(timer.repeat(number=number)) / number / ACCESSES
+        print(f"attribute access with {kind}: {access * 1e9:.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Serialization time of aliased dataclasses by ObjectMethod, and time of building
+their output dict from a copy of the method prototype, compared to inserting the
+keys into an empty dict."""
+import timeit
+from dataclasses import make_dataclass
+
+import apischema
+from apischema.serialization.methods import ObjectMethod
+
+
+def measure(func, *args) -> float:
+    timer = timeit.Timer(lambda: func(*args))
+    number, _ = timer.autorange()
+    return min(timer.repeat(number=number)) / number
+
+
+def from_empty(prototype: dict) -> dict:
+    result: dict = {}
+    for key in prototype:
+        result[key] = 0
+    return result
+
+
+def from_prototype(prototype: dict) -> dict:
+    result = prototype.copy()
+    for key in prototype:
+        result[key] = 0
+    return result
+
+
+def main():
+    for size in (4, 8, 16):
+        cls = make_dataclass(f"Model{size}", [(f"f{i}", int) for i in range(size)])
+        method = apischema.serialization_method(cls, aliaser=str.upper)
+        assert isinstance(method.__self__, ObjectMethod)
+        prototype = method.__self__.prototype
+        assert len(prototype) == size
+        obj = cls(*range(size))
+        print(f"{size} fields serialization: {measure(method, obj) * 1e9:.0f} ns")
+        for build in (from_empty, from_prototype):
+            duration = measure(build, prototype)
+            print(f"{size} fields {build.__name__}: {duration * 1e9:.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""Serialization time of a union of 20 dataclasses, dispatched on the object type,
+compared to the sequential isinstance check of each alternative."""
+import timeit
+from dataclasses import make_dataclass
+from typing import Union
+
+import apischema
+from apischema.serialization.methods import TypeDispatchUnionMethod, UnionMethod
+
+MEMBERS = 20
+
+
+def main():
+    models = [make_dataclass(f"Model{i}", [("id", int)]) for i in range(MEMBERS)]
+    method = apischema.serialization_method(Union[tuple(models)])
+    dispatch = method.__self__
+    assert isinstance(dispatch, TypeDispatchUnionMethod)
+    sequential = UnionMethod(dispatch.alternatives, dispatch.fallback)
+    for index in (0, MEMBERS // 2, MEMBERS - 1):
+        obj = models[index](0)
+        for kind, node in [("type dispatch", dispatch), ("sequential", sequential)]:
+            timer = timeit.Timer(
+                "serialize(obj)", globals={"serialize": node.serialize, "obj": obj}
+            )
+            number, _ = timer.autorange()
+            duration = min(timer.repeat(number=number)) / number
+            print(f"member {index} with {kind}: {duration * 1e9:.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
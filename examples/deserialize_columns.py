@@ -0,0 +1,32 @@
+from array import array
+from dataclasses import dataclass
+
+from pytest import raises
+
+from apischema import ValidationError, deserialize_columns
+
+
+@dataclass
+class Item:
+    name: str
+    price: float
+    quantity: int = 1
+
+
+columns = deserialize_columns(
+    Item,
+    [{"name": "apple", "price": 0.5, "quantity": 6}, {"name": "melon", "price": 3}],
+)
+assert columns == {
+    "name": ["apple", "melon"],
+    "price": array("d", [0.5, 3.0]),
+    "quantity": array("q", [6, 1]),
+}
+# Columns can be passed directly to pandas.DataFrame, or wrapped without copy
+# using numpy.frombuffer(columns["price"])
+with raises(ValidationError) as err:
+    deserialize_columns(Item, [{"name": "apple", "price": 0.5}, {"price": "free"}])
+assert err.value.errors == [
+    {"loc": [1, "name"], "err": "missing property"},
+    {"loc": [1, "price"], "err": "expected type number, found string"},
+]
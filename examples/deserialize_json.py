@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+from pytest import raises
+
+from apischema import ValidationError, deserialize_json
+
+
+@dataclass
+class Item:
+    name: str
+    price: float
+
+
+items = deserialize_json(
+    list[Item], b'[{"name": "apple", "price": 0.5}, {"name": "melon", "price": 3}]'
+)
+assert items == [Item("apple", 0.5), Item("melon", 3.0)]
+with raises(ValidationError) as err:
+    deserialize_json(list[Item], '[{"name": "apple", "price": 0.5}, {"name": 0}]')
+assert err.value.errors == [
+    {"loc": [1, "name"], "err": "expected type string, found integer"},
+    {"loc": [1, "price"], "err": "missing property"},
+]
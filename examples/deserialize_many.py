@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+from apischema import ValidationError, deserialize_many
+
+
+@dataclass
+class Event:
+    id: int
+    name: str
+
+
+events, errors = deserialize_many(
+    Event, [{"id": 0, "name": "start"}, {"id": "1"}, {"id": 2, "name": "stop"}]
+)
+assert events == [Event(0, "start"), None, Event(2, "stop")]
+assert list(errors) == [1]
+assert isinstance(errors[1], ValidationError)
+assert errors[1].errors == [
+    {"loc": ["id"], "err": "expected type integer, found string"},
+    {"loc": ["name"], "err": "missing property"},
+]
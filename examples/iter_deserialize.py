@@ -0,0 +1,18 @@
+import io
+from dataclasses import dataclass
+
+from apischema import iter_deserialize
+
+
+@dataclass
+class Event:
+    id: int
+    name: str
+
+
+array = io.StringIO('[{"id": 0, "name": "start"}, {"id": 1, "name": "stop"}]')
+assert list(iter_deserialize(Event, array)) == [Event(0, "start"), Event(1, "stop")]
+# JSON lines (NDJSON) are supported with lines=True
+lines = io.BytesIO(b'{"id": 0, "name": "start"}\n{"id": 1, "name": "stop"}\n')
+for event in iter_deserialize(Event, lines, lines=True):
+    assert isinstance(event, Event)
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+
+from apischema import iter_serialize
+
+
+@dataclass
+class Event:
+    id: int
+    name: str
+
+
+def events():  # could be a database cursor, or an asynchronous generator
+    yield Event(0, "start")
+    yield Event(1, "stop")
+
+
+assert list(iter_serialize(Event, events())) == [
+    {"id": 0, "name": "start"},
+    {"id": 1, "name": "stop"},
+]
+# Chunks can be sent as soon as they are produced, e.g. in a streaming response
+assert list(iter_serialize(Event, events(), encode=True)) == [
+    b'[{"id":0,"name":"start"}',
+    b',{"id":1,"name":"stop"}',
+    b"]",
+]
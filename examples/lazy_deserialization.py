@@ -0,0 +1,30 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+from pytest import raises
+
+from apischema import ValidationError, deserialize
+
+
+@dataclass
+class Item:
+    name: str
+    price: float
+
+
+@dataclass
+class Receipt:
+    store: str
+    items: list[Item] = field(default_factory=list)
+    client: Optional[Item] = None
+
+
+data = {"store": "Grocery", "items": [{"name": "egg", "price": "?"}]}
+receipt = deserialize(Receipt, data, lazy=True)  # no error yet
+assert isinstance(receipt, Receipt)
+assert receipt.store == "Grocery" and receipt.client is None
+with raises(ValidationError) as err:
+    receipt.items
+assert err.value.errors == [
+    {"loc": ["items", 0, "price"], "err": "expected type number, found string"}
+]
@@ -0,0 +1,25 @@
+import os.path
+import tempfile
+from dataclasses import dataclass
+
+from apischema import cache, deserialize, persistence, serialize
+
+
+@dataclass
+class Item:
+    name: str
+    price: float
+
+
+path = os.path.join(tempfile.mkdtemp(), "methods.pickle")
+# Fingerprint of apischema, settings and models source
+fingerprint = persistence.fingerprint(__file__)
+# First start: there is nothing to load, methods are computed and then saved
+assert persistence.load(path, fingerprint) == 0
+assert deserialize(Item, {"name": "apple", "price": 0.5}) == Item("apple", 0.5)
+assert serialize(Item, Item("apple", 0.5)) == {"name": "apple", "price": 0.5}
+assert persistence.save(path, fingerprint) > 0
+cache.reset()  # simulate a new process
+# Next starts: methods are loaded instead of being computed
+assert persistence.load(path, fingerprint) > 0
+assert deserialize(Item, {"name": "apple", "price": 0.5}) == Item("apple", 0.5)
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+from apischema import serialize_json
+
+
+@dataclass
+class Item:
+    name: str
+    price: float
+
+
+items = [Item("apple", 0.5), Item("melon", 3.0)]
+assert (
+    serialize_json(list[Item], items)
+    == b'[{"name":"apple","price":0.5},{"name":"melon","price":3.0}]'
+)
@@ -0,0 +1,29 @@
+from dataclasses import dataclass, field
+
+from pytest import raises
+
+from apischema import ValidationError, schema, validation_method, validator
+
+
+@dataclass
+class Item:
+    name: str
+    price: float = field(metadata=schema(min=0))
+    quantity: int = 1
+
+    @validator
+    def total(self):
+        # self is a mock holding the deserialized fields, Item is not instantiated
+        if self.price * self.quantity > 1000:
+            yield "too expensive"
+
+
+validate_item = validation_method(list[Item])
+validate_item([{"name": "egg", "price": 0.5, "quantity": 12}])  # no error
+with raises(ValidationError) as err:
+    validate_item([{"name": "car", "price": 10000}, {"price": -1}])
+assert err.value.errors == [
+    {"loc": [0], "err": "too expensive"},
+    {"loc": [1, "name"], "err": "missing property"},
+    {"loc": [1, "price"], "err": "less than 0 (minimum)"},
+]
@@ -0,0 +1,24 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+from apischema import deserialize, warmup
+
+
+@dataclass
+class Node:
+    value: int
+    children: list["Node"] = field(default_factory=list)
+
+
+@dataclass
+class Tree:
+    root: Optional[Node] = None
+
+
+# Typically called at application startup
+times = warmup([Node, Tree])
+assert times.keys() == {Node, Tree}  # time spent for each type, in seconds
+# Methods are already computed, even the recursive parts
+assert deserialize(Tree, {"root": {"value": 0, "children": [{"value": 1}]}}) == Tree(
+    Node(0, [Node(1)])
+)
@@ -136,8 +136,15 @@ class IndentedWriter:
             yield
 
 
+def subclasses(cls: type) -> List[type]:
+    # apischema is only importable once ROOT_DIR is in sys.path
+    from apischema.utils import subclasses
+
+    return subclasses(cls)
+
+
 def rec_subclasses(cls: type) -> Iterable[type]:
-    for sub_cls in cls.__subclasses__():
+    for sub_cls in subclasses(cls):
         yield sub_cls
         yield from rec_subclasses(sub_cls)
 
@@ -161,7 +168,7 @@ def module_methods(module: str) -> Mapping[str, Method]:
     all_methods = [
         Method(cls, func)  # type: ignore
         for cls in module_elements(module, type)
-        if cls.__bases__ == (object,) and cls.__subclasses__()  # type: ignore
+        if cls.__bases__ == (object,) and subclasses(cls)  # type: ignore
         for func in cls.__dict__.values()
         if isinstance(func, FunctionType) and not func.__name__.startswith("_")
     ]
@@ -223,7 +230,7 @@ def write_class(pyx: IndentedWriter, cls: type):
                 pyx.writeln(f"cdef readonly {cython_type(tp, cls.__module__)} {name}")
         dispatch = None
         if cls.__bases__ == (object,):
-            if cls.__subclasses__():
+            if subclasses(cls):
                 pyx.writeln(f"cdef int {DISPATCH_FIELD}")
         else:
             base_class = cls.__mro__[-2]
@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+from typing import List, Union
+
+import pytest
+
+import apischema.deserialization
+from apischema import ValidationError, deserialization_method, settings
+from apischema.deserialization.methods import AdaptiveUnionMethod
+
+
+@dataclass
+class A:
+    a: int
+
+
+@dataclass
+class B:
+    b: int
+
+
+Event = Union[A, B, int]
+
+
+@pytest.fixture(autouse=True)
+def adaptive(monkeypatch):
+    monkeypatch.setattr(settings.deserialization, "adaptive_unions", True)
+    monkeypatch.setattr(apischema.deserialization, "ADAPTIVE_UNION_PERIOD", 2)
+
+
+def test_adaptive_deserialization():
+    method = deserialization_method(Event)
+    adaptive = method.__self__
+    assert isinstance(adaptive, AdaptiveUnionMethod)
+    with pytest.raises(ValidationError) as err:
+        method({})
+    assert method(0) == 0 and method(1) == 1
+    assert [alt.index for alt in adaptive.alternatives] == [2, 0, 1]
+    assert method({"b": 0}) == B(0)
+    with pytest.raises(ValidationError) as err2:
+        method({})
+    # errors are still merged in declaration order
+    assert err2.value.errors == err.value.errors
+
+
+def test_not_disjoint_unions():
+    method = deserialization_method(Union[List[int], List[str]])
+    assert not isinstance(method.__self__, AdaptiveUnionMethod)
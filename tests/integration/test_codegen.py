@@ -0,0 +1,155 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import pytest
+
+from apischema import (
+    Undefined,
+    UndefinedType,
+    ValidationError,
+    alias,
+    dependent_required,
+    deserialization_method,
+    deserialize,
+    schema,
+    serialization_method,
+    serialize,
+    serialized,
+    settings,
+)
+from apischema.deserialization.methods import GeneratedMethod
+from apischema.fields import with_fields_set
+from apischema.metadata import fall_back_on_default, flatten, skip
+from apischema.serialization.methods import (
+    GeneratedMethod as GeneratedSerializationMethod,
+)
+from apischema.typing import TypedDict
+
+
+@dataclass
+class A:
+    a: int
+    b: float = 0.0
+    c: Optional[str] = None
+    d: None = None
+    e: bool = field(default=False, metadata=fall_back_on_default)
+    f: List[int] = field(default_factory=list, metadata=alias("F"))
+
+
+@dataclass
+class Billing:
+    name: str
+    credit_card: Union[int, UndefinedType] = field(default=Undefined)
+    billing_address: Union[str, UndefinedType] = field(default=Undefined)
+    dependencies = dependent_required({credit_card: [billing_address]})
+
+
+@schema(min_props=2)
+@dataclass
+class Constrained:
+    a: int = 0
+    b: int = 0
+
+
+class TD(TypedDict, total=False):
+    key: str
+
+
+DATA = [
+    {"a": 0},
+    {"a": 0, "b": 1, "c": "", "d": None, "e": True, "F": [0]},
+    {"a": 0, "b": 1.5, "c": None, "e": "", "F": []},
+    {"a": "", "b": "", "c": 0, "d": 0, "e": 0, "F": [""], "g": 0},
+    {},
+    [],
+    {"name": "", "credit_card": 0},
+    {"a": 0, "b": ""},
+    {"key": ""},
+    {"key": "", "other": 0},
+    {"key": 0},
+]
+
+
+@pytest.mark.parametrize("tp", [A, Billing, Constrained, TD, Dict[str, A]])
+@pytest.mark.parametrize("additional_properties", [False, True])
+@pytest.mark.parametrize("data", DATA)
+def test_codegen(monkeypatch, tp, additional_properties, data):
+    def result(codegen: bool) -> Any:
+        monkeypatch.setattr(settings.deserialization, "codegen", codegen)
+        try:
+            return deserialize(tp, data, additional_properties=additional_properties)
+        except ValidationError as err:
+            return err.errors
+
+    assert result(True) == result(False)
+
+
+def test_codegen_method(monkeypatch):
+    monkeypatch.setattr(settings.deserialization, "codegen", True)
+    assert isinstance(deserialization_method(A).__self__, GeneratedMethod)
+
+
+@dataclass
+class Flattened:
+    g: int = 0
+
+
+@with_fields_set
+@dataclass
+class B:
+    a: int
+    b: Optional[str] = None
+    c: Union[int, UndefinedType] = Undefined
+    d: List[int] = field(default_factory=list, metadata=skip(serialization_if=len))
+    e: int = field(default=0, metadata=skip(serialization_default=True))
+    flattened: Flattened = field(default_factory=Flattened, metadata=flatten)
+
+    @serialized
+    def h(self) -> Optional[int]:
+        return self.c if isinstance(self.c, int) and self.c else None
+
+
+OBJECTS = [
+    A(0),
+    A(0, 1.5, "", None, True, [0]),
+    B(0),
+    B(0, "", 1, [0], 1, Flattened(1)),
+    B(0, None, Undefined, [], 0),
+    Billing(""),
+    {"key": ""},
+    {},
+]
+TYPED_OBJECTS: List[Tuple[type, object]] = [
+    *((A, obj) for obj in OBJECTS[:2]),
+    *((B, obj) for obj in OBJECTS[2:5]),
+    (Billing, OBJECTS[5]),
+    (TD, OBJECTS[6]),
+    (TD, OBJECTS[7]),
+]
+
+
+@pytest.mark.parametrize("tp, obj", TYPED_OBJECTS)
+@pytest.mark.parametrize("exclude_none", [False, True])
+@pytest.mark.parametrize("exclude_unset", [False, True])
+@pytest.mark.parametrize("exclude_defaults", [False, True])
+def test_serialization_codegen(
+    monkeypatch, tp, obj, exclude_none, exclude_unset, exclude_defaults
+):
+    def result(codegen: bool) -> Any:
+        monkeypatch.setattr(settings.serialization, "codegen", codegen)
+        return serialize(
+            tp,
+            obj,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+            exclude_unset=exclude_unset,
+        )
+
+    generated, generic = result(True), result(False)
+    assert generated == generic
+    assert list(generated) == list(generic)
+
+
+def test_serialization_codegen_method(monkeypatch):
+    monkeypatch.setattr(settings.serialization, "codegen", True)
+    assert isinstance(serialization_method(B).__self__, GeneratedSerializationMethod)
@@ -0,0 +1,62 @@
+from array import array
+from dataclasses import InitVar, dataclass, field
+from typing import Optional
+
+import pytest
+
+from apischema import deserialize, deserialize_columns, validator
+from apischema.metadata import fall_back_on_default
+
+
+@dataclass
+class Point:
+    x: int
+    y: Optional[int] = None
+    z: float = field(default=0.0, metadata=fall_back_on_default)
+
+
+def test_columns_typecodes():
+    columns = deserialize_columns(Point, ({"x": i, "z": "?"} for i in range(3)))
+    assert columns == {
+        "x": array("q", [0, 1, 2]),
+        "y": [None] * 3,
+        "z": array("d", [0.0] * 3),
+    }
+
+
+def test_columns_int_overflow():
+    assert deserialize_columns(Point, [{"x": 2**64}])["x"] == [2**64]
+
+
+def test_columns_bool_in_int_column():
+    data = [{"x": 0}, {"x": True}]
+    columns = deserialize_columns(Point, data)
+    assert columns["x"] == [0, True]
+    assert [type(value) for value in columns["x"]] == [
+        type(deserialize(Point, row).x) for row in data
+    ]
+
+
+@dataclass
+class Validated:
+    a: int
+
+    @validator
+    def positive(self):
+        if self.a < 0:
+            raise ValueError
+
+
+@dataclass
+class WithInitVar:
+    a: int
+    b: InitVar[int] = 0
+
+
+def test_columns_unsupported():
+    with pytest.raises(TypeError):
+        deserialize_columns(Validated, [])
+    with pytest.raises(TypeError):
+        deserialize_columns(WithInitVar, [])
+    with pytest.raises(TypeError):
+        deserialize_columns(int, [])
@@ -0,0 +1,105 @@
+import io
+import json
+from dataclasses import dataclass
+from typing import Any, List, Union
+
+import pytest
+
+from apischema import ValidationError, deserialize_json, iter_deserialize, schema
+from apischema.deserialization import streaming
+
+
+@dataclass
+class A:
+    a: int
+
+
+@dataclass
+class B:
+    a: Union[int, float]
+    b: str = ""
+
+
+@pytest.mark.parametrize(
+    "data, tp, expected",
+    [
+        ("[]", List[A], []),
+        (" [ ] ", List[A], []),
+        ('[{"a": 0}]', List[A], [A(0)]),
+        (' [ {"a": 0} , {"a": 1} ] \n', List[A], [A(0), A(1)]),
+        ('{"a": 0}', A, A(0)),
+    ],
+)
+def test_deserialize_json(data, tp, expected):
+    assert deserialize_json(tp, data) == expected
+    assert deserialize_json(tp, data.encode()) == expected
+
+
+@pytest.mark.parametrize(
+    "data", ["", "[", "[,]", '[{"a": 0},]', '[{"a": 0} {"a": 1}]', "[] []"]
+)
+def test_deserialize_json_malformed(data):
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(data)
+    with pytest.raises(json.JSONDecodeError):
+        deserialize_json(List[A], data)
+
+
+def test_deserialize_json_not_array():
+    with pytest.raises(ValidationError) as err:
+        deserialize_json(List[A], '{"a": 0}')
+    assert err.value.errors == [{"loc": [], "err": "expected type array, found object"}]
+    with pytest.raises(ValidationError) as err:
+        deserialize_json(List[A], '[{"a": 0}]', schema=schema(min_items=2))
+    assert err.value.errors == [
+        {"loc": [], "err": "item count lower than 2 (minItems)"}
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 1 << 16])
+@pytest.mark.parametrize("binary", [False, True])
+def test_iter_deserialize(monkeypatch, chunk_size, binary):
+    monkeypatch.setattr(streaming, "CHUNK_SIZE", chunk_size)
+    data = ' [{"a": 12345, "b": "é€"}, {"a": 0} ,{"a":-1.5e3}] '
+    fp = io.BytesIO(data.encode()) if binary else io.StringIO(data)
+    assert list(iter_deserialize(B, fp)) == [B(12345, "é€"), B(0), B(-1500.0)]
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_iter_deserialize_lines(binary):
+    data = '{"a": 0}\n\n{"a": 1, "b": "é"}\n'
+    fp = io.BytesIO(data.encode()) if binary else io.StringIO(data)
+    assert list(iter_deserialize(B, fp, lines=True)) == [B(0), B(1, "é")]
+
+
+def test_iter_deserialize_error():
+    elts = iter_deserialize(A, io.StringIO('[{"a": 0}, {"a": ""}]'))
+    assert next(elts) == A(0)
+    with pytest.raises(ValidationError) as err:
+        next(elts)
+    assert err.value.errors == [
+        {"loc": [1, "a"], "err": "expected type integer, found string"}
+    ]
+
+
+@pytest.mark.parametrize(
+    "data", ["", "[", "[,]", '[{"a": 0},]', '[{"a": 0} {"a": 1}]', "[] []", "{}"]
+)
+def test_iter_deserialize_malformed(data):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_deserialize(A, io.StringIO(data)))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4])
+def test_iter_deserialize_truncated_values(monkeypatch, chunk_size):
+    monkeypatch.setattr(streaming, "CHUNK_SIZE", chunk_size)
+    data = '[1.5e-3, -12, true, null, "\\ud83d\\ude00", [false]]'
+    assert list(iter_deserialize(Any, io.StringIO(data))) == json.loads(data)
+
+
+def test_iter_deserialize_malformed_not_read_further(monkeypatch):
+    monkeypatch.setattr(streaming, "CHUNK_SIZE", 8)
+    fp = io.StringIO('[{"a": 0}, {"a": x}, ' + '{"a": 0}, ' * 1000 + "]")
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_deserialize(A, fp))
+    assert fp.tell() < 100
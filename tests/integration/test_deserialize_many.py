@@ -0,0 +1,97 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import pytest
+
+from apischema import (
+    ValidationError,
+    dependent_required,
+    deserialize,
+    deserialize_many,
+    schema,
+)
+from apischema.metadata import fall_back_on_default
+from apischema.typing import TypedDict
+
+
+@dataclass
+class Event:
+    id: int
+
+
+def test_deserialize_many_errors_by_index():
+    events, errors = deserialize_many(Event, iter([{"id": 0}, {}, {"id": "2"}]))
+    assert events == [Event(0), None, None]
+    assert list(errors) == [1, 2]
+    assert all(isinstance(err, ValidationError) for err in errors.values())
+    assert errors[1].errors == [{"loc": ["id"], "err": "missing property"}]
+
+
+def test_deserialize_many_empty():
+    assert deserialize_many(Event, []) == ([], {})
+
+
+def test_deserialize_many_options():
+    values, errors = deserialize_many(
+        List[int], [["0"], [0, 1]], coerce=True, schema=schema(max_items=1)
+    )
+    assert values == [[0], None]
+    assert list(errors) == [1]
+
+
+@dataclass
+class Item:
+    name: str
+    price: float
+    tags: List[str] = field(default_factory=list)
+    note: Optional[str] = field(default=None, metadata=fall_back_on_default)
+    discount: Optional[int] = field(default=None)
+    code: Optional[str] = field(default=None)
+
+    dependencies = dependent_required({discount: [code]})
+
+
+class Order(TypedDict, total=False):
+    a: int
+    b: int
+
+
+ROWS = [
+    {"name": "a", "price": 1},
+    {"name": "b", "price": 1.5, "tags": ["x"], "note": 0},
+    {"price": 1, "discount": 1},
+    {"name": "c", "price": "1"},
+    {"name": "d", "price": 1, "other": 0},
+    [],
+    {"name": "e", "price": 1, "discount": 1},
+    {"name": "f", "price": 1, "discount": 1, "code": "f"},
+    {"name": 0},
+]
+
+
+@pytest.mark.parametrize(
+    "tp, rows, additional_properties",
+    [
+        (Event, [{"id": 0}, {"id": 1, "name": ""}, {"id": True}, 0], False),
+        (Item, ROWS, False),
+        (Item, ROWS, True),
+        (Order, [{"b": 0, "a": 1}, {"b": 0, "c": 0}, {"a": "0"}], False),
+        (Order, [{"b": 0, "a": 1}, {"b": 0, "c": 0}, {"a": "0"}], True),
+    ],
+)
+def test_deserialize_many_as_deserialize(tp, rows, additional_properties):
+    values, errors = deserialize_many(
+        tp, rows, additional_properties=additional_properties
+    )
+    for i, row in enumerate(rows):
+        try:
+            expected = deserialize(tp, row, additional_properties=additional_properties)
+        except ValidationError as err:
+            assert values[i] is None
+            assert errors[i].errors == err.errors
+        else:
+            assert i not in errors
+            assert values[i] == expected
+            assert list(getattr(values[i], "__dict__", values[i])) == list(
+                getattr(expected, "__dict__", expected)
+            )
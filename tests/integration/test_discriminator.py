@@ -3,7 +3,15 @@ from typing import Annotated, Literal, Union
 
 import pytest
 
-from apischema import deserialize, discriminator, serialize
+from apischema import (
+    ValidationError,
+    cache,
+    deserialize,
+    discriminator,
+    serialize,
+    settings,
+)
+from apischema.discriminators import inferred_discriminators
 from apischema.json_schema import deserialization_schema
 from apischema.typing import TypedDict
 
@@ -55,3 +63,75 @@ def test_discriminator_literal_field(type_, obj):
     assert serialize(Annotated[Union[A, B], discriminator("type")], obj) == {
         "type": type_
     }
+
+
+@dataclass
+class Cat:
+    kind: Literal["cat", "pet"]
+    name: str
+
+
+@dataclass
+class Dog:
+    kind: Literal["dog", "pet"]
+    name: str
+    good: bool = True
+
+
+@dataclass
+class Fish:
+    kind: Literal["fish"]
+
+
+Animal = Union[Cat, Dog, Fish]
+
+
+@pytest.mark.parametrize(
+    "data, obj",
+    [
+        ({"kind": "dog", "name": "Rex"}, Dog("dog", "Rex")),
+        ({"kind": "pet", "name": "Rex", "good": False}, Dog("pet", "Rex", False)),
+        ({"kind": "pet", "name": "Tom"}, Cat("pet", "Tom")),
+        ({"kind": "fish"}, Fish("fish")),
+    ],
+)
+def test_inferred_discriminator(data, obj):
+    assert deserialize(Animal, data) == obj
+    assert inferred_discriminators()[Animal] == "kind"
+
+
+@pytest.mark.parametrize(
+    "data", [{"kind": "dog"}, {"kind": "bird"}, {"kind": ["cat"]}, {"name": ""}, 0]
+)
+def test_inferred_discriminator_errors(data, monkeypatch):
+    with pytest.raises(ValidationError) as err:
+        deserialize(Animal, data)
+    monkeypatch.setattr(settings.deserialization, "infer_discriminator", False)
+    with pytest.raises(ValidationError) as union_err:
+        deserialize(Animal, data)
+    assert err.value.errors == union_err.value.errors
+
+
+def test_inferred_discriminators_reset():
+    deserialize(Animal, {"kind": "fish"})
+    assert Animal in inferred_discriminators()
+    cache.reset()
+    assert Animal not in inferred_discriminators()
+
+
+@dataclass
+class IntKind:
+    kind: Literal[1]
+
+
+@dataclass
+class StrKind:
+    kind: Literal["1"]
+
+
+def test_no_inferred_discriminator_with_coercion():
+    cache.reset()
+    assert deserialize(Union[IntKind, StrKind], {"kind": "1"}, coerce=True) == IntKind(
+        1
+    )
+    assert Union[IntKind, StrKind] not in inferred_discriminators()
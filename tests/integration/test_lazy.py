@@ -0,0 +1,87 @@
+import copy
+import pickle
+from dataclasses import dataclass, field
+from typing import Optional
+
+import pytest
+
+from apischema import ValidationError, deserialize, validator
+from apischema.metadata import fall_back_on_default
+
+
+@dataclass(frozen=True)
+class Client:
+    id: int
+    name: str = ""
+
+
+@dataclass
+class Receipt:
+    store: str
+    client: Optional[Client] = None
+    total: float = field(default=0.0, metadata=fall_back_on_default)
+
+
+def test_lazy_nested_error_path():
+    receipt = deserialize(Receipt, {"store": "s", "client": {"id": "0"}}, lazy=True)
+    assert receipt.store == "s"
+    with pytest.raises(ValidationError) as err:
+        receipt.client.id
+    assert err.value.errors == [
+        {"loc": ["client", "id"], "err": "expected type integer, found string"}
+    ]
+
+
+def test_lazy_eager_checks():
+    with pytest.raises(ValidationError) as err:
+        deserialize(Receipt, {"client": None, "other": 0}, lazy=True)
+    assert err.value.errors == [
+        {"loc": ["other"], "err": "unexpected property"},
+        {"loc": ["store"], "err": "missing property"},
+    ]
+
+
+def test_lazy_fall_back_on_default():
+    receipt = deserialize(Receipt, {"store": "s", "total": "?"}, lazy=True)
+    assert receipt.total == 0.0
+
+
+def test_lazy_equality_and_pickling():
+    data = {"store": "s", "client": {"id": 0}}
+    receipt = deserialize(Receipt, data, lazy=True)
+    expected = Receipt("s", Client(0))
+    assert receipt == expected
+    assert pickle.loads(pickle.dumps(receipt)) == expected
+    assert type(pickle.loads(pickle.dumps(receipt))) is Receipt
+    assert copy.deepcopy(deserialize(Receipt, data, lazy=True)) == expected
+
+
+@dataclass
+class Validated:
+    a: int
+
+    @validator
+    def positive(self):
+        if self.a < 0:
+            raise ValidationError(["negative"])
+
+
+def test_lazy_unsupported_eager():
+    with pytest.raises(ValidationError):
+        deserialize(Validated, {"a": -1}, lazy=True)
+    assert type(deserialize(Validated, {"a": 0}, lazy=True)) is Validated
+
+
+@dataclass(init=False)
+class Initialized:
+    a: int
+
+    def __init__(self, a: int, factor: int = 2):
+        self.a = a
+        self.scaled = factor * a
+
+
+def test_lazy_custom_init_eager():
+    initialized = deserialize(Initialized, {"a": 1}, lazy=True)
+    assert type(initialized) is Initialized
+    assert initialized.scaled == 2
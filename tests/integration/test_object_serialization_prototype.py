@@ -0,0 +1,38 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+import pytest
+
+from apischema import alias, serialize, serialized
+
+
+@dataclass
+class Data:
+    a: int = field(metadata=alias("A"))
+    b: Optional[int] = None
+    c: str = ""
+
+    @serialized
+    def d(self) -> int:
+        return self.a
+
+
+@pytest.mark.parametrize(
+    "obj, exclude_none, expected",
+    [
+        (Data(0), False, {"A": 0, "b": None, "c": "", "d": 0}),
+        (Data(0, 1), True, {"A": 0, "b": 1, "c": "", "d": 0}),
+        (Data(0), True, {"A": 0, "c": "", "d": 0}),
+    ],
+)
+def test_object_serialization_keys_order(obj, exclude_none, expected):
+    result = serialize(Data, obj, exclude_none=exclude_none)
+    assert result == expected
+    assert list(result) == list(expected)
+
+
+def test_object_serialization_prototype_not_shared():
+    first = serialize(Data, Data(0))
+    first["A"] = 1
+    del first["c"]
+    assert serialize(Data, Data(0)) == {"A": 0, "b": None, "c": "", "d": 0}
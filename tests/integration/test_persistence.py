@@ -0,0 +1,129 @@
+import os
+import stat
+from dataclasses import dataclass, field
+from typing import List, NewType, Optional
+
+import pytest
+
+from apischema import (
+    ValidationError,
+    cache,
+    deserialize,
+    deserializer,
+    persistence,
+    schema,
+    serialize,
+    settings,
+)
+from apischema.conversions import Conversion
+from apischema.conversions.converters import reset_deserializers
+from apischema.deserialization import deserialization_method_factory
+from apischema.serialization import serialization_method_factory
+
+Positive = NewType("Positive", int)
+schema(min=0)(Positive)
+
+
+@dataclass
+class Item:
+    name: str
+    quantity: Positive = field(default=Positive(1))
+
+
+@dataclass
+class Tree:
+    value: int
+    children: List["Tree"] = field(default_factory=list)
+
+
+@dataclass
+class Wrapper:
+    item: Optional[Item] = None
+
+
+def compute_methods():
+    deserialize(Item, {"name": ""})
+    deserialize(Tree, {"value": 0})
+    deserialize(Wrapper, {})
+    serialize(Item, Item(""))
+    serialize(Wrapper, Wrapper())
+
+
+@pytest.fixture
+def saved(tmp_path):
+    path, fingerprint = str(tmp_path / "methods.pickle"), persistence.fingerprint()
+    cache.reset()
+    compute_methods()
+    assert persistence.save(path, fingerprint) > 0
+    cache.reset()
+    return path, fingerprint
+
+
+def cached_types(cached) -> set:
+    return {key[0] for key, _, _ in cached.entries()}
+
+
+def test_load(saved):
+    assert persistence.load(*saved) > 0
+    assert {Item, Positive, Wrapper} <= cached_types(deserialization_method_factory)
+    # recursive methods are not persisted
+    assert Tree not in cached_types(deserialization_method_factory)
+    (_, inner, _), *_ = serialization_method_factory.entries()
+    assert {Item, Wrapper} <= cached_types(inner)
+    compute_methods()
+    assert deserialize(Wrapper, {"item": {"name": "", "quantity": 2}}) == Wrapper(
+        Item("", Positive(2))
+    )
+    with pytest.raises(ValidationError):
+        deserialize(Item, {"name": "", "quantity": -1})
+    # merged constraints recompute the method
+    with pytest.raises(ValidationError):
+        deserialize(Positive, 1, schema=schema(max=0))
+
+
+def test_load_fingerprint_mismatch(saved):
+    path, _ = saved
+    assert persistence.load(path, "other") == 0
+    assert persistence.load(path + ".missing", "other") == 0
+
+
+def test_load_dependencies(saved):
+    persistence.load(*saved)
+    assert deserialize(Wrapper, {"item": {"name": ""}}) == Wrapper(Item(""))
+    deserializer(Conversion(lambda name: Item(name), source=str, target=Item))
+    try:
+        assert Wrapper not in cached_types(deserialization_method_factory)
+        assert deserialize(Wrapper, {"item": ""}) == Wrapper(Item(""))
+    finally:
+        reset_deserializers(Item)
+
+
+def test_load_untrusted(saved):
+    path, fingerprint = saved
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    os.chmod(path, 0o666)
+    with pytest.warns(UserWarning):
+        assert persistence.load(path, fingerprint) == 0
+    assert Item not in cached_types(deserialization_method_factory)
+
+
+# both named <lambda>
+upper_aliaser = lambda s: s.upper()  # noqa: E731
+lower_aliaser = lambda s: s.lower()  # noqa: E731
+
+
+def test_load_other_aliaser(tmp_path):
+    path, aliaser = str(tmp_path / "methods.pickle"), settings.aliaser
+    try:
+        settings.aliaser = upper_aliaser
+        fingerprint = persistence.fingerprint()
+        cache.reset()
+        assert serialize(Item, Item("")) == {"NAME": "", "QUANTITY": 1}
+        assert persistence.save(path, fingerprint) > 0
+        cache.reset()
+        settings.aliaser = lower_aliaser
+        assert persistence.fingerprint() != fingerprint
+        assert persistence.load(path, persistence.fingerprint()) == 0
+    finally:
+        settings.aliaser = aliaser
+        cache.reset()
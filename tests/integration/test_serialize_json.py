@@ -0,0 +1,137 @@
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+import pytest
+
+from apischema import aiter_serialize, iter_serialize, serialize, serialize_json
+from apischema.serialization import PassThroughOptions, streaming
+
+
+@dataclass
+class A:
+    a: int
+    b: Optional[str] = None
+
+
+@pytest.mark.parametrize(
+    "tp, obj",
+    [
+        (List[A], []),
+        (List[A], [A(0), A(1, "é")]),
+        (List[int], [0, 1]),
+        (A, A(0)),
+        (Dict[str, List[A]], {"key": [A(0)]}),
+        (Any, [A(0)]),
+    ],
+)
+def test_serialize_json(tp, obj):
+    assert json.loads(serialize_json(tp, obj)) == serialize(tp, obj)
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(streaming, "dumps", streaming.json_dumps)
+
+
+def dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+NOT_NATIVE_JSON = [
+    (Dict[int, str], {1: "a"}),
+    (Dict[Optional[float], int], {None: 0, 1.5: 1, float("nan"): 2}),
+    (int, 2**70),
+    (List[float], [0.5, float("nan"), float("inf"), -float("inf")]),
+    (Dict[str, Any], {"a": None, "b": [2**64, float("nan")]}),
+]
+
+
+@pytest.mark.parametrize("tp, obj", NOT_NATIVE_JSON)
+def test_serialize_json_backends(json_backend, tp, obj):
+    assert serialize_json(tp, obj) == dumps(serialize(tp, obj))
+    assert serialize_json(List[tp], [obj]) == dumps([serialize(tp, obj)])
+
+
+class Color(Enum):
+    RED = "red"
+
+
+PASSED_THROUGH = [
+    (datetime(2020, 1, 2, 3, 4, 5, 6), b'"2020-01-02T03:04:05.000006"'),
+    (
+        datetime(2020, 1, 2, tzinfo=timezone(timedelta(hours=2))),
+        b'"2020-01-02T00:00:00+02:00"',
+    ),
+    (date(2020, 1, 2), b'"2020-01-02"'),
+    (time(1, 2, 3), b'"01:02:03"'),
+    (UUID(int=1), b'"00000000-0000-0000-0000-000000000001"'),
+    (Color.RED, b'"red"'),
+    (A(0, "é"), '{"a":0,"b":"é"}'.encode()),
+    (
+        {UUID(int=1): [date(2020, 1, 2)]},
+        b'{"00000000-0000-0000-0000-000000000001":["2020-01-02"]}',
+    ),
+]
+
+
+@pytest.mark.parametrize("obj, expected", PASSED_THROUGH)
+def test_serialize_json_pass_through_backends(json_backend, obj, expected):
+    pass_through = PassThroughOptions(any=True, dataclasses=True, enums=True)
+    assert serialize_json(Any, obj, pass_through=pass_through) == expected
+
+
+@pytest.mark.parametrize("lines", [False, True])
+@pytest.mark.parametrize("objs", [[], [A(0)], [A(0), A(1, "é")]])
+def test_iter_serialize(objs, lines):
+    assert list(iter_serialize(A, iter(objs))) == serialize(List[A], objs)
+    chunks = list(iter_serialize(A, iter(objs), encode=True, lines=lines))
+    if lines:
+        assert len(chunks) == len(objs)
+        assert list(map(json.loads, chunks)) == serialize(List[A], objs)
+    else:
+        assert len(chunks) == len(objs) + 1
+        assert json.loads(b"".join(chunks)) == serialize(List[A], objs)
+
+
+async def _aiter(objs):
+    for obj in objs:
+        yield obj
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("lines", [False, True])
+@pytest.mark.parametrize("objs", [[], [A(0), A(1, "é")]])
+async def test_aiter_serialize(objs, lines):
+    values = [v async for v in aiter_serialize(A, _aiter(objs))]
+    assert values == serialize(List[A], objs)
+    chunks = [
+        c async for c in aiter_serialize(A, _aiter(objs), encode=True, lines=lines)
+    ]
+    assert chunks == list(iter_serialize(A, objs, encode=True, lines=lines))
+
+
+@pytest.mark.parametrize("tp, obj", NOT_NATIVE_JSON)
+def test_iter_serialize_backends(json_backend, tp, obj):
+    chunks = list(iter_serialize(tp, [obj, obj], encode=True))
+    assert b"".join(chunks) == dumps([serialize(tp, obj)] * 2)
+    lines = list(iter_serialize(tp, [obj], encode=True, lines=True))
+    assert lines == [dumps(serialize(tp, obj)) + b"\n"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("lines", [False, True])
+@pytest.mark.parametrize("tp, obj", NOT_NATIVE_JSON)
+async def test_aiter_serialize_backends(json_backend, tp, obj, lines):
+    chunks = [
+        c async for c in aiter_serialize(tp, _aiter([obj]), encode=True, lines=lines)
+    ]
+    assert chunks == list(iter_serialize(tp, [obj], encode=True, lines=lines))
+    if not lines:
+        assert b"".join(chunks) == dumps([serialize(tp, obj)])
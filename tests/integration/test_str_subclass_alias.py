@@ -0,0 +1,32 @@
+from dataclasses import dataclass, field
+from enum import Enum
+
+import pytest
+
+from apischema import alias, deserialize, serialize, serialized, settings
+from apischema.serialization import methods
+
+
+class Key(str, Enum):
+    a = "a"
+    b = "b"
+
+
+@dataclass
+class Data:
+    a: int = field(metadata=alias(Key.a))
+
+    @serialized(alias=Key.b)
+    def b(self) -> int:
+        return self.a
+
+
+@pytest.mark.skipif(
+    not methods.__file__.endswith(".py"), reason="compiled fields aliases are str"
+)
+@pytest.mark.parametrize("codegen", [False, True])
+def test_str_subclass_alias(monkeypatch, codegen):
+    monkeypatch.setattr(settings.deserialization, "codegen", codegen)
+    monkeypatch.setattr(settings.serialization, "codegen", codegen)
+    assert serialize(Data, Data(1)) == {Key.a: 1, Key.b: 1}
+    assert deserialize(Data, {"a": 1}) == Data(1)
@@ -0,0 +1,113 @@
+from abc import ABC
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Union
+
+import pytest
+from typing_extensions import Annotated
+
+from apischema import discriminator, serialization_method
+from apischema.serialization.errors import TypeCheckError
+from apischema.serialization.methods import TypeDispatchUnionMethod, UnionMethod
+from apischema.utils import TYPE_DISPATCH_MEMO_SIZE
+
+
+@dataclass
+class A:
+    a: int
+
+
+@dataclass
+class B:
+    b: int
+
+
+@dataclass
+class BC(B):
+    c: int = 0
+
+
+def test_type_dispatch():
+    method = serialization_method(Union[A, B, int])
+    dispatch = method.__self__
+    assert isinstance(dispatch, TypeDispatchUnionMethod)
+    assert method(B(0)) == {"b": 0} and method(0) == 0
+    # subclasses are memoized at their first instance
+    assert method(BC(0, 1)) == {"b": 0}
+    assert [alt.cls for alt in dispatch.alternatives_by_type[BC]] == [B]
+    # unmatched types go to the fallback
+    with pytest.raises(TypeCheckError):
+        method("")
+    assert dispatch.alternatives_by_type[str] == ()
+
+
+def test_type_dispatch_keeps_declaration_order():
+    method = serialization_method(Union[BC, B], check_type=True)
+    assert method(BC(0, 1)) == {"b": 0, "c": 1}
+    assert method(B(0)) == {"b": 0}
+
+
+def test_discriminated_type_dispatch():
+    method = serialization_method(Annotated[Union[A, B], discriminator("type")])
+    assert isinstance(method.__self__, TypeDispatchUnionMethod)
+    assert method(B(0)) == {"type": "B", "b": 0}
+
+
+class Proxy:
+    def __init__(self, wrapped: Any):
+        self.wrapped = wrapped
+
+    @property  # type: ignore
+    def __class__(self) -> type:
+        return type(self.wrapped)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.wrapped, name)
+
+
+def test_proxy_not_dispatched_on_type():
+    method = serialization_method(Union[A, B])
+    assert method(Proxy(A(1))) == {"a": 1}
+    assert method(Proxy(B(2))) == {"b": 2}
+
+
+class Meta(type):
+    def __instancecheck__(self, instance: Any) -> bool:
+        return instance == 0
+
+
+@dataclass
+class Zero(metaclass=Meta):
+    pass
+
+
+def test_custom_instance_check_not_dispatched():
+    method = serialization_method(Union[Zero, Mapping[str, int], str])
+    assert isinstance(method.__self__, UnionMethod)
+    assert method(0) == {} and method({"a": 0}) == {"a": 0}
+
+
+@dataclass
+class Registrable(ABC):
+    pass
+
+
+def test_abc_not_dispatched_on_type():
+    method = serialization_method(Union[Registrable, int])
+    assert isinstance(method.__self__, UnionMethod)
+
+    class Registered:
+        pass
+
+    with pytest.raises(TypeCheckError):
+        method(Registered())
+    Registrable.register(Registered)
+    assert method(Registered()) == {}
+
+
+def test_type_dispatch_memo_bounded():
+    dispatch = serialization_method(Union[A, B]).__self__
+    for i in range(2 * TYPE_DISPATCH_MEMO_SIZE):
+        sub_cls = type(f"A{i}", (A,), {})
+        assert dispatch.serialize(sub_cls(i)) == {"a": i}
+        assert len(dispatch.alternatives_by_type) <= TYPE_DISPATCH_MEMO_SIZE
@@ -0,0 +1,113 @@
+from dataclasses import dataclass, field
+from typing import FrozenSet, List, Optional, Set
+
+import pytest
+
+from apischema import (
+    ValidationError,
+    deserialize,
+    deserializer,
+    schema,
+    validation_method,
+    validator,
+)
+from apischema.conversions import Conversion
+from apischema.validation.mock import ValidatorMock
+
+validated_types = []
+
+
+@dataclass
+class Item:
+    name: str
+    price: float = field(metadata=schema(min=0))
+
+    @validator
+    def not_free(self):
+        validated_types.append(type(self))
+        if self.price == 0:
+            yield "free item"
+
+
+@dataclass
+class Initialized:
+    value: int
+
+    def __post_init__(self):
+        self.double = 2 * self.value
+
+    @validator
+    def positive(self):
+        validated_types.append(type(self))
+        if self.double < self.value:
+            yield "negative"
+
+
+@dataclass
+class Wrapper:
+    item: Item
+
+
+deserializer(Conversion(Wrapper, source=Item, target=Wrapper))
+
+
+@dataclass
+class Receipt:
+    items: List[Item]
+    initialized: Optional[Initialized] = None
+    wrapper: Optional[Wrapper] = None
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"items": [{"name": "a", "price": 0}, {"name": "b", "price": -1}]},
+        {"items": [], "initialized": {"value": -1}, "other": 0},
+        {"items": [{}], "wrapper": {"name": "a", "price": "0"}},
+    ],
+)
+def test_validation_method_errors(data):
+    with pytest.raises(ValidationError) as err:
+        deserialize(Receipt, data)
+    with pytest.raises(ValidationError) as validation_err:
+        validation_method(Receipt)(data)
+    assert validation_err.value.errors == err.value.errors
+
+
+def test_validation_method_instantiation():
+    data = {
+        "items": [{"name": "a", "price": 1}],
+        "initialized": {"value": 1},
+        "wrapper": {"name": "b", "price": 1},
+    }
+    validated_types.clear()
+    assert validation_method(Receipt)(data) is None
+    # Wrapper converter requires an actual Item
+    assert validated_types == [ValidatorMock, Initialized, Item]
+
+
+@dataclass(frozen=True)
+class Point:
+    x: int
+
+
+@pytest.mark.parametrize("tp", [Set[Point], FrozenSet[Point]])
+def test_validation_method_hashed_objects(tp):
+    # hashed objects are instantiated
+    assert validation_method(tp)([{"x": 0}, {"x": 1}]) is None
+    with pytest.raises(ValidationError):
+        validation_method(tp)([{"x": ""}])
+
+
+@dataclass(frozen=True)
+class Node:
+    value: int
+    children: FrozenSet["Node"] = frozenset()
+
+
+def test_validation_method_recursive_hashed_objects():
+    # the same recursive type is mocked at the root but instantiated in the set
+    data = {"value": 1, "children": [{"value": 2}, {"value": 2}]}
+    assert validation_method(Node)(data) is None
+    with pytest.raises(ValidationError):
+        validation_method(Node)({"value": 1, "children": [{"value": ""}]})
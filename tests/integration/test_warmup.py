@@ -0,0 +1,63 @@
+import gc
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import pytest
+
+from apischema import cache, precompute_and_freeze, warmup
+from apischema.deserialization import deserialization_method_factory
+from apischema.deserialization.methods import RecMethod as DeserializationRecMethod
+from apischema.recursion import add_rec_method
+from apischema.serialization.methods import RecMethod as SerializationRecMethod
+
+
+@dataclass
+class Node:
+    value: int
+    children: List["Node"] = field(default_factory=list)
+
+
+@dataclass
+class Tree:
+    root: Optional[Node] = None
+
+
+def test_warmup():
+    cache.reset()
+    times = warmup([Tree, Node], exclude_unset=False, coerce=True)
+    assert list(times) == [Tree, Node]
+    assert all(isinstance(t, float) for t in times.values())
+    assert {Tree, Node} <= {
+        key[0] for key, _, _ in deserialization_method_factory.entries()
+    }
+
+
+def test_warmup_rec_methods_resolved(monkeypatch):
+    created = []
+
+    def spy(method):
+        created.append(method)
+        return add_rec_method(method)
+
+    monkeypatch.setattr("apischema.deserialization.add_rec_method", spy)
+    monkeypatch.setattr("apischema.serialization.add_rec_method", spy)
+    cache.reset()
+    warmup([Tree], json_schema=True)
+    assert {type(m) for m in created} == {
+        DeserializationRecMethod,
+        SerializationRecMethod,
+    }
+    assert all(m.method is not None for m in created)
+
+
+def test_warmup_unexpected_options():
+    with pytest.raises(TypeError):
+        warmup([Tree], unknown=True)
+
+
+def test_precompute_and_freeze():
+    try:
+        assert list(precompute_and_freeze([Tree])) == [Tree]
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
@@ -0,0 +1,156 @@
+import threading
+import time
+from dataclasses import dataclass
+
+import pytest
+
+from apischema import cache, deserialization_method, deserialize, deserializer
+from apischema.cache import Cache, CacheStats
+from apischema.conversions import Conversion
+from apischema.conversions.converters import reset_deserializers
+from apischema.deserialization import deserialization_method_factory
+
+
+@pytest.fixture
+def cached():
+    calls = []
+
+    def func(arg, kwarg=None):
+        calls.append((arg, kwarg))
+        return arg
+
+    cached = Cache(func, 2)
+    cached.calls = calls
+    return cached
+
+
+def test_cache_hits_misses(cached):
+    assert cached(0) == cached(0) == 0
+    assert cached(0, kwarg=1) == 0
+    assert cached.calls == [(0, None), (0, 1)]
+    info = cached.cache_info()
+    assert (info.hits, info.misses, info.evictions) == (1, 2, 0)
+    assert (info.currsize, info.maxsize) == (2, 2)
+    assert info.build_times.keys() == {(0,), (0, cache.KWARGS_MARK, ("kwarg", 1))}
+
+
+def test_cache_lru_eviction(cached):
+    cached(0), cached(1), cached(0), cached(2)
+    assert cached.cache_info().evictions == 1
+    assert (0,) in cached.cache_info().build_times
+    cached(1)
+    assert cached.calls == [(0, None), (1, None), (2, None), (1, None)]
+    cached.set_size(1)
+    assert cached.cache_info().currsize == 1
+    assert cached.cache_info().evictions == 3
+
+
+def test_cache_wrapper(cached):
+    wrapper = cached.wrapper()
+    assert wrapper(0) == wrapper(0) == 0
+    wrapper(1), wrapper(0), wrapper(2)
+    assert wrapper(2, kwarg=1) == wrapper(2, kwarg=1) == 2
+    assert cached.calls == [(0, None), (1, None), (2, None), (2, 1)]
+    assert [key for key, _, _ in wrapper.entries()] == [
+        (2,),
+        (2, cache.KWARGS_MARK, ("kwarg", 1)),
+    ]
+    info = wrapper.cache_info()
+    assert (info.hits, info.misses, info.evictions) == (3, 4, 2)
+    assert wrapper.__wrapped__.__name__ == "func"
+
+
+def test_cache_clear(cached):
+    cached(0)
+    cached.cache_clear()
+    cached(0)
+    assert cached.cache_info() == CacheStats(
+        0, 2, 0, 1, 2, cached.cache_info().build_times
+    )
+
+
+def test_stats():
+    cache.reset()
+    deserialize(int, 0)
+    deserialize(int, 0)
+    stats = cache.stats()["apischema.deserialization.deserialization_method_factory"]
+    assert stats.currsize == 1
+    assert stats.hits >= 1
+
+
+class Dependency:
+    pass
+
+
+class Other:
+    pass
+
+
+def test_invalidation():
+    @dataclass
+    class A:
+        dep: Dependency
+
+    @dataclass
+    class B:
+        other: Other
+
+    deserializer(Conversion(lambda s: Other(), source=str, target=Other))
+    deserializer(Conversion(lambda s: Dependency(), source=str, target=Dependency))
+    try:
+        method_a, method_b = deserialization_method(A), deserialization_method(B)
+        assert deserialization_method(A) == method_a
+        cached = deserialization_method_factory.cache_info().build_times
+        assert any(A in key for key in cached) and any(B in key for key in cached)
+        deserializer(Conversion(lambda i: Dependency(), source=int, target=Dependency))
+        cached = deserialization_method_factory.cache_info().build_times
+        assert not any(A in key for key in cached)
+        assert any(B in key for key in cached)
+        assert deserialization_method(B) == method_b
+        assert isinstance(deserialize(A, {"dep": 0}).dep, Dependency)
+    finally:
+        reset_deserializers(Dependency)
+        reset_deserializers(Other)
+
+
+def test_single_flight():
+    calls = []
+
+    def func(arg):
+        calls.append(arg)
+        time.sleep(0.05)
+        return object()
+
+    cached, results = Cache(func, None), []
+    threads = [
+        threading.Thread(target=lambda: results.append(cached(0))) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert calls == [0]
+    assert len(results) == 8 and all(res is results[0] for res in results)
+    info = cached.cache_info()
+    assert (info.hits, info.misses) == (7, 1)
+
+
+def test_single_flight_wait_cycle():
+    barrier, local = threading.Barrier(2), threading.local()
+
+    def func(arg):
+        # build the other entry while the other thread builds it
+        if not getattr(local, "nested", False):
+            local.nested = True
+            barrier.wait(timeout=5)
+            cached({"a": "b", "b": "a"}[arg])
+        return arg
+
+    cached = Cache(func, None)
+    threads = [threading.Thread(target=cached, args=(arg,)) for arg in "ab"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+    assert cached.cache_info().currsize == 2
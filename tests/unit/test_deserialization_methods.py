@@ -1,4 +1,32 @@
-from apischema.deserialization.methods import to_hashable
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field, make_dataclass
+from typing import Any, List, Mapping, NewType, Optional, Union
+
+import pytest
+
+from apischema import (
+    ValidationError,
+    deserialization_method,
+    deserialize,
+    schema,
+    settings,
+)
+from apischema.constraints import Constraints
+from apischema.deserialization import KEY_SET_TREE_NODES, constraints_validators
+from apischema.deserialization.methods import (
+    IntMethod,
+    KeySetNode,
+    KeySetUnionMethod,
+    RecMethod,
+    StrMethod,
+    UnionMethod,
+    to_hashable,
+)
+from apischema.metadata import fall_back_on_default, properties
+from apischema.typing import TypedDict
 
 
 def test_to_hashable():
@@ -6,3 +34,212 @@ def test_to_hashable():
     hashable2 = to_hashable({"key2": [1, 2], "key1": 0})
     assert hashable1 == hashable2
     assert hash(hashable1) == hash(hashable2)
+
+
+def test_rec_method_resolved_once():
+    calls = []
+
+    def lazy():
+        calls.append(None)
+        time.sleep(0.05)
+        return IntMethod()
+
+    method = RecMethod(lazy)
+    threads = [threading.Thread(target=method.deserialize, args=(0,)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize(
+    "constraints, cls, valid, invalid",
+    [
+        (Constraints(min=0), float, [0, 1, 2.5], [1, -0.5]),
+        (Constraints(max=0), float, [0, -1, -2.5], [-1, 0.5]),
+        (Constraints(exc_min=0), float, [1, 0.5], [1, 0]),
+        (Constraints(exc_max=0), float, [-1, -0.5], [-1, 0]),
+        (Constraints(mult_of=2), int, [0, 2, 4], [2, 3]),
+        (Constraints(min_len=1), str, ["a", "ab"], ["a", ""]),
+        (Constraints(max_len=1), str, ["", "a"], ["a", "ab"]),
+        (Constraints(pattern=re.compile("^a")), str, ["a", "ab"], ["a", "b"]),
+    ],
+)
+def test_validate_many(constraints, cls, valid, invalid):
+    (constraint,) = constraints_validators(constraints)[cls]
+    assert constraint.validate_many([])
+    assert constraint.validate_many(valid)
+    assert not constraint.validate_many(invalid)
+
+
+PositiveFloat = NewType("PositiveFloat", float)
+schema(min=0)(PositiveFloat)
+
+
+def test_primitive_list_nan():
+    with pytest.raises(ValidationError) as err:
+        deserialize(List[PositiveFloat], [1, float("nan")])
+    assert err.value.errors == [{"loc": [1], "err": "less than 0 (minimum)"}]
+
+
+@dataclass
+class Wide:
+    a: int
+    b: Optional[int] = None
+    c: Optional[int] = None
+    d: int = 0
+    e: int = field(default=0, metadata=fall_back_on_default)
+
+
+@dataclass
+class SimpleWide:
+    a: int
+    b: Optional[int] = None
+    c: Optional[int] = None
+    d: int = 0
+    e: int = 0
+
+
+@pytest.mark.parametrize("cls", [Wide, SimpleWide])
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ({"a": 0, "c": 1}, {"a": 0, "c": 1}),
+        (
+            {"d": ""},
+            [
+                (["a"], "missing property"),
+                (["d"], "expected type integer, found string"),
+            ],
+        ),
+        ({"a": 0, "z": 0}, [(["z"], "unexpected property")]),
+    ],
+)
+def test_sparse_object(cls, data, expected):
+    # data with fewer keys than fields are deserialized by iterating their keys
+    if isinstance(expected, dict):
+        assert deserialize(cls, data) == cls(**expected)
+    else:
+        with pytest.raises(ValidationError) as err:
+            deserialize(cls, data)
+        assert [(e["loc"], e["err"]) for e in err.value.errors] == expected
+
+
+def test_sparse_object_fall_back_on_default():
+    assert deserialize(Wide, {"a": 0, "e": ""}) == Wide(0)
+
+
+class WideTypedDict(TypedDict, total=False):
+    a: int
+    b: int
+    c: List[int]
+
+
+def test_sparse_typed_dict_keys_order():
+    assert list(deserialize(WideTypedDict, {"c": [], "a": 0})) == ["a", "c"]
+
+
+@dataclass
+class Point:
+    x: int
+    y: int = 0
+
+
+@dataclass
+class Point3D:
+    x: int
+    y: int
+    z: int
+
+
+@dataclass
+class Label:
+    text: str
+    x: int = 0
+
+
+Shape = Union[Point, Point3D, Label]
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ({"x": 0}, Point(0)),
+        ({"x": 0, "y": 1}, Point(0, 1)),
+        ({"x": 0, "y": 1, "z": 2}, Point3D(0, 1, 2)),
+        ({"text": "", "x": 1}, Label("", 1)),
+    ],
+)
+def test_key_set_union(data, expected):
+    method = deserialization_method(Shape)
+    assert isinstance(method.__self__, KeySetUnionMethod)
+    assert method(data) == expected
+
+
+@pytest.mark.parametrize(
+    "data", [{"x": ""}, {"x": 0, "z": 0}, {"text": 0}, {"x": 0, "other": 0}, {}, 0]
+)
+def test_key_set_union_errors(data):
+    method = deserialization_method(Shape).__self__
+    with pytest.raises(ValidationError) as err:
+        method.deserialize(data)
+    with pytest.raises(ValidationError) as union_err:
+        method.union_method.deserialize(data)
+    assert err.value.errors == union_err.value.errors
+
+
+def test_key_set_union_setting(monkeypatch):
+    monkeypatch.setattr(settings.deserialization, "key_set_dispatch", False)
+    assert not isinstance(deserialization_method(Shape).__self__, KeySetUnionMethod)
+
+
+@dataclass
+class AnyPoint:
+    others: Mapping[str, Any] = field(default_factory=dict, metadata=properties)
+
+
+def test_key_set_union_coercer():
+    def coercer(cls, data):
+        # complete missing z, so Point3D must not be eliminated by the absence of z
+        return {"z": 0, **data} if cls is dict else data
+
+    data = {"x": 0, "y": 1}
+    assert deserialize(
+        Union[Point3D, Point, AnyPoint], data, coerce=coercer
+    ) == Point3D(0, 1, 0)
+
+
+def tree_size(node: Optional[KeySetNode]) -> int:
+    return 0 if node is None else 1 + tree_size(node.present) + tree_size(node.absent)
+
+
+@pytest.mark.parametrize("required", [False, True])
+def test_key_set_tree_bounded(required):
+    # overlapping optional fields used to make the tree grow exponentially
+    rand = random.Random(0)
+    names = [f"f{i}" for i in range(60)]
+    classes = [
+        make_dataclass(
+            f"C{i}",
+            [(f"r{i}", int)] * required
+            + [(name, int, field(default=0)) for name in rand.sample(names, 20)],
+        )
+        for i in range(20)
+    ]
+    method = deserialization_method(Union[tuple(classes)]).__self__
+    if isinstance(method, KeySetUnionMethod):
+        assert tree_size(method.tree) <= KEY_SET_TREE_NODES * len(classes)
+    assert method.deserialize({"r5": 0} if required else {})
+
+
+def test_union_errors_merged_in_order():
+    method = UnionMethod((IntMethod(), StrMethod(), IntMethod()))
+    assert method.deserialize("") == ""
+    with pytest.raises(ValidationError) as err:
+        method.deserialize(None)
+    assert err.value.messages == [
+        "expected type integer, found null",
+        "expected type string, found null",
+        "expected type integer, found null",
+    ]
@@ -1,6 +1,8 @@
 import collections.abc
+import gc
 import sys
 from collections import defaultdict
+from dataclasses import FrozenInstanceError, dataclass, field
 from functools import lru_cache, wraps
 from itertools import repeat
 from typing import (
@@ -19,7 +21,14 @@ from typing import (
 import pytest
 
 from apischema.typing import Annotated, typing_origin
-from apischema.utils import is_async, replace_builtins, to_camel_case, type_dict_wrapper
+from apischema.utils import (
+    is_async,
+    replace_builtins,
+    subclasses,
+    to_camel_case,
+    type_dict_wrapper,
+    with_slots,
+)
 
 
 def test_to_camel_case():
@@ -164,3 +173,57 @@ def test_type_dict_wrapper(wrapped):
         (C, [C]),
         (D, [D]),
     ]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="slots are not added")
+def test_with_slots():
+    @with_slots
+    class Base:
+        def get(self):
+            return 0
+
+    @with_slots
+    @dataclass
+    class A(Base):
+        a: int
+        b: int = 0
+        c: int = field(init=False)
+
+        def __post_init__(self):
+            self.c = self.a + self.b
+
+        def get(self):
+            return super().get() + self.c
+
+    @with_slots
+    @dataclass(frozen=True)
+    class B:
+        a: int
+
+    assert A.__slots__ == ("a", "b", "c")
+    assert not hasattr(A(1), "__dict__")
+    assert A(1) == A(1, 0)
+    assert A(1, 2).get() == 3
+    with pytest.raises(AttributeError):
+        A(1).d = 0
+    with pytest.raises(FrozenInstanceError):
+        B(0).a = 1
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="slots are not added")
+def test_subclasses_without_replaced_classes():
+    gc.disable()
+    try:
+
+        @with_slots
+        class Base:
+            pass
+
+        @with_slots
+        class Sub(Base):
+            pass
+
+        assert len(Base.__subclasses__()) == 2
+        assert subclasses(Base) == [Sub]
+    finally:
+        gc.enable()